@@ -13,7 +13,10 @@ import uvicorn
 from fastapi import FastAPI, HTTPException
 
 from src.api.controller import ControladorPredicao
+from src.api.feature_store_controller import ControladorFeatureStore
 from src.api.monitoring_controller import ControladorMonitoramento
+from src.infrastructure.data.historical_repository import RepositorioHistorico
+from src.infrastructure.logging.prediction_logger import LoggerPredicao
 from src.infrastructure.model.model_manager import GerenciadorModelo
 from src.util.logger import logger
 
@@ -32,12 +35,28 @@ async def evento_inicializacao():
     Responsabilidades:
     - Registrar log de inicialização
     - Carregar o modelo na memória
+    - Carregar a Feature Store e preparar o log de predições
+    - Monitorar alterações nos dados da Feature Store
 
     Retorno:
     - None: não retorna valor
     """
     logger.info("Inicializando recursos da API...")
     GerenciadorModelo().carregar_modelo()
+    RepositorioHistorico()
+    LoggerPredicao().preparar()
+    RepositorioHistorico.iniciar_monitoramento()
+
+
+@app.on_event("shutdown")
+async def evento_encerramento():
+    """
+    Libera recursos em segundo plano no encerramento.
+
+    Retorno:
+    - None: não retorna valor
+    """
+    RepositorioHistorico.parar_monitoramento()
 
 
 controlador_predicao = ControladorPredicao()
@@ -46,6 +65,9 @@ app.include_router(controlador_predicao.roteador, prefix="/api/v1", tags=["Predi
 controlador_monitoramento = ControladorMonitoramento()
 app.include_router(controlador_monitoramento.roteador, prefix="/api/v1/monitoring", tags=["Observabilidade"])
 
+controlador_feature_store = ControladorFeatureStore()
+app.include_router(controlador_feature_store.roteador, prefix="/api/v1/feature-store", tags=["Feature Store"])
+
 
 @app.get("/health", tags=["Infraestrutura"])
 def checar_saude():
@@ -62,6 +84,29 @@ def checar_saude():
         raise HTTPException(status_code=503, detail=str(erro))
 
 
+@app.get("/ready", tags=["Infraestrutura"])
+def checar_prontidao():
+    """
+    Endpoint de readiness: informa se cada recurso já foi inicializado.
+
+    Não dispara carregamentos; apenas consulta o estado atual.
+
+    Retorno:
+    - dict: status geral e de cada componente
+
+    Exceções:
+    - HTTPException: 503 quando algum componente ainda não está pronto
+    """
+    componentes = {
+        "model": GerenciadorModelo().modelo_carregado(),
+        "feature_store": RepositorioHistorico.inicializado(),
+        "prediction_logger": LoggerPredicao().esta_pronto(),
+    }
+    if not all(componentes.values()):
+        raise HTTPException(status_code=503, detail={"status": "starting", "components": componentes})
+    return {"status": "ready", "components": componentes}
+
+
 if __name__ == "__main__":
     porta = int(os.getenv("PORT", 8000))
     uvicorn.run(app, host="0.0.0.0", port=porta)
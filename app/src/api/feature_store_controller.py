@@ -0,0 +1,115 @@
+"""
+Controlador da Feature Store histórica.
+
+Responsabilidades:
+- Expor a recarga do índice histórico sem reiniciar a API
+- Receber registros novos para atualização incremental
+- Informar a versão publicada da Feature Store
+"""
+
+from typing import Any, Dict, List
+
+import pandas as pd
+from fastapi import APIRouter, Body, Depends, HTTPException
+
+from src.infrastructure.data.historical_repository import RepositorioHistorico
+
+
+def obter_repositorio_historico():
+    """
+    Dependência para obter o repositório histórico.
+
+    Retorno:
+    - RepositorioHistorico: instância singleton
+    """
+    return RepositorioHistorico()
+
+
+class ControladorFeatureStore:
+    """
+    Controlador para operações da Feature Store.
+
+    Responsabilidades:
+    - Registrar rotas de recarga, atualização incremental e status
+    """
+
+    def __init__(self):
+        """
+        Inicializa o controlador.
+
+        Responsabilidades:
+        - Criar o roteador
+        - Registrar as rotas de recarga, atualização incremental e status
+        """
+        self.roteador = APIRouter()
+        self.roteador.add_api_route(
+            "/reload",
+            self._recarregar,
+            methods=["POST"],
+            status_code=202,
+            response_model=dict,
+            summary="Recarrega a Feature Store em segundo plano",
+        )
+        self.roteador.add_api_route(
+            "/records",
+            self._atualizar_registros,
+            methods=["POST"],
+            response_model=dict,
+            summary="Insere ou atualiza registros históricos sem recarga completa",
+        )
+        self.roteador.add_api_route(
+            "/status",
+            self._obter_status,
+            methods=["GET"],
+            response_model=dict,
+        )
+
+    @staticmethod
+    async def _recarregar(repositorio: RepositorioHistorico = Depends(obter_repositorio_historico)):
+        """
+        Dispara a recarga do índice histórico.
+
+        Parâmetros:
+        - repositorio (RepositorioHistorico): repositório injetado
+
+        Retorno:
+        - dict: indica se a recarga foi iniciada
+        """
+        iniciada = repositorio.recarregar(forcar=True)
+        return {"status": "reloading" if iniciada else "already_reloading"}
+
+    @staticmethod
+    def _atualizar_registros(
+        registros: List[Dict[str, Any]] = Body(...),
+        repositorio: RepositorioHistorico = Depends(obter_repositorio_historico),
+    ):
+        """
+        Incorpora registros novos ou alterados à Feature Store.
+
+        Parâmetros:
+        - registros (list[dict]): registros com RA, ANO_REFERENCIA e métricas
+        - repositorio (RepositorioHistorico): repositório injetado
+
+        Retorno:
+        - dict: relatório de linhas e alunos afetados
+
+        Exceções:
+        - HTTPException: 400 quando faltam colunas obrigatórias
+        """
+        try:
+            return repositorio.atualizar_registros(pd.DataFrame(registros))
+        except ValueError as erro:
+            raise HTTPException(status_code=400, detail=str(erro))
+
+    @staticmethod
+    async def _obter_status(repositorio: RepositorioHistorico = Depends(obter_repositorio_historico)):
+        """
+        Retorna o estado da versão publicada.
+
+        Parâmetros:
+        - repositorio (RepositorioHistorico): repositório injetado
+
+        Retorno:
+        - dict: estado da Feature Store
+        """
+        return repositorio.status()
@@ -5,15 +5,17 @@ Responsabilidades:
 - Calcular tempo na ONG
 - Garantir colunas obrigatórias
 - Normalizar tipos numéricos e categóricos
+- Processar fluxos de dados em lotes
 """
 
 from datetime import datetime
 import re
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterable, Iterator
 
 import pandas as pd
 
 from src.config.settings import Configuracoes
+from src.util.logger import logger
 
 
 class ProcessadorFeatures:
@@ -24,6 +26,7 @@ class ProcessadorFeatures:
     - Aplicar regras de cálculo de tempo na ONG
     - Preencher colunas ausentes
     - Normalizar tipos de dados
+    - Processar lotes com estatísticas congeladas
     """
 
     @staticmethod
@@ -56,6 +59,87 @@ class ProcessadorFeatures:
 
         return dados_processados
 
+    @staticmethod
+    def processar_em_lotes(
+        lotes: Iterable[pd.DataFrame],
+        data_snapshot: Optional[datetime] = None,
+        estatisticas: Optional[Dict[str, Any]] = None,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Processa um fluxo de DataFrames, lote a lote.
+
+        As estatísticas e a data de referência são congeladas antes do primeiro
+        lote, de modo que o resultado não depende de onde os lotes são cortados.
+
+        Parâmetros:
+        - lotes (Iterable[pd.DataFrame]): fluxo de lotes de entrada
+        - data_snapshot (datetime | None): data de referência para cálculos
+        - estatisticas (dict | None): estatísticas para preenchimento de nulos
+
+        Retorno:
+        - Iterator[pd.DataFrame]: lotes com features normalizadas
+        """
+        snapshot = data_snapshot or datetime.now()
+        estatisticas_congeladas = ProcessadorFeatures._congelar_estatisticas(estatisticas, snapshot)
+
+        for lote in lotes:
+            if lote.empty:
+                continue
+            yield ProcessadorFeatures.processar(
+                lote, data_snapshot=snapshot, estatisticas=estatisticas_congeladas
+            )
+
+    @staticmethod
+    def ler_lotes(caminho_arquivo: str, tamanho_lote: Optional[int] = None) -> Iterator[pd.DataFrame]:
+        """
+        Lê um arquivo CSV ou NDJSON em lotes de tamanho fixo.
+
+        Parâmetros:
+        - caminho_arquivo (str): caminho do arquivo (.csv, .jsonl ou .ndjson)
+        - tamanho_lote (int | None): quantidade de linhas por lote
+
+        Retorno:
+        - Iterator[pd.DataFrame]: lotes lidos do arquivo
+
+        Exceções:
+        - ValueError: quando a extensão do arquivo não é suportada
+        """
+        tamanho = tamanho_lote or Configuracoes.STREAM_CHUNK_SIZE
+        extensao = caminho_arquivo.lower().rsplit(".", 1)[-1]
+
+        if extensao == "csv":
+            leitor = pd.read_csv(caminho_arquivo, chunksize=tamanho)
+        elif extensao in ("jsonl", "ndjson"):
+            leitor = pd.read_json(caminho_arquivo, lines=True, chunksize=tamanho)
+        else:
+            raise ValueError(f"Formato não suportado para leitura em lotes: {caminho_arquivo}")
+
+        with leitor:
+            yield from leitor
+
+    @staticmethod
+    def _congelar_estatisticas(
+        estatisticas: Optional[Dict[str, Any]], data_snapshot: datetime
+    ) -> Dict[str, Any]:
+        """
+        Fixa as estatísticas de preenchimento usadas por todos os lotes.
+
+        Parâmetros:
+        - estatisticas (dict | None): estatísticas de treino
+        - data_snapshot (datetime): data de referência
+
+        Retorno:
+        - dict: estatísticas completas e imutáveis durante o fluxo
+        """
+        congeladas = dict(estatisticas or {})
+        if "mediana_ano_ingresso" not in congeladas:
+            logger.warning(
+                "Estatísticas de treino ausentes no processamento em lotes. "
+                f"Usando ano {data_snapshot.year} para ANO_INGRESSO nulo."
+            )
+            congeladas["mediana_ano_ingresso"] = data_snapshot.year
+        return congeladas
+
     @staticmethod
     def _obter_ano_referencia(dados: pd.DataFrame, data_snapshot: Optional[datetime]):
         """
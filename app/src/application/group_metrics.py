@@ -0,0 +1,135 @@
+"""
+Matriz de confusão por grupo em uma única passada.
+
+Responsabilidades:
+- Contar TP/FP/FN/TN de todos os pares (coluna, valor) com um único bincount
+- Derivar recall, precisão, F1 e taxas de erro das contagens
+- Servir as métricas de grupo do treino e o fairness do monitoramento
+"""
+
+from typing import Dict, Sequence
+
+import numpy as np
+import pandas as pd
+
+
+class MatrizConfusaoGrupos:
+    """
+    Contagem vetorizada da matriz de confusão por grupos.
+
+    Cada linha recebe uma célula (TP=0, FP=1, FN=2, TN=3) e cada par
+    (coluna, valor) um código inteiro; a contagem de todos os pares sai de um
+    `np.bincount` sobre `4 * código + célula`. Os grupos seguem a ordem e as
+    regras do `groupby` (valores ordenados, nulos descartados).
+
+    Responsabilidades:
+    - Alinhar alvo e predições às linhas pela posição
+    - Ignorar nas células as linhas cujo alvo ou predição não é 0/1
+    - Calcular as taxas sem divisão por zero (zero_division=0)
+    """
+
+    CELULAS = ("tp", "fp", "fn", "tn")
+
+    @classmethod
+    def contar(cls, grupos: pd.DataFrame, alvo, predicoes, colunas: Sequence[str] = None) -> pd.DataFrame:
+        """
+        Conta a matriz de confusão de cada valor de cada coluna de grupo.
+
+        Parâmetros:
+        - grupos (pd.DataFrame): colunas de grupo, na mesma ordem de linhas de alvo e predições
+        - alvo (array-like): valores reais
+        - predicoes (array-like): predições
+        - colunas (Sequence[str] | None): colunas avaliadas (padrão: todas)
+
+        Retorno:
+        - pd.DataFrame: coluna, valor, tp, fp, fn, tn e support (linhas do grupo)
+        """
+        colunas = list(grupos.columns if colunas is None else colunas)
+        celulas = cls._celulas(alvo, predicoes)
+
+        codigos_colunas, valores_colunas, deslocamento = [], [], 0
+        for coluna in colunas:
+            codigos, valores = pd.factorize(grupos[coluna], sort=True)
+            codigos_colunas.append(np.where(codigos >= 0, codigos + deslocamento, -1))
+            valores_colunas.append(valores)
+            deslocamento += len(valores)
+
+        if deslocamento == 0:
+            return pd.DataFrame(columns=["coluna", "valor", *cls.CELULAS, "support"])
+
+        codigos = np.concatenate(codigos_colunas)
+        celulas = np.tile(celulas, len(colunas))
+        no_grupo = codigos >= 0
+        suporte = np.bincount(codigos[no_grupo], minlength=deslocamento)
+        contaveis = no_grupo & (celulas >= 0)
+        contagens = np.bincount(
+            codigos[contaveis] * 4 + celulas[contaveis], minlength=deslocamento * 4
+        ).reshape(deslocamento, 4)
+
+        resultado = pd.DataFrame(contagens, columns=list(cls.CELULAS))
+        resultado.insert(0, "coluna", np.repeat(colunas, [len(valores) for valores in valores_colunas]))
+        resultado.insert(1, "valor", [valor for valores in valores_colunas for valor in valores])
+        resultado["support"] = suporte
+        return resultado
+
+    @classmethod
+    def taxas(cls, contagens) -> Dict[str, np.ndarray]:
+        """
+        Deriva as métricas das contagens.
+
+        Parâmetros:
+        - contagens (array-like | pd.DataFrame): [..., 4] com TP, FP, FN, TN no último eixo,
+          ou o retorno de `contar`
+
+        Retorno:
+        - dict[str, np.ndarray]: recall, precision, f1_score, false_positive_rate e false_negative_rate
+        """
+        if isinstance(contagens, pd.DataFrame):
+            contagens = contagens[list(cls.CELULAS)].to_numpy()
+        contagens = np.asarray(contagens, dtype=np.float64)
+        tp, fp, fn, tn = (contagens[..., posicao] for posicao in range(4))
+        return {
+            "recall": cls._dividir(tp, tp + fn),
+            "precision": cls._dividir(tp, tp + fp),
+            "f1_score": cls._dividir(2 * tp, 2 * tp + fp + fn),
+            "false_positive_rate": cls._dividir(fp, fp + tn),
+            "false_negative_rate": cls._dividir(fn, fn + tp),
+        }
+
+    @staticmethod
+    def _celulas(alvo, predicoes) -> np.ndarray:
+        """
+        Classifica cada linha em TP=0, FP=1, FN=2, TN=3 ou -1 (fora de 0/1).
+
+        Parâmetros:
+        - alvo (array-like): valores reais
+        - predicoes (array-like): predições
+
+        Retorno:
+        - np.ndarray: célula de cada linha
+        """
+        alvo, predicoes = pd.Series(np.asarray(alvo)), pd.Series(np.asarray(predicoes))
+        real_positivo, real_negativo = alvo.isin([1]).to_numpy(), alvo.isin([0]).to_numpy()
+        pred_positivo, pred_negativo = predicoes.isin([1]).to_numpy(), predicoes.isin([0]).to_numpy()
+
+        celulas = np.full(len(alvo), -1, dtype=np.int64)
+        celulas[real_positivo & pred_positivo] = 0
+        celulas[real_negativo & pred_positivo] = 1
+        celulas[real_positivo & pred_negativo] = 2
+        celulas[real_negativo & pred_negativo] = 3
+        return celulas
+
+    @staticmethod
+    def _dividir(numerador: np.ndarray, denominador: np.ndarray) -> np.ndarray:
+        """
+        Divide retornando 0 onde o denominador é zero.
+
+        Parâmetros:
+        - numerador (np.ndarray): numerador
+        - denominador (np.ndarray): denominador
+
+        Retorno:
+        - np.ndarray: razão
+        """
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(denominador > 0, numerador / denominador, 0.0)
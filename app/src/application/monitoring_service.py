@@ -16,6 +16,7 @@ from evidently import ColumnMapping
 from evidently.metric_preset import DataDriftPreset, TargetDriftPreset
 from evidently.report import Report
 
+from src.application.group_metrics import MatrizConfusaoGrupos
 from src.config.settings import Configuracoes
 from src.util.logger import logger
 
@@ -309,27 +310,19 @@ class ServicoMonitoramento:
         if not colunas_necessarias.issubset(dados.columns):
             return "Dados insuficientes para calcular fairness (grupo, target ou prediction ausentes)."
 
-        metricas = []
-        for grupo, subset in dados.groupby(grupo_coluna):
-            y_true = subset[target_col]
-            y_pred = subset["prediction"]
-
-            falso_positivo = int(((y_pred == 1) & (y_true == 0)).sum())
-            falso_negativo = int(((y_pred == 0) & (y_true == 1)).sum())
-            verdadeiro_positivo = int(((y_pred == 1) & (y_true == 1)).sum())
-            verdadeiro_negativo = int(((y_pred == 0) & (y_true == 0)).sum())
+        contagens = MatrizConfusaoGrupos.contar(dados, dados[target_col], dados["prediction"], [grupo_coluna])
+        taxas = MatrizConfusaoGrupos.taxas(contagens)
 
-            fpr_denom = falso_positivo + verdadeiro_negativo
-            fnr_denom = falso_negativo + verdadeiro_positivo
-
-            fpr = round(falso_positivo / fpr_denom, 4) if fpr_denom else 0.0
-            fnr = round(falso_negativo / fnr_denom, 4) if fnr_denom else 0.0
+        metricas = []
+        for posicao, (grupo, suporte) in enumerate(zip(contagens["valor"], contagens["support"])):
+            fpr = round(float(taxas["false_positive_rate"][posicao]), 4)
+            fnr = round(float(taxas["false_negative_rate"][posicao]), 4)
             metricas.append(
                 {
                     grupo_coluna: grupo,
                     "false_positive_rate_pct": round(fpr * 100, 2),
                     "false_negative_rate_pct": round(fnr * 100, 2),
-                    "support": int(len(subset)),
+                    "support": int(suporte),
                 }
             )
 
@@ -135,7 +135,7 @@ class ServicoRisco:
         Retorno:
         - dict: resultado da predição
         """
-        historico = self.repositorio.obter_historico_estudante(entrada.RA)
+        historico = self.repositorio.obter_historico_estudante(entrada.RA, entrada.ANO_REFERENCIA)
         requer_revisao_humana = False
 
         if historico:
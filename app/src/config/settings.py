@@ -26,12 +26,18 @@ class Configuracoes:
     MODEL_DIR = os.path.join(BASE_DIR, "models")
     LOG_DIR = os.path.join(BASE_DIR, "logs")
     MONITORING_DIR = os.path.join(BASE_DIR, "monitoring")
+    CACHE_DIR = os.getenv("CACHE_DIR", os.path.join(BASE_DIR, "cache"))
 
     MODEL_PATH = os.path.join(MODEL_DIR, "model_passos_magicos.joblib")
     LOG_PATH = os.path.join(LOG_DIR, "predictions.jsonl")
     REFERENCE_PATH = os.path.join(MONITORING_DIR, "reference_data.csv")
     METRICS_FILE = os.path.join(MONITORING_DIR, "train_metrics.json")
     FEATURE_STATS_PATH = os.path.join(MONITORING_DIR, "feature_stats.json")
+    BACKTEST_PATH = os.path.join(MONITORING_DIR, "backtest_metrics.json")
+    HYPERPARAM_SEARCH_PATH = os.path.join(MONITORING_DIR, "hyperparam_search.json")
+    PROFILE_PATH = os.path.join(MONITORING_DIR, "train_profile.json")
+    PROFILE_MEMORY = os.getenv("PROFILE_MEMORY", "false").lower() in ("1", "true", "yes")
+    PROFILE_STAGE = os.getenv("PROFILE_STAGE")
     MODEL_SHA256 = os.getenv("MODEL_SHA256")
     MODEL_SHA256_REQUIRED = os.getenv("MODEL_SHA256_REQUIRED", "false").lower() in ("1", "true", "yes")
 
@@ -39,11 +45,49 @@ class Configuracoes:
     TARGET_COL = "RISCO_DEFASAGEM"
     RANDOM_STATE = 42
     MIN_RECALL = float(os.getenv("MIN_RECALL", "0.6"))
+    BOOTSTRAP_RESAMPLES = int(os.getenv("BOOTSTRAP_RESAMPLES", "2000"))
+    BOOTSTRAP_CONFIDENCE = float(os.getenv("BOOTSTRAP_CONFIDENCE", "0.95"))
+    QUALITY_GATE_LOWER_BOUND = os.getenv("QUALITY_GATE_LOWER_BOUND", "false").lower() in ("1", "true", "yes")
+    QUALITY_GATE_MAX_SINGLE_ROW_MS = float(os.getenv("QUALITY_GATE_MAX_SINGLE_ROW_MS", "0"))
+    QUALITY_GATE_MAX_BATCH_MS = float(os.getenv("QUALITY_GATE_MAX_BATCH_MS", "0"))
+    QUALITY_GATE_MAX_MODEL_MB = float(os.getenv("QUALITY_GATE_MAX_MODEL_MB", "0"))
+    QUALITY_GATE_MAX_LATENCY_RATIO = float(os.getenv("QUALITY_GATE_MAX_LATENCY_RATIO", "0"))
+    QUALITY_GATE_MAX_SIZE_RATIO = float(os.getenv("QUALITY_GATE_MAX_SIZE_RATIO", "0"))
     N_JOBS = int(os.getenv("MODEL_N_JOBS", "1"))
+    BACKTEST_WORKERS = int(os.getenv("BACKTEST_WORKERS", "1"))
+    HYPERPARAM_SEARCH_WORKERS = int(os.getenv("HYPERPARAM_SEARCH_WORKERS", "1"))
+    HYPERPARAM_SEARCH_BUDGET_S = float(os.getenv("HYPERPARAM_SEARCH_BUDGET_S", "900"))
+    HYPERPARAM_SEARCH_ETA = int(os.getenv("HYPERPARAM_SEARCH_ETA", "3"))
+    INCREMENTAL_NEW_TREES = int(os.getenv("INCREMENTAL_NEW_TREES", "50"))
+    INCREMENTAL_MAX_TREES = int(os.getenv("INCREMENTAL_MAX_TREES", "0"))
+    LATENCY_BENCHMARK_REPEATS = int(os.getenv("LATENCY_BENCHMARK_REPEATS", "20"))
+
+    TRAINING_CACHE_DIR = os.path.join(CACHE_DIR, "training")
+    TRAINING_CACHE_ENABLED = os.getenv("TRAINING_CACHE", "true").lower() in ("1", "true", "yes")
+    TRAINING_CACHE_MAX_ENTRIES = int(os.getenv("TRAINING_CACHE_MAX_ENTRIES", "5"))
+    DATA_CACHE_DIR = os.path.join(CACHE_DIR, "data")
+    DATA_CACHE_ENABLED = os.getenv("DATA_CACHE", "true").lower() in ("1", "true", "yes")
+    DATA_CACHE_MAX_ENTRIES = int(os.getenv("DATA_CACHE_MAX_ENTRIES", "20"))
+    DATA_LOADER_WORKERS = int(os.getenv("DATA_LOADER_WORKERS", "1"))
+    EXCEL_STREAMING_MIN_BYTES = int(os.getenv("EXCEL_STREAMING_MIN_BYTES", str(20 * 1024 * 1024)))
 
     HISTORICAL_PATH = os.getenv("HISTORICAL_PATH")
+    FEATURE_STORE_SNAPSHOT_DIR = os.getenv(
+        "FEATURE_STORE_SNAPSHOT_DIR", os.path.join(CACHE_DIR, "feature_store")
+    )
+    FEATURE_STORE_SNAPSHOT_ENABLED = os.getenv("FEATURE_STORE_SNAPSHOT", "true").lower() in ("1", "true", "yes")
+    FEATURE_STORE_WATCH_INTERVAL = float(os.getenv("FEATURE_STORE_WATCH_INTERVAL", "30"))
+    FEATURE_STORE_BACKEND = os.getenv("FEATURE_STORE_BACKEND", "memory").lower()
+    FEATURE_STORE_SQLITE_PATH = os.getenv(
+        "FEATURE_STORE_SQLITE_PATH", os.path.join(CACHE_DIR, "feature_store.sqlite")
+    )
+    FEATURE_STORE_SQLITE_CACHE_SIZE = int(os.getenv("FEATURE_STORE_SQLITE_CACHE_SIZE", "4096"))
+    FEATURE_STORE_DELTA_MAX_FRACTION = float(os.getenv("FEATURE_STORE_DELTA_MAX_FRACTION", "0.2"))
     LOG_SAMPLE_LIMIT = int(os.getenv("LOG_SAMPLE_LIMIT", "1000"))
     LOG_MAX_BYTES = int(os.getenv("LOG_MAX_BYTES", str(10 * 1024 * 1024)))
+    STREAM_CHUNK_SIZE = int(os.getenv("STREAM_CHUNK_SIZE", "50000"))
+
+    METRICAS_HISTORICAS = ["INDE", "IAA", "IEG", "IPS", "IDA", "IPP", "IPV", "IAN"]
 
     FEATURES_NUMERICAS = [
         "IDADE",
@@ -87,3 +131,23 @@ class Configuracoes:
 Configuracoes.FEATURES_MODELO_CATEGORICAS = [
     c for c in Configuracoes.FEATURES_CATEGORICAS if c not in Configuracoes.FEATURES_SENSIVEIS
 ]
+
+# Colunas mantidas na leitura em streaming de planilhas grandes.
+Configuracoes.COLUNAS_CARGA = list(
+    dict.fromkeys(
+        ["RA", "ANO_REFERENCIA", "ANO_INGRESSO", "IDADE", "DEFASAGEM", "PEDRA"]
+        + Configuracoes.COLUNAS_PROIBIDAS_NO_TREINO
+        + Configuracoes.METRICAS_HISTORICAS
+        + Configuracoes.FEATURES_CATEGORICAS
+    )
+)
+
+# Tipos explícitos das colunas conhecidas (nomes canônicos) na leitura de CSV.
+Configuracoes.ESQUEMA_CSV = {
+    **{coluna: "str" for coluna in ["RA", "PEDRA"] + Configuracoes.FEATURES_CATEGORICAS},
+    **{
+        coluna: "float64"
+        for coluna in ["IDADE", "ANO_INGRESSO", "DEFASAGEM", "NOTA_PORT", "NOTA_MAT", "NOTA_ING"]
+        + Configuracoes.METRICAS_HISTORICAS
+    },
+}
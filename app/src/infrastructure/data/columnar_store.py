@@ -0,0 +1,175 @@
+"""
+Armazenamento colunar binário de DataFrames.
+
+Responsabilidades:
+- Persistir DataFrames coluna a coluna em arquivos .npy
+- Carregar colunas numéricas com memory-map
+- Preservar índice, nomes e tipos das colunas
+"""
+
+import json
+import os
+import shutil
+import uuid
+from typing import Any, Dict, List
+
+import numpy as np
+import pandas as pd
+
+
+class ArmazenamentoColunar:
+    """
+    Serializa DataFrames em um diretório com um arquivo por coluna.
+
+    Responsabilidades:
+    - Gravar colunas numéricas no formato nativo do NumPy
+    - Codificar colunas textuais/mistas como códigos + categorias
+    - Reconstruir o DataFrame original na leitura
+    """
+
+    ARQUIVO_ESQUEMA = "esquema.json"
+    VERSAO_FORMATO = 1
+
+    @staticmethod
+    def salvar(dados: pd.DataFrame, diretorio: str) -> None:
+        """
+        Grava o DataFrame de forma atômica no diretório informado.
+
+        Parâmetros:
+        - dados (pd.DataFrame): dados a persistir
+        - diretorio (str): diretório de destino (substituído se existir)
+        """
+        pai = os.path.dirname(os.path.abspath(diretorio))
+        os.makedirs(pai, exist_ok=True)
+        temporario = os.path.join(pai, f".tmp-{uuid.uuid4().hex}")
+        os.makedirs(temporario)
+
+        try:
+            colunas = []
+            for posicao, nome in enumerate(dados.columns):
+                descricao = ArmazenamentoColunar._salvar_serie(dados.iloc[:, posicao], temporario, f"c{posicao}")
+                descricao["nome"] = nome
+                colunas.append(descricao)
+
+            indice = ArmazenamentoColunar._salvar_serie(
+                pd.Series(dados.index), temporario, "indice"
+            )
+            indice["nome"] = dados.index.name
+
+            esquema = {
+                "versao": ArmazenamentoColunar.VERSAO_FORMATO,
+                "linhas": int(len(dados)),
+                "colunas": colunas,
+                "indice": indice,
+            }
+            with open(os.path.join(temporario, ArmazenamentoColunar.ARQUIVO_ESQUEMA), "w") as arquivo:
+                json.dump(esquema, arquivo, default=str)
+
+            if os.path.exists(diretorio):
+                shutil.rmtree(diretorio)
+            os.replace(temporario, diretorio)
+        finally:
+            if os.path.exists(temporario):
+                shutil.rmtree(temporario, ignore_errors=True)
+
+    @staticmethod
+    def carregar(diretorio: str, mmap: bool = True) -> pd.DataFrame:
+        """
+        Reconstrói o DataFrame gravado por `salvar`.
+
+        Parâmetros:
+        - diretorio (str): diretório gravado anteriormente
+        - mmap (bool): abre colunas numéricas com memory-map somente leitura
+
+        Retorno:
+        - pd.DataFrame: dados reconstruídos
+
+        Exceções:
+        - FileNotFoundError: quando o diretório não contém um esquema válido
+        - ValueError: quando a versão do formato é incompatível
+        """
+        caminho_esquema = os.path.join(diretorio, ArmazenamentoColunar.ARQUIVO_ESQUEMA)
+        with open(caminho_esquema, "r") as arquivo:
+            esquema = json.load(arquivo)
+
+        if esquema.get("versao") != ArmazenamentoColunar.VERSAO_FORMATO:
+            raise ValueError(f"Versão de armazenamento colunar incompatível em {diretorio}")
+
+        modo = "r" if mmap else None
+        series = [
+            ArmazenamentoColunar._carregar_serie(descricao, diretorio, modo)
+            for descricao in esquema["colunas"]
+        ]
+        indice = pd.Index(
+            ArmazenamentoColunar._carregar_serie(esquema["indice"], diretorio, modo),
+            name=esquema["indice"]["nome"],
+        )
+
+        dados = pd.DataFrame(dict(enumerate(series)), index=indice, copy=False)
+        dados.columns = [descricao["nome"] for descricao in esquema["colunas"]]
+        return dados
+
+    @staticmethod
+    def _salvar_serie(serie: pd.Series, diretorio: str, prefixo: str) -> Dict[str, Any]:
+        """
+        Grava uma série e retorna sua descrição no esquema.
+
+        Parâmetros:
+        - serie (pd.Series): série a gravar
+        - diretorio (str): diretório de destino
+        - prefixo (str): prefixo dos arquivos da série
+
+        Retorno:
+        - dict: descrição da série (tipo, dtype e arquivos)
+        """
+        dtype = serie.dtype
+        if isinstance(dtype, np.dtype) and dtype.kind in "biufcmM":
+            arquivo = f"{prefixo}.npy"
+            np.save(os.path.join(diretorio, arquivo), np.ascontiguousarray(serie.to_numpy()))
+            return {"tipo": "numerico", "dtype": str(dtype), "arquivos": [arquivo]}
+
+        codigos, categorias = pd.factorize(serie, use_na_sentinel=True)
+        arquivo_codigos = f"{prefixo}.codigos.npy"
+        arquivo_categorias = f"{prefixo}.categorias.npy"
+        np.save(os.path.join(diretorio, arquivo_codigos), codigos.astype(np.int32))
+        np.save(
+            os.path.join(diretorio, arquivo_categorias),
+            np.asarray(categorias, dtype=object),
+            allow_pickle=True,
+        )
+        return {
+            "tipo": "codificado",
+            "dtype": str(dtype),
+            "arquivos": [arquivo_codigos, arquivo_categorias],
+        }
+
+    @staticmethod
+    def _carregar_serie(descricao: Dict[str, Any], diretorio: str, modo) -> Any:
+        """
+        Lê uma série a partir de sua descrição no esquema.
+
+        Parâmetros:
+        - descricao (dict): descrição gravada no esquema
+        - diretorio (str): diretório de origem
+        - modo (str | None): modo de memory-map do NumPy
+
+        Retorno:
+        - np.ndarray | pd.Series: valores da série
+        """
+        arquivos: List[str] = descricao["arquivos"]
+        if descricao["tipo"] == "numerico":
+            # np.asarray mantém a visão sobre o mapeamento sem expor a subclasse memmap.
+            return np.asarray(np.load(os.path.join(diretorio, arquivos[0]), mmap_mode=modo))
+
+        codigos = np.load(os.path.join(diretorio, arquivos[0]), mmap_mode=modo)
+        categorias = np.load(os.path.join(diretorio, arquivos[1]), allow_pickle=True)
+        # O código -1 (nulo) aponta para o último elemento, que é NaN.
+        valores = np.append(categorias, np.nan).take(codigos)
+        serie = pd.Series(valores, dtype=object)
+
+        if descricao["dtype"] != "object":
+            try:
+                serie = serie.astype(descricao["dtype"])
+            except (TypeError, ValueError):
+                pass
+        return serie.to_numpy() if descricao["dtype"] == "object" else serie.array
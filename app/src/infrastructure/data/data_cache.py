@@ -0,0 +1,292 @@
+"""
+Cache binário dos arquivos de dados já interpretados.
+
+Responsabilidades:
+- Identificar arquivos por caminho, tamanho, mtime e hash do conteúdo
+- Persistir as abas normalizadas em formato colunar binário
+- Reaproveitar a leitura quando o arquivo de origem não mudou
+- Manter o manifesto dos arquivos ingeridos de cada pasta de dados
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import shutil
+import uuid
+from typing import Any, Dict, Iterable, List, Optional
+
+import pandas as pd
+
+from src.config.settings import Configuracoes
+from src.infrastructure.data.columnar_store import ArmazenamentoColunar
+from src.util.logger import logger
+
+
+class CacheDadosBrutos:
+    """
+    Cache em disco das abas normalizadas de cada arquivo de dados.
+
+    Responsabilidades:
+    - Calcular a impressão digital dos arquivos de origem
+    - Gravar e carregar entradas de forma atômica
+    - Limitar a quantidade de entradas mantidas
+    - Registrar o manifesto de ingestão por pasta de dados
+    """
+
+    VERSAO_CACHE = 2
+    ARQUIVO_IMPRESSOES = "impressoes.json"
+    ARQUIVO_MANIFESTO = "manifesto.json"
+    ARQUIVO_PARTES = "partes.json"
+    TAMANHO_BLOCO_HASH = 1024 * 1024
+
+    def __init__(self, diretorio: Optional[str] = None, habilitado: Optional[bool] = None):
+        """
+        Inicializa o cache.
+
+        Parâmetros:
+        - diretorio (str | None): diretório do cache (padrão: configuração)
+        - habilitado (bool | None): liga/desliga o cache (padrão: configuração)
+        """
+        self._diretorio = diretorio
+        self._habilitado = habilitado
+
+    @property
+    def diretorio(self) -> str:
+        """Diretório raiz das entradas do cache."""
+        return self._diretorio or Configuracoes.DATA_CACHE_DIR
+
+    @property
+    def habilitado(self) -> bool:
+        """Indica se o cache está ativo."""
+        if self._habilitado is None:
+            return Configuracoes.DATA_CACHE_ENABLED
+        return self._habilitado
+
+    def calcular_chave(self, caminho: str, componentes_codigo: Iterable[Any]) -> Optional[str]:
+        """
+        Calcula a chave do cache para um arquivo de dados.
+
+        O hash do conteúdo é reaproveitado enquanto caminho, tamanho e mtime
+        não mudam; a chave combina esse hash com o código que normaliza as abas.
+
+        Parâmetros:
+        - caminho (str): arquivo de origem
+        - componentes_codigo (Iterable): funções cujo código gera as abas normalizadas
+          (textos entram na chave como estão)
+
+        Retorno:
+        - str | None: chave hexadecimal ou None quando o cache não se aplica
+        """
+        if not self.habilitado:
+            return None
+
+        try:
+            hash_chave = hashlib.sha256()
+            hash_chave.update(f"v{self.VERSAO_CACHE}".encode())
+            hash_chave.update(self._hash_conteudo(caminho).encode())
+            for componente in componentes_codigo:
+                texto = componente if isinstance(componente, str) else inspect.getsource(componente)
+                hash_chave.update(texto.encode())
+            return hash_chave.hexdigest()
+        except Exception as erro:
+            logger.warning(f"Não foi possível calcular a chave do cache de dados para {caminho}: {erro}")
+            return None
+
+    def carregar(self, chave: Optional[str], caminho: str = "") -> Optional[List[pd.DataFrame]]:
+        """
+        Carrega as abas normalizadas de um arquivo.
+
+        Parâmetros:
+        - chave (str | None): chave calculada por `calcular_chave`
+        - caminho (str): arquivo de origem, usado apenas no log
+
+        Retorno:
+        - list[pd.DataFrame] | None: abas normalizadas ou None
+        """
+        if chave is None:
+            return None
+
+        entrada = os.path.join(self.diretorio, chave)
+        if not os.path.isdir(entrada):
+            logger.info(f"Cache de dados: miss ({os.path.basename(caminho)})")
+            return None
+
+        try:
+            with open(os.path.join(entrada, self.ARQUIVO_PARTES), "r") as arquivo:
+                descricao = json.load(arquivo)
+            partes = []
+            for posicao, atributos in enumerate(descricao["atributos"]):
+                parte = ArmazenamentoColunar.carregar(os.path.join(entrada, str(posicao)), mmap=False)
+                parte.attrs = atributos
+                partes.append(parte)
+        except Exception as erro:
+            logger.warning(f"Entrada de cache de dados inválida ({chave[:12]}): {erro}")
+            shutil.rmtree(entrada, ignore_errors=True)
+            return None
+
+        os.utime(entrada)
+        logger.info(f"Cache de dados: hit ({os.path.basename(caminho)})")
+        return partes
+
+    def salvar(self, chave: Optional[str], partes: List[pd.DataFrame]) -> None:
+        """
+        Grava as abas normalizadas de um arquivo.
+
+        Parâmetros:
+        - chave (str | None): chave calculada por `calcular_chave`
+        - partes (list[pd.DataFrame]): abas normalizadas, na ordem de leitura (com `attrs`)
+        """
+        if chave is None:
+            return
+
+        entrada = os.path.join(self.diretorio, chave)
+        temporario = f"{entrada}.{uuid.uuid4().hex}.tmp"
+        try:
+            for posicao, parte in enumerate(partes):
+                ArmazenamentoColunar.salvar(parte, os.path.join(temporario, str(posicao)))
+            os.makedirs(temporario, exist_ok=True)
+            with open(os.path.join(temporario, self.ARQUIVO_PARTES), "w") as arquivo:
+                descricao = {"partes": len(partes), "atributos": [parte.attrs for parte in partes]}
+                json.dump(descricao, arquivo, default=str)
+            shutil.rmtree(entrada, ignore_errors=True)
+            os.replace(temporario, entrada)
+            self._podar()
+        except Exception as erro:
+            logger.warning(f"Falha ao gravar cache de dados: {erro}")
+            shutil.rmtree(temporario, ignore_errors=True)
+
+    def _hash_conteudo(self, caminho: str) -> str:
+        """
+        Retorna o hash SHA256 do conteúdo, reaproveitando o último cálculo.
+
+        Parâmetros:
+        - caminho (str): arquivo de origem
+
+        Retorno:
+        - str: hash hexadecimal do conteúdo
+
+        Exceções:
+        - OSError: quando o arquivo não pode ser lido
+        """
+        caminho_absoluto = os.path.abspath(caminho)
+        estado = os.stat(caminho_absoluto)
+        impressoes = self._ler_json(self.ARQUIVO_IMPRESSOES)
+        registrada = impressoes.get(caminho_absoluto)
+        if registrada and registrada["tamanho"] == estado.st_size and registrada["mtime_ns"] == estado.st_mtime_ns:
+            return registrada["sha256"]
+
+        hash_arquivo = hashlib.sha256()
+        with open(caminho_absoluto, "rb") as arquivo:
+            for bloco in iter(lambda: arquivo.read(self.TAMANHO_BLOCO_HASH), b""):
+                hash_arquivo.update(bloco)
+
+        impressoes[caminho_absoluto] = {
+            "tamanho": estado.st_size,
+            "mtime_ns": estado.st_mtime_ns,
+            "sha256": hash_arquivo.hexdigest(),
+        }
+        self._gravar_json(self.ARQUIVO_IMPRESSOES, impressoes)
+        return impressoes[caminho_absoluto]["sha256"]
+
+    def impressao(self, caminho: str) -> Dict[str, Any]:
+        """
+        Retorna a impressão digital registrada de um arquivo.
+
+        Parâmetros:
+        - caminho (str): arquivo de origem
+
+        Retorno:
+        - dict: tamanho, mtime_ns e sha256 (vazio quando não registrada)
+        """
+        return dict(self._ler_json(self.ARQUIVO_IMPRESSOES).get(os.path.abspath(caminho), {}))
+
+    def ler_manifesto(self, diretorio_dados: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Lê o manifesto de ingestão de uma pasta de dados.
+
+        Parâmetros:
+        - diretorio_dados (str): pasta de dados
+
+        Retorno:
+        - dict: caminho absoluto -> impressão, chave e resumo do resultado normalizado
+        """
+        return self._ler_json(self.ARQUIVO_MANIFESTO).get(os.path.abspath(diretorio_dados), {})
+
+    def gravar_manifesto(self, diretorio_dados: str, arquivos: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Substitui o manifesto de ingestão de uma pasta de dados.
+
+        Parâmetros:
+        - diretorio_dados (str): pasta de dados
+        - arquivos (dict): caminho absoluto -> impressão, chave e resumo do resultado normalizado
+        """
+        manifestos = self._ler_json(self.ARQUIVO_MANIFESTO)
+        manifestos[os.path.abspath(diretorio_dados)] = arquivos
+        try:
+            self._gravar_json(self.ARQUIVO_MANIFESTO, manifestos)
+        except OSError as erro:
+            logger.warning(f"Falha ao gravar manifesto de ingestão: {erro}")
+
+    def remover(self, chave: Optional[str]) -> None:
+        """
+        Remove uma entrada do cache.
+
+        Parâmetros:
+        - chave (str | None): chave da entrada
+        """
+        if chave:
+            shutil.rmtree(os.path.join(self.diretorio, chave), ignore_errors=True)
+
+    def _ler_json(self, nome: str) -> Dict[str, Any]:
+        """
+        Lê um arquivo JSON de controle do cache.
+
+        Parâmetros:
+        - nome (str): nome do arquivo
+
+        Retorno:
+        - dict: conteúdo ou dicionário vazio
+        """
+        try:
+            with open(os.path.join(self.diretorio, nome), "r") as arquivo:
+                return json.load(arquivo)
+        except (OSError, ValueError):
+            return {}
+
+    def _gravar_json(self, nome: str, dados: Dict[str, Any]) -> None:
+        """
+        Grava um arquivo JSON de controle do cache de forma atômica.
+
+        Parâmetros:
+        - nome (str): nome do arquivo
+        - dados (dict): conteúdo
+        """
+        os.makedirs(self.diretorio, exist_ok=True)
+        caminho = os.path.join(self.diretorio, nome)
+        temporario = f"{caminho}.{uuid.uuid4().hex}"
+        with open(temporario, "w") as arquivo:
+            json.dump(dados, arquivo, default=str)
+        os.replace(temporario, caminho)
+
+    def _podar(self) -> None:
+        """
+        Remove as entradas menos usadas além do limite configurado.
+
+        Entradas referenciadas por algum manifesto de ingestão são preservadas.
+        """
+        referenciadas = {
+            registro.get("chave")
+            for arquivos in self._ler_json(self.ARQUIVO_MANIFESTO).values()
+            for registro in arquivos.values()
+        }
+        entradas = [
+            os.path.join(self.diretorio, nome)
+            for nome in os.listdir(self.diretorio)
+            if not nome.endswith(".tmp")
+            and nome not in referenciadas
+            and os.path.isdir(os.path.join(self.diretorio, nome))
+        ]
+        entradas.sort(key=os.path.getmtime, reverse=True)
+        for antiga in entradas[Configuracoes.DATA_CACHE_MAX_ENTRIES:]:
+            shutil.rmtree(antiga, ignore_errors=True)
@@ -5,18 +5,33 @@ Responsabilidades:
 - Localizar arquivos Excel
 - Normalizar colunas
 - Unificar abas por ano
+- Reaproveitar arquivos já interpretados pelo cache binário
+- Distribuir a leitura de arquivos e abas entre processos
+- Ler planilhas grandes em streaming, com memória limitada por bloco
+- Reler apenas arquivos novos ou alterados, conforme o manifesto de ingestão
 """
 
+import csv
 import glob
+import json
 import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
 
+import numpy as np
+import openpyxl
 import pandas as pd
-import unicodedata
+from openpyxl.cell.cell import ERROR_CODES
+from pandas.io.parsers import TextParser
 
 from src.config.settings import Configuracoes
+from src.infrastructure.data.data_cache import CacheDadosBrutos
+from src.infrastructure.data.header_resolver import ResolvedorCabecalhos
+from src.util.helpers import resolver_workers
 from src.util.logger import logger
+from src.util.profiler import perfil_treino
 
 
 class CarregadorDados:
@@ -29,6 +44,21 @@ class CarregadorDados:
     - Concatenar datasets
     """
 
+    RESOLVEDOR_CABECALHOS = ResolvedorCabecalhos()
+    ATRIBUTO_MAPEAMENTO = "mapeamento_colunas"
+    TAMANHO_AMOSTRA_CSV = 64 * 1024
+
+    def __init__(self, cache: Optional[CacheDadosBrutos] = None):
+        """
+        Inicializa o carregador.
+
+        Parâmetros:
+        - cache (CacheDadosBrutos | None): cache dos arquivos interpretados
+        """
+        self.cache = cache or CacheDadosBrutos()
+        self.mapeamentos_colunas: Dict[str, Dict[str, str]] = {}
+        self.relatorio_ingestao: Dict[str, List[str]] = {}
+
     def carregar_dados(self) -> pd.DataFrame:
         """
         Busca arquivos Excel na pasta de dados e unifica as abas por ano.
@@ -44,31 +74,24 @@ class CarregadorDados:
         arquivos = []
         for padrao in padroes:
             caminho_busca = os.path.join(Configuracoes.DATA_DIR, padrao)
-            arquivos.extend(glob.glob(caminho_busca))
+            arquivos.extend(sorted(glob.glob(caminho_busca)))
             logger.info(f"Buscando arquivos em: {caminho_busca}")
 
         if not arquivos:
             self._registrar_conteudo_pasta()
             raise FileNotFoundError(f"Nenhum arquivo de dados encontrado em {Configuracoes.DATA_DIR}")
 
-        dados_unificados = []
-        for caminho_arquivo in arquivos:
-            if caminho_arquivo.endswith(".xlsx"):
-                logger.info(f"Carregando arquivo Excel: {caminho_arquivo}")
-                abas = self._ler_excel(caminho_arquivo)
-                dados_unificados.extend(self._processar_abas(abas))
-            else:
-                logger.info(f"Carregando arquivo CSV: {caminho_arquivo}")
-                df_csv = self._ler_csv(caminho_arquivo)
-                if df_csv is not None:
-                    df_csv["ANO_REFERENCIA"] = df_csv.get("ANO_REFERENCIA", datetime.now().year)
-                    dados_unificados.append(self._processar_dataframe(df_csv, int(df_csv["ANO_REFERENCIA"].iloc[0])))
+        with perfil_treino.etapa("carga.arquivos"):
+            dados_unificados = [parte for partes in self._carregar_arquivos(arquivos) for parte in partes]
 
         if not dados_unificados:
             raise RuntimeError("Nenhuma aba válida carregada do Excel.")
 
         try:
-            df_final = pd.concat(dados_unificados, ignore_index=True)
+            with perfil_treino.etapa("carga.concatenacao"):
+                df_final = pd.concat(dados_unificados, ignore_index=True)
+                # Blocos só com nulos são float; ao juntar com texto a coluna volta a ser inferida.
+                df_final = df_final.infer_objects()
         except Exception as erro:
             logger.error(f"Erro ao concatenar os dados: {erro}")
             raise erro
@@ -76,6 +99,275 @@ class CarregadorDados:
         logger.info(f"Dataset Total Unificado: {df_final.shape}")
         return df_final
 
+    def _carregar_arquivos(self, arquivos: List[str]) -> List[List[pd.DataFrame]]:
+        """
+        Obtém as abas normalizadas de cada arquivo, do cache ou da leitura dos arquivos.
+
+        Os arquivos fora do cache são lidos em paralelo quando há mais de um
+        worker configurado; o resultado segue a ordem de `arquivos`. Ao final,
+        o manifesto de ingestão da pasta de dados é atualizado.
+
+        Parâmetros:
+        - arquivos (list[str]): caminhos dos arquivos
+
+        Retorno:
+        - list[list[pd.DataFrame]]: abas normalizadas por arquivo
+        """
+        with perfil_treino.etapa("carga.cache"):
+            manifesto_anterior = self.cache.ler_manifesto(Configuracoes.DATA_DIR) if self.cache.habilitado else {}
+            componentes = self._componentes_cache()
+            chaves = [self.cache.calcular_chave(caminho, componentes) for caminho in arquivos]
+            resultados = [self.cache.carregar(chave, caminho) for chave, caminho in zip(chaves, arquivos)]
+        pendentes = [indice for indice, partes in enumerate(resultados) if partes is None]
+
+        with perfil_treino.etapa("carga.leitura"):
+            workers = resolver_workers(Configuracoes.DATA_LOADER_WORKERS)
+            if workers > 1 and pendentes:
+                lidos = self._ler_em_paralelo([arquivos[indice] for indice in pendentes], workers)
+            else:
+                lidos = [self._ler_arquivo(arquivos[indice]) for indice in pendentes]
+
+        with perfil_treino.etapa("carga.cache_gravacao"):
+            for indice, partes in zip(pendentes, lidos):
+                resultados[indice] = partes
+                self.cache.salvar(chaves[indice], partes)
+
+        with perfil_treino.etapa("carga.manifesto"):
+            for caminho_arquivo, partes in zip(arquivos, resultados):
+                self._registrar_mapeamento(caminho_arquivo, partes)
+            self._atualizar_manifesto(arquivos, chaves, resultados, pendentes, manifesto_anterior)
+        return resultados
+
+    def _atualizar_manifesto(
+        self,
+        arquivos: List[str],
+        chaves: List[Optional[str]],
+        resultados: List[List[pd.DataFrame]],
+        relidos: List[int],
+        manifesto_anterior: Dict[str, Dict],
+    ) -> None:
+        """
+        Compara a pasta de dados com o manifesto anterior e grava o novo manifesto.
+
+        Arquivos são classificados como novos, alterados, inalterados ou removidos;
+        entradas de cache de versões que deixaram de existir são descartadas.
+
+        Parâmetros:
+        - arquivos (list[str]): caminhos dos arquivos atuais
+        - chaves (list[str | None]): chaves de cache dos arquivos
+        - resultados (list[list[pd.DataFrame]]): abas normalizadas por arquivo
+        - relidos (list[int]): posições dos arquivos interpretados nesta carga
+        - manifesto_anterior (dict): manifesto gravado na carga anterior
+
+        Retorno:
+        - None: não retorna valor
+        """
+        relatorio = {"novos": [], "alterados": [], "inalterados": [], "removidos": [], "relidos": []}
+        manifesto = {}
+        agora = datetime.now().isoformat()
+
+        for indice, (caminho_arquivo, chave, partes) in enumerate(zip(arquivos, chaves, resultados)):
+            caminho_absoluto = os.path.abspath(caminho_arquivo)
+            anterior = manifesto_anterior.get(caminho_absoluto)
+            if anterior is None:
+                situacao = "novos"
+            elif anterior.get("chave") != chave:
+                situacao = "alterados"
+            else:
+                situacao = "inalterados"
+            relatorio[situacao].append(caminho_arquivo)
+            if indice in relidos:
+                relatorio["relidos"].append(caminho_arquivo)
+
+            manifesto[caminho_absoluto] = {
+                **self.cache.impressao(caminho_arquivo),
+                "chave": chave,
+                "partes": len(partes),
+                "linhas": int(sum(len(parte) for parte in partes)),
+                "colunas": sorted({str(coluna) for parte in partes for coluna in parte.columns}),
+                "ingerido_em": anterior.get("ingerido_em", agora) if situacao == "inalterados" else agora,
+            }
+
+        relatorio["removidos"] = sorted(set(manifesto_anterior) - set(manifesto))
+        chaves_atuais = set(chaves)
+        for anterior in manifesto_anterior.values():
+            if anterior.get("chave") not in chaves_atuais:
+                self.cache.remover(anterior.get("chave"))
+
+        if self.cache.habilitado:
+            self.cache.gravar_manifesto(Configuracoes.DATA_DIR, manifesto)
+
+        self.relatorio_ingestao = relatorio
+        logger.info(
+            "Ingestão de dados: "
+            + ", ".join(f"{len(caminhos)} {situacao}" for situacao, caminhos in relatorio.items())
+        )
+        for caminho_arquivo in relatorio["removidos"]:
+            logger.warning(f"Arquivo removido desde a última carga: {caminho_arquivo}")
+
+    def _registrar_mapeamento(self, caminho_arquivo: str, partes: List[pd.DataFrame]) -> None:
+        """
+        Consolida e registra no log o mapeamento de cabeçalhos de um arquivo.
+
+        Parâmetros:
+        - caminho_arquivo (str): caminho do arquivo
+        - partes (list[pd.DataFrame]): abas normalizadas do arquivo
+
+        Retorno:
+        - None: não retorna valor
+        """
+        mapeamento = {}
+        for parte in partes:
+            mapeamento.update(parte.attrs.get(self.ATRIBUTO_MAPEAMENTO, {}))
+        self.mapeamentos_colunas[caminho_arquivo] = mapeamento
+
+        renomeadas = {bruto: canonico for bruto, canonico in mapeamento.items() if bruto != canonico}
+        logger.info(
+            f"Mapeamento de colunas ({os.path.basename(caminho_arquivo)}): "
+            f"{len(mapeamento)} colunas, {len(renomeadas)} renomeadas {renomeadas}"
+        )
+
+    def _ler_em_paralelo(self, arquivos: List[str], workers: int) -> List[List[pd.DataFrame]]:
+        """
+        Lê arquivos em um pool de processos, com uma tarefa por aba ou CSV.
+
+        Parâmetros:
+        - arquivos (list[str]): caminhos dos arquivos
+        - workers (int): máximo de processos
+
+        Retorno:
+        - list[list[pd.DataFrame]]: abas normalizadas por arquivo, na ordem recebida
+        """
+        tarefas = []
+        for indice, caminho_arquivo in enumerate(arquivos):
+            if caminho_arquivo.endswith(".xlsx"):
+                for nome_aba in self._listar_abas(caminho_arquivo):
+                    tarefas.append((indice, caminho_arquivo, nome_aba))
+            else:
+                tarefas.append((indice, caminho_arquivo, None))
+
+        resultados: List[List[pd.DataFrame]] = [[] for _ in arquivos]
+        if not tarefas:
+            return resultados
+
+        workers = min(workers, len(tarefas))
+        logger.info(f"Lendo {len(tarefas)} abas/arquivos em {workers} processos")
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            partes = executor.map(_executar_tarefa_leitura, [tarefa[1:] for tarefa in tarefas])
+            for (indice, _, _), parte in zip(tarefas, partes):
+                resultados[indice].extend(parte)
+
+        return resultados
+
+    @staticmethod
+    def _listar_abas(caminho_arquivo: str) -> List[str]:
+        """
+        Lista as abas de um Excel que contêm ano no nome.
+
+        Parâmetros:
+        - caminho_arquivo (str): caminho do arquivo
+
+        Retorno:
+        - list[str]: nomes das abas com ano
+
+        Exceções:
+        - Exception: quando a leitura falha
+        """
+        try:
+            with pd.ExcelFile(caminho_arquivo) as arquivo:
+                nomes = list(arquivo.sheet_names)
+        except Exception as erro:
+            logger.error(f"Erro crítico ao ler o Excel: {erro}")
+            raise erro
+
+        abas = []
+        for nome_aba in nomes:
+            if CarregadorDados._extrair_ano(nome_aba) is None:
+                logger.warning(f"Aba '{nome_aba}' ignorada (não contém ano no nome).")
+                continue
+            abas.append(nome_aba)
+        return abas
+
+    def _ler_tarefa(self, caminho_arquivo: str, nome_aba: Optional[str]) -> List[pd.DataFrame]:
+        """
+        Lê uma aba de um Excel ou um arquivo CSV inteiro.
+
+        Parâmetros:
+        - caminho_arquivo (str): caminho do arquivo
+        - nome_aba (str | None): aba do Excel; None para CSV
+
+        Retorno:
+        - list[pd.DataFrame]: abas normalizadas
+        """
+        if nome_aba is None:
+            return self._ler_arquivo(caminho_arquivo)
+
+        if self._usar_streaming(caminho_arquivo):
+            return self._ler_excel_streaming(caminho_arquivo, [nome_aba])
+
+        try:
+            df_aba = pd.read_excel(caminho_arquivo, sheet_name=nome_aba)
+        except Exception as erro:
+            logger.error(f"Erro crítico ao ler o Excel: {erro}")
+            raise erro
+        return self._processar_abas({nome_aba: df_aba})
+
+    def _ler_arquivo(self, caminho_arquivo: str) -> List[pd.DataFrame]:
+        """
+        Lê e normaliza um arquivo Excel ou CSV.
+
+        Leituras em blocos (CSV e Excel em streaming) devolvem os próprios
+        blocos, sem juntá-los por arquivo ou aba; a única junção é a de
+        `carregar_dados`.
+
+        Parâmetros:
+        - caminho_arquivo (str): caminho do arquivo
+
+        Retorno:
+        - list[pd.DataFrame]: abas ou blocos normalizados
+        """
+        if caminho_arquivo.endswith(".xlsx"):
+            logger.info(f"Carregando arquivo Excel: {caminho_arquivo}")
+            if self._usar_streaming(caminho_arquivo):
+                return self._ler_excel_streaming(caminho_arquivo)
+            abas = self._ler_excel(caminho_arquivo)
+            return self._processar_abas(abas)
+
+        logger.info(f"Carregando arquivo CSV: {caminho_arquivo}")
+        return list(self._ler_csv(caminho_arquivo))
+
+    @staticmethod
+    def _componentes_cache() -> list:
+        """
+        Lista o código e a configuração que definem as abas normalizadas,
+        para invalidar o cache quando mudarem.
+
+        Retorno:
+        - list: funções de leitura e normalização e a configuração do streaming
+        """
+        return [
+            CarregadorDados._ler_arquivo,
+            CarregadorDados._ler_tarefa,
+            CarregadorDados._ler_excel,
+            CarregadorDados._ler_csv,
+            CarregadorDados._amostrar_csv,
+            CarregadorDados._converter_numerica,
+            CarregadorDados._processar_abas,
+            CarregadorDados._extrair_ano,
+            CarregadorDados._processar_dataframe,
+            CarregadorDados._usar_streaming,
+            CarregadorDados._ler_excel_streaming,
+            CarregadorDados._ler_excel_em_blocos,
+            CarregadorDados._projetar_cabecalho,
+            CarregadorDados._montar_bloco,
+            CarregadorDados._converter_celula,
+            ResolvedorCabecalhos,
+            CarregadorDados.RESOLVEDOR_CABECALHOS.assinatura(),
+            # A escolha do streaming, as colunas projetadas e o tamanho dos blocos mudam as abas geradas.
+            f"{Configuracoes.EXCEL_STREAMING_MIN_BYTES}|{Configuracoes.COLUNAS_CARGA}|{Configuracoes.STREAM_CHUNK_SIZE}",
+            json.dumps(Configuracoes.ESQUEMA_CSV, sort_keys=True),
+        ]
+
     def _registrar_conteudo_pasta(self) -> None:
         """
         Registra o conteúdo da pasta de dados no log.
@@ -109,29 +401,299 @@ class CarregadorDados:
             logger.error(f"Erro crítico ao ler o Excel: {erro}")
             raise erro
 
-    @staticmethod
-    def _ler_csv(caminho_arquivo: str):
+    def _ler_csv(self, caminho_arquivo: str, tamanho_bloco: Optional[int] = None) -> Iterator[pd.DataFrame]:
         """
-        Lê um arquivo CSV.
+        Lê um arquivo CSV em blocos normalizados.
+
+        Separador, separador decimal e ano são detectados em uma amostra do início
+        do arquivo, que é lido uma única vez; colunas conhecidas seguem `ESQUEMA_CSV`.
 
         Parâmetros:
         - caminho_arquivo (str): caminho do arquivo
+        - tamanho_bloco (int | None): linhas por bloco (padrão: STREAM_CHUNK_SIZE)
 
         Retorno:
-        - pd.DataFrame | None: DataFrame lido
+        - Iterator[pd.DataFrame]: blocos normalizados
+
+        Exceções:
+        - Exception: quando a leitura falha
         """
+        tamanho_bloco = tamanho_bloco or Configuracoes.STREAM_CHUNK_SIZE
         try:
-            try:
-                df = pd.read_csv(caminho_arquivo, sep=";")
-                if len(df.columns) <= 1:
-                    df = pd.read_csv(caminho_arquivo, sep=",")
-            except Exception:
-                df = pd.read_csv(caminho_arquivo, sep=",")
-            return df
+            separador, decimal, cabecalho, ano_completo = self._amostrar_csv(caminho_arquivo)
+
+            textos, numericas = {}, {}
+            for coluna in cabecalho:
+                canonica = self.RESOLVEDOR_CABECALHOS.resolver(coluna, ano_completo)
+                tipo = Configuracoes.ESQUEMA_CSV.get(canonica)
+                if tipo == "str":
+                    textos[coluna] = tipo
+                elif tipo is not None:
+                    numericas[canonica] = tipo
+
+            leitor = pd.read_csv(
+                caminho_arquivo, sep=separador, decimal=decimal, dtype=textos, chunksize=tamanho_bloco
+            )
+            with leitor:
+                for bloco in leitor:
+                    bloco["ANO_REFERENCIA"] = bloco.get("ANO_REFERENCIA", ano_completo)
+                    bloco = self._processar_dataframe(bloco, ano_completo)
+                    for coluna, tipo in numericas.items():
+                        if coluna in bloco.columns:
+                            bloco[coluna] = self._converter_numerica(bloco[coluna], decimal, tipo)
+                    yield bloco
         except Exception as erro:
             logger.error(f"Erro crítico ao ler o CSV: {erro}")
             raise erro
 
+    @staticmethod
+    def _converter_numerica(serie: pd.Series, decimal: str, tipo: str) -> pd.Series:
+        """
+        Converte uma coluna do esquema para o tipo numérico, anulando valores inválidos.
+
+        Parâmetros:
+        - serie (pd.Series): coluna lida do bloco
+        - decimal (str): separador decimal do arquivo
+        - tipo (str): tipo numérico do esquema
+
+        Retorno:
+        - pd.Series: coluna convertida
+        """
+        if decimal != "." and not pd.api.types.is_numeric_dtype(serie):
+            serie = serie.astype(str).str.replace(decimal, ".", regex=False)
+        return pd.to_numeric(serie, errors="coerce").astype(tipo)
+
+    @classmethod
+    def _amostrar_csv(cls, caminho_arquivo: str) -> Tuple[str, str, List[str], int]:
+        """
+        Detecta o formato de um CSV a partir de uma amostra do início do arquivo.
+
+        O separador é `;` quando ele divide o cabeçalho em mais de uma coluna e `,`
+        caso contrário; com `;`, vírgula entre dígitos indica decimal brasileiro.
+
+        Parâmetros:
+        - caminho_arquivo (str): caminho do arquivo
+
+        Retorno:
+        - tuple[str, str, list[str], int]: separador, decimal, cabeçalho e ano de referência
+        """
+        with open(caminho_arquivo, "rb") as arquivo:
+            amostra = arquivo.read(cls.TAMANHO_AMOSTRA_CSV).decode("utf-8", errors="ignore")
+
+        linhas = amostra.splitlines()
+        if len(amostra) == cls.TAMANHO_AMOSTRA_CSV and len(linhas) > 1:
+            linhas = linhas[:-1]
+        if not linhas:
+            return ",", ".", [], datetime.now().year
+
+        separador = ";" if len(next(csv.reader([linhas[0]], delimiter=";"))) > 1 else ","
+        registros = list(csv.reader(linhas, delimiter=separador))
+        cabecalho, valores = registros[0], [campo.strip() for registro in registros[1:] for campo in registro]
+
+        decimal = "."
+        if separador == ";":
+            virgula = any(re.fullmatch(r"-?\d+,\d+", valor) for valor in valores)
+            ponto = any(re.fullmatch(r"-?\d+\.\d+", valor) for valor in valores)
+            decimal = "," if virgula and not ponto else "."
+
+        ano_completo = datetime.now().year
+        if "ANO_REFERENCIA" in cabecalho and len(registros) > 1:
+            valor_ano = registros[1][cabecalho.index("ANO_REFERENCIA")]
+            ano_completo = int(float(valor_ano.replace(",", ".")))
+
+        return separador, decimal, cabecalho, ano_completo
+
+    @staticmethod
+    def _usar_streaming(caminho_arquivo: str) -> bool:
+        """
+        Indica se um Excel deve ser lido em streaming.
+
+        Parâmetros:
+        - caminho_arquivo (str): caminho do arquivo
+
+        Retorno:
+        - bool: True quando o arquivo atinge EXCEL_STREAMING_MIN_BYTES
+        """
+        try:
+            return os.path.getsize(caminho_arquivo) >= Configuracoes.EXCEL_STREAMING_MIN_BYTES
+        except OSError:
+            return False
+
+    def _ler_excel_streaming(
+        self, caminho_arquivo: str, nomes_abas: Optional[Sequence[str]] = None
+    ) -> List[pd.DataFrame]:
+        """
+        Lê um Excel em streaming, mantendo cada bloco como uma parte.
+
+        Os blocos não são juntados por aba: cada um já chega projetado e
+        tipado, e só a junção final de `carregar_dados` os reúne.
+
+        Parâmetros:
+        - caminho_arquivo (str): caminho do arquivo
+        - nomes_abas (Sequence[str] | None): abas a ler (padrão: todas com ano)
+
+        Retorno:
+        - list[pd.DataFrame]: blocos normalizados e projetados, na ordem das abas
+        """
+        return [bloco for _, bloco in self._ler_excel_em_blocos(caminho_arquivo, nomes_abas)]
+
+    def _ler_excel_em_blocos(
+        self,
+        caminho_arquivo: str,
+        nomes_abas: Optional[Sequence[str]] = None,
+        colunas: Optional[Sequence[str]] = None,
+        tamanho_bloco: Optional[int] = None,
+    ) -> Iterator[Tuple[str, pd.DataFrame]]:
+        """
+        Percorre as linhas de um Excel em modo somente leitura, gerando blocos por aba.
+
+        O cabeçalho é normalizado na primeira linha e apenas as colunas projetadas
+        são materializadas; no máximo `tamanho_bloco` linhas ficam em memória por vez.
+
+        Parâmetros:
+        - caminho_arquivo (str): caminho do arquivo
+        - nomes_abas (Sequence[str] | None): abas a ler (padrão: todas com ano)
+        - colunas (Sequence[str] | None): colunas normalizadas mantidas (padrão: COLUNAS_CARGA)
+        - tamanho_bloco (int | None): linhas por bloco (padrão: STREAM_CHUNK_SIZE)
+
+        Retorno:
+        - Iterator[tuple[str, pd.DataFrame]]: nome da aba e bloco normalizado
+
+        Exceções:
+        - Exception: quando a leitura falha
+        """
+        colunas = set(Configuracoes.COLUNAS_CARGA if colunas is None else colunas)
+        tamanho_bloco = tamanho_bloco or Configuracoes.STREAM_CHUNK_SIZE
+
+        try:
+            livro = openpyxl.load_workbook(caminho_arquivo, read_only=True, data_only=True, keep_links=False)
+        except Exception as erro:
+            logger.error(f"Erro crítico ao ler o Excel: {erro}")
+            raise erro
+
+        try:
+            for nome_aba in livro.sheetnames:
+                if nomes_abas is not None and nome_aba not in nomes_abas:
+                    continue
+
+                ano_completo = self._extrair_ano(nome_aba)
+                if ano_completo is None:
+                    logger.warning(f"Aba '{nome_aba}' ignorada (não contém ano no nome).")
+                    continue
+
+                logger.info(f"Processando aba em streaming: {nome_aba} (Ano {ano_completo})")
+                aba = livro[nome_aba]
+                aba.reset_dimensions()
+                linhas = aba.iter_rows(values_only=True)
+                cabecalho = next(linhas, None)
+                if cabecalho is None:
+                    continue
+
+                nomes, posicoes, mapeamento = self._projetar_cabecalho(cabecalho, ano_completo, colunas)
+                bloco = []
+                emitidos = 0
+                for linha in linhas:
+                    if all(valor is None for valor in linha):
+                        continue
+                    bloco.append(
+                        [self._converter_celula(linha[posicao]) if posicao < len(linha) else "" for posicao in posicoes]
+                    )
+                    if len(bloco) >= tamanho_bloco:
+                        yield nome_aba, self._montar_bloco(nomes, bloco, ano_completo, mapeamento)
+                        emitidos += 1
+                        bloco = []
+
+                if bloco or not emitidos:
+                    yield nome_aba, self._montar_bloco(nomes, bloco, ano_completo, mapeamento)
+        finally:
+            livro.close()
+
+    @staticmethod
+    def _projetar_cabecalho(
+        cabecalho: Sequence, ano_completo: int, colunas: set
+    ) -> Tuple[List[str], List[int], Dict[str, str]]:
+        """
+        Seleciona as colunas do cabeçalho cujo nome normalizado está na projeção.
+
+        Nomes repetidos recebem sufixo como no `pd.read_excel`; entre colunas
+        com o mesmo nome normalizado, a primeira é mantida.
+
+        Parâmetros:
+        - cabecalho (Sequence): valores da primeira linha
+        - ano_completo (int): ano da aba
+        - colunas (set): nomes normalizados mantidos
+
+        Retorno:
+        - tuple[list[str], list[int], dict[str, str]]: nomes originais e posições mantidas
+          e o mapeamento de todo o cabeçalho
+        """
+        nomes, posicoes = [], []
+        mapeamento = {}
+        ocorrencias = {}
+        normalizados = set()
+
+        for posicao, valor in enumerate(cabecalho):
+            valor = CarregadorDados._converter_celula(valor)
+            nome = f"Unnamed: {posicao}" if valor == "" else str(valor)
+            if nome in ocorrencias:
+                ocorrencias[nome] += 1
+                nome = f"{nome}.{ocorrencias[nome]}"
+            else:
+                ocorrencias[nome] = 0
+
+            normalizado = CarregadorDados.RESOLVEDOR_CABECALHOS.resolver(nome, ano_completo)
+            mapeamento[nome] = normalizado
+            if normalizado in colunas and normalizado not in normalizados:
+                normalizados.add(normalizado)
+                nomes.append(nome)
+                posicoes.append(posicao)
+
+        return nomes, posicoes, mapeamento
+
+    @staticmethod
+    def _montar_bloco(
+        nomes: List[str], linhas: List[list], ano_completo: int, mapeamento: Dict[str, str]
+    ) -> pd.DataFrame:
+        """
+        Converte um bloco de linhas em DataFrame normalizado.
+
+        A inferência de tipos e de nulos é a mesma do `pd.read_excel`.
+
+        Parâmetros:
+        - nomes (list[str]): nomes originais das colunas
+        - linhas (list[list]): valores das linhas
+        - ano_completo (int): ano da aba
+        - mapeamento (dict[str, str]): mapeamento do cabeçalho completo, inclusive colunas descartadas
+
+        Retorno:
+        - pd.DataFrame: bloco normalizado
+        """
+        with TextParser([nomes] + linhas, header=0) as leitor:
+            df = leitor.read()
+        df = CarregadorDados._processar_dataframe(df, ano_completo)
+        df["ANO_REFERENCIA"] = ano_completo
+        df.attrs[CarregadorDados.ATRIBUTO_MAPEAMENTO] = mapeamento
+        return df
+
+    @staticmethod
+    def _converter_celula(valor):
+        """
+        Converte o valor de uma célula como o leitor openpyxl do pandas.
+
+        Parâmetros:
+        - valor (Any): valor lido da célula
+
+        Retorno:
+        - Any: valor convertido (vazio vira "", erro vira NaN e float inteiro vira int)
+        """
+        if valor is None:
+            return ""
+        if isinstance(valor, str) and valor in ERROR_CODES:
+            return np.nan
+        if isinstance(valor, float) and valor.is_integer():
+            return int(valor)
+        return valor
+
     def _processar_abas(self, abas: dict):
         """
         Processa abas válidas e retorna lista de DataFrames.
@@ -145,13 +707,12 @@ class CarregadorDados:
         dados = []
 
         for nome_aba, df_aba in abas.items():
-            ano_match = re.search(r"202\d", nome_aba)
+            ano_completo = self._extrair_ano(nome_aba)
 
-            if not ano_match:
+            if ano_completo is None:
                 logger.warning(f"Aba '{nome_aba}' ignorada (não contém ano no nome).")
                 continue
 
-            ano_completo = int(ano_match.group())
             logger.info(f"Processando aba: {nome_aba} (Ano {ano_completo})")
 
             df_processado = self._processar_dataframe(df_aba, ano_completo)
@@ -161,11 +722,30 @@ class CarregadorDados:
 
         return dados
 
+    @staticmethod
+    def _extrair_ano(nome_aba: str) -> Optional[int]:
+        """
+        Extrai o ano de referência do nome de uma aba.
+
+        Parâmetros:
+        - nome_aba (str): nome da aba
+
+        Retorno:
+        - int | None: ano encontrado ou None
+        """
+        ano_match = re.search(r"202\d", str(nome_aba))
+        return int(ano_match.group()) if ano_match else None
+
     @staticmethod
     def _processar_dataframe(df: pd.DataFrame, ano_completo: int) -> pd.DataFrame:
         """
         Normaliza colunas e dados de uma aba.
 
+        O mapeamento cabeçalho bruto -> nome canônico fica em
+        `df.attrs["mapeamento_colunas"]`. Só as colunas de COLUNAS_CARGA são
+        mantidas, como na leitura em streaming, para que o resultado não
+        dependa do caminho de leitura.
+
         Parâmetros:
         - df (pd.DataFrame): dados da aba
         - ano_completo (int): ano da referência
@@ -173,43 +753,29 @@ class CarregadorDados:
         Retorno:
         - pd.DataFrame: DataFrame processado
         """
-        novas_colunas = []
-        ano_curto = int(str(ano_completo)[-2:])
-
-        for coluna in df.columns:
-            coluna_limpa = str(coluna).upper().strip()
-            coluna_limpa = unicodedata.normalize("NFKD", coluna_limpa).encode("ASCII", "ignore").decode("utf-8")
-            coluna_limpa = re.sub(f"[ _]{ano_completo}", "", coluna_limpa)
-            coluna_limpa = re.sub(f"[ _]{ano_curto}$", "", coluna_limpa)
-
-            if coluna_limpa in ["RA", "ID_ALUNO", "CODIGO_ALUNO", "MATRICULA"]:
-                coluna_limpa = "RA"
-            elif coluna_limpa in ["MAT", "MATEM", "MATEMATICA"]:
-                coluna_limpa = "NOTA_MAT"
-            elif coluna_limpa in ["POR", "PORT", "PORTUG", "PORTUGUES"]:
-                coluna_limpa = "NOTA_PORT"
-            elif coluna_limpa in ["ING", "INGL", "INGLES"]:
-                coluna_limpa = "NOTA_ING"
-            elif coluna_limpa in ["DEFAS", "DEFASAGEM"]:
-                coluna_limpa = "DEFASAGEM"
-            elif "ANO" in coluna_limpa and "INGRESSO" in coluna_limpa:
-                coluna_limpa = "ANO_INGRESSO"
-
-            if "INST" in coluna_limpa and "ENSINO" in coluna_limpa:
-                coluna_limpa = "INSTITUICAO_ENSINO"
-            if "PONTO" in coluna_limpa and "VIRADA" in coluna_limpa:
-                coluna_limpa = "PONTO_VIRADA"
-            if "PSICOLOGIA" in coluna_limpa and "REC" in coluna_limpa:
-                coluna_limpa = "REC_PSICOLOGIA"
-
-            novas_colunas.append(coluna_limpa)
-
-        df.columns = novas_colunas
-
-        if df.columns.duplicated().any():
-            df = df.loc[:, ~df.columns.duplicated()]
+        mapeamento = CarregadorDados.RESOLVEDOR_CABECALHOS.mapear(df.columns, ano_completo)
+        df.columns = list(mapeamento.values())
+        df.attrs[CarregadorDados.ATRIBUTO_MAPEAMENTO] = mapeamento
+
+        mantidas = ~df.columns.duplicated() & df.columns.isin(Configuracoes.COLUNAS_CARGA)
+        if not mantidas.all():
+            df = df.loc[:, mantidas]
 
         if "RA" in df.columns:
             df["RA"] = df["RA"].astype(str).str.strip()
 
         return df
+
+
+def _executar_tarefa_leitura(tarefa: Tuple[str, Optional[str]]) -> List[pd.DataFrame]:
+    """
+    Ponto de entrada dos processos de leitura.
+
+    Parâmetros:
+    - tarefa (tuple): caminho do arquivo e nome da aba (None para CSV)
+
+    Retorno:
+    - list[pd.DataFrame]: abas normalizadas
+    """
+    caminho_arquivo, nome_aba = tarefa
+    return CarregadorDados(cache=CacheDadosBrutos(habilitado=False))._ler_tarefa(caminho_arquivo, nome_aba)
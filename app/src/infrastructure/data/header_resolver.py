@@ -0,0 +1,133 @@
+"""
+Resolução de cabeçalhos das planilhas para os nomes canônicos.
+
+Responsabilidades:
+- Declarar a tabela de apelidos das colunas
+- Compilar uma única vez os padrões de remoção do ano
+- Memorizar a resolução de cada cabeçalho bruto
+"""
+
+import re
+import unicodedata
+from functools import lru_cache
+from typing import Dict, Iterable, Mapping, Optional, Sequence, Tuple
+
+
+class ResolvedorCabecalhos:
+    """
+    Converte cabeçalhos brutos em nomes canônicos a partir de uma tabela declarativa.
+
+    Responsabilidades:
+    - Normalizar caixa, espaços e acentos
+    - Remover o sufixo do ano da aba
+    - Aplicar apelidos exatos e regras por termos contidos
+    """
+
+    # Nome canônico -> cabeçalhos aceitos (após normalização e remoção do ano).
+    APELIDOS: Mapping[str, Sequence[str]] = {
+        "RA": ("RA", "ID_ALUNO", "CODIGO_ALUNO", "MATRICULA"),
+        "NOTA_MAT": ("MAT", "MATEM", "MATEMATICA"),
+        "NOTA_PORT": ("POR", "PORT", "PORTUG", "PORTUGUES"),
+        "NOTA_ING": ("ING", "INGL", "INGLES"),
+        "DEFASAGEM": ("DEFAS", "DEFASAGEM"),
+    }
+
+    # Aplicadas em ordem sobre o nome corrente: todos os termos presentes -> nome canônico.
+    REGRAS_TERMOS: Sequence[Tuple[Sequence[str], str]] = (
+        (("ANO", "INGRESSO"), "ANO_INGRESSO"),
+        (("INST", "ENSINO"), "INSTITUICAO_ENSINO"),
+        (("PONTO", "VIRADA"), "PONTO_VIRADA"),
+        (("PSICOLOGIA", "REC"), "REC_PSICOLOGIA"),
+    )
+
+    TAMANHO_MEMORIA = 8192
+
+    def __init__(
+        self,
+        apelidos: Optional[Mapping[str, Sequence[str]]] = None,
+        regras_termos: Optional[Sequence[Tuple[Sequence[str], str]]] = None,
+    ):
+        """
+        Compila a tabela de apelidos.
+
+        Parâmetros:
+        - apelidos (Mapping | None): nome canônico -> apelidos (padrão: APELIDOS)
+        - regras_termos (Sequence | None): termos -> nome canônico (padrão: REGRAS_TERMOS)
+        """
+        apelidos = self.APELIDOS if apelidos is None else apelidos
+        regras_termos = self.REGRAS_TERMOS if regras_termos is None else regras_termos
+
+        self._apelidos = {apelido: canonico for canonico, lista in apelidos.items() for apelido in lista}
+        self._regras = tuple((tuple(termos), canonico) for termos, canonico in regras_termos)
+        self._resolver = lru_cache(maxsize=self.TAMANHO_MEMORIA)(self._resolver_sem_memoria)
+
+    def resolver(self, coluna, ano_completo: int) -> str:
+        """
+        Resolve o nome canônico de um cabeçalho.
+
+        Parâmetros:
+        - coluna (Any): cabeçalho bruto
+        - ano_completo (int): ano da aba
+
+        Retorno:
+        - str: nome canônico
+        """
+        return self._resolver(str(coluna), int(ano_completo))
+
+    def assinatura(self) -> str:
+        """
+        Descreve as tabelas compiladas, para compor chaves de cache.
+
+        Retorno:
+        - str: apelidos e regras em ordem determinística
+        """
+        return repr((sorted(self._apelidos.items()), self._regras))
+
+    def mapear(self, colunas: Iterable, ano_completo: int) -> Dict[str, str]:
+        """
+        Resolve um cabeçalho completo.
+
+        Parâmetros:
+        - colunas (Iterable): cabeçalhos brutos
+        - ano_completo (int): ano da aba
+
+        Retorno:
+        - dict[str, str]: cabeçalho bruto -> nome canônico
+        """
+        return {str(coluna): self.resolver(coluna, ano_completo) for coluna in colunas}
+
+    def _resolver_sem_memoria(self, coluna: str, ano_completo: int) -> str:
+        """
+        Aplica normalização, remoção do ano e tabela de apelidos.
+
+        Parâmetros:
+        - coluna (str): cabeçalho bruto
+        - ano_completo (int): ano da aba
+
+        Retorno:
+        - str: nome canônico
+        """
+        nome = unicodedata.normalize("NFKD", coluna.upper().strip()).encode("ASCII", "ignore").decode("utf-8")
+        padrao_ano, padrao_ano_curto = self._padroes_ano(ano_completo)
+        nome = padrao_ano_curto.sub("", padrao_ano.sub("", nome))
+
+        nome = self._apelidos.get(nome, nome)
+        for termos, canonico in self._regras:
+            if all(termo in nome for termo in termos):
+                nome = canonico
+        return nome
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _padroes_ano(ano_completo: int) -> Tuple[re.Pattern, re.Pattern]:
+        """
+        Compila os padrões que removem o ano completo e o ano curto do cabeçalho.
+
+        Parâmetros:
+        - ano_completo (int): ano da aba
+
+        Retorno:
+        - tuple[re.Pattern, re.Pattern]: ano completo em qualquer posição e ano curto no final
+        """
+        ano_curto = int(str(ano_completo)[-2:])
+        return re.compile(f"[ _]{ano_completo}"), re.compile(f"[ _]{ano_curto}$")
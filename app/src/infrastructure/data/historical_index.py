@@ -0,0 +1,715 @@
+"""
+Índice em memória do histórico acadêmico.
+
+Responsabilidades:
+- Manter os registros de cada aluno ordenados por ano
+- Responder consultas por RA em tempo constante
+- Resolver consultas pontuais no tempo por busca binária
+- Resolver consultas em lote com uma única coleta vetorizada
+- Incorporar registros novos em um delta, sem reconstruir o índice base
+- Gravar e abrir snapshots colunares com memory-map
+"""
+
+import json
+import os
+import shutil
+import uuid
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.config.settings import Configuracoes
+
+
+class IndiceHistorico:
+    """
+    Índice imutável de histórico por (RA, ANO_REFERENCIA).
+
+    Os registros ficam em blocos contíguos por RA, ordenados por ano. A chave
+    de posição i (em ordem crescente de RA) aponta para o intervalo
+    [limites[i], limites[i + 1]) do seu bloco.
+
+    Atualizações incrementais ficam em um índice delta com o histórico
+    completo dos RAs alterados; nas consultas, o delta tem precedência.
+
+    Responsabilidades:
+    - Construir o índice a partir do histórico
+    - Buscar o registro mais recente estritamente anterior a um ano
+    - Persistir o índice como snapshot compartilhável entre processos
+    """
+
+    COLUNAS_LAG = [f"{metrica}_ANTERIOR" for metrica in Configuracoes.METRICAS_HISTORICAS]
+    ARQUIVO_MANIFESTO = "manifesto.json"
+    ARQUIVO_ATUAL = "ATUAL"
+    PREFIXO_DELTA = "delta-"
+    ARRAYS_SNAPSHOT = ("chaves", "limites", "anos", "valores")
+    VERSAO_SNAPSHOT = 2
+    DTYPE_ANOS = np.int16
+    DTYPE_VALORES = np.float32
+    # float32 guarda ~7 dígitos significativos; a leitura arredonda para não expor ruído de conversão.
+    CASAS_DECIMAIS = 6
+
+    def __init__(
+        self,
+        chaves: np.ndarray,
+        limites: np.ndarray,
+        anos: np.ndarray,
+        valores: np.ndarray,
+        posicoes: Optional[Dict[str, int]] = None,
+        delta: Optional["IndiceHistorico"] = None,
+        revisao: int = 0,
+    ):
+        """
+        Inicializa o índice.
+
+        Parâmetros:
+        - chaves (np.ndarray): RAs distintos em ordem crescente
+        - limites (np.ndarray): início de cada bloco, com o total de registros ao final
+        - anos (np.ndarray): ANO_REFERENCIA de cada registro, crescente dentro do bloco
+        - valores (np.ndarray): métricas de cada registro (registros x métricas)
+        - posicoes (dict | None): RA -> posição; sem ele a busca de RA é binária
+        - delta (IndiceHistorico | None): histórico dos RAs atualizados incrementalmente
+        - revisao (int): contador de atualizações incrementais aplicadas
+        """
+        self._chaves = chaves
+        self._limites = limites
+        self._anos = anos
+        self._valores = valores
+        self._posicoes = posicoes
+        self._delta = delta
+        self.revisao = revisao
+        self._chaves_compostas: Optional[np.ndarray] = None
+        self._alunos_somente_delta = 0
+        if delta is not None:
+            self._alunos_somente_delta = int((~self._contem(delta._chaves)).sum())
+
+    def __len__(self) -> int:
+        """Quantidade de alunos indexados."""
+        return len(self._chaves) + self._alunos_somente_delta
+
+    @classmethod
+    def construir(cls, dados: pd.DataFrame) -> "IndiceHistorico":
+        """
+        Constrói o índice a partir do histórico completo.
+
+        Parâmetros:
+        - dados (pd.DataFrame): histórico com RA e ANO_REFERENCIA
+
+        Apenas RA, ANO_REFERENCIA e as métricas históricas são mantidos, com
+        anos em int16 e métricas em float32. Para o mesmo (RA, ano), prevalece
+        o último registro.
+
+        Retorno:
+        - IndiceHistorico: índice pronto para consulta
+        """
+        metricas = [metrica for metrica in Configuracoes.METRICAS_HISTORICAS if metrica in dados.columns]
+        anos = pd.to_numeric(dados["ANO_REFERENCIA"], errors="coerce")
+        mascara_validos = anos.notna().to_numpy()
+        validos = dados.loc[mascara_validos, ["RA", *metricas]].copy()
+        validos["ANO_REFERENCIA"] = anos[mascara_validos].to_numpy(dtype=np.int64)
+        validos["RA"] = validos["RA"].astype(str)
+        validos = validos.drop_duplicates(subset=["RA", "ANO_REFERENCIA"], keep="last")
+
+        ras = np.asarray(validos["RA"].to_numpy(), dtype=str)
+        ordem = np.lexsort((validos["ANO_REFERENCIA"].to_numpy(), ras))
+        ras = ras[ordem]
+        ordenados = validos.iloc[ordem]
+
+        inicio_bloco = np.ones(len(ras), dtype=bool)
+        inicio_bloco[1:] = ras[1:] != ras[:-1]
+        inicios = np.flatnonzero(inicio_bloco)
+        chaves = ras[inicios]
+
+        valores = np.column_stack([
+            cls._coluna_numerica(ordenados, metrica) for metrica in Configuracoes.METRICAS_HISTORICAS
+        ]).astype(cls.DTYPE_VALORES)
+
+        return cls(
+            chaves=chaves,
+            limites=np.append(inicios, len(ras)).astype(np.int64),
+            anos=ordenados["ANO_REFERENCIA"].to_numpy().astype(cls.DTYPE_ANOS),
+            valores=valores,
+            posicoes=cls._mapear_posicoes(chaves),
+        )
+
+    @classmethod
+    def abrir_snapshot(cls, diretorio: str) -> "IndiceHistorico":
+        """
+        Abre a versão atual de um snapshot gravado por `salvar_snapshot`.
+
+        Os arrays são abertos com memory-map somente leitura, ficando no page
+        cache do sistema operacional e compartilhados entre os processos. O
+        mapa RA -> posição é refeito na abertura (O(n) uma vez, em heap de
+        cada processo) para manter a busca de RA em tempo constante.
+
+        Parâmetros:
+        - diretorio (str): diretório raiz do snapshot
+
+        Retorno:
+        - IndiceHistorico: índice somente leitura sobre os arquivos
+
+        Exceções:
+        - FileNotFoundError: quando não há snapshot publicado
+        - ValueError: quando o snapshot é de outra versão ou outras métricas
+        """
+        diretorio_versao = cls._diretorio_versao_atual(diretorio)
+        manifesto = cls._ler_json(os.path.join(diretorio_versao, cls.ARQUIVO_MANIFESTO))
+        compativel = (
+            manifesto.get("versao") == cls.VERSAO_SNAPSHOT
+            and manifesto.get("metricas") == Configuracoes.METRICAS_HISTORICAS
+        )
+        if not compativel:
+            raise ValueError(f"Snapshot incompatível em {diretorio_versao}")
+
+        delta = None
+        if manifesto.get("delta"):
+            arrays_delta = cls._abrir_arrays(os.path.join(diretorio_versao, manifesto["delta"]))
+            delta = cls(**arrays_delta, posicoes=cls._mapear_posicoes(arrays_delta["chaves"]))
+        arrays = cls._abrir_arrays(diretorio_versao)
+        return cls(
+            **arrays,
+            posicoes=cls._mapear_posicoes(arrays["chaves"]),
+            delta=delta,
+            revisao=int(manifesto.get("revisao", 0)),
+        )
+
+    @staticmethod
+    def _mapear_posicoes(chaves: np.ndarray) -> Dict[str, int]:
+        """
+        Monta o mapa RA -> posição do bloco.
+
+        Parâmetros:
+        - chaves (np.ndarray): RAs distintos em ordem crescente
+
+        Retorno:
+        - dict: posição de cada RA em `chaves`
+        """
+        return dict(zip(chaves.tolist(), range(len(chaves))))
+
+    @classmethod
+    def _abrir_arrays(cls, diretorio: str) -> Dict[str, np.ndarray]:
+        """
+        Abre os arrays de um índice gravado com memory-map somente leitura.
+
+        Parâmetros:
+        - diretorio (str): diretório com os arquivos .npy
+
+        Retorno:
+        - dict: arrays nomeados como os parâmetros do construtor
+        """
+        return {
+            nome: np.load(os.path.join(diretorio, f"{nome}.npy"), mmap_mode="r")
+            for nome in cls.ARRAYS_SNAPSHOT
+        }
+
+    @classmethod
+    def _gravar_arrays(cls, indice: "IndiceHistorico", diretorio: str) -> None:
+        """
+        Grava os arrays de um índice (sem delta) em um diretório.
+
+        Parâmetros:
+        - indice (IndiceHistorico): índice a gravar
+        - diretorio (str): diretório de destino, já existente
+        """
+        for nome in cls.ARRAYS_SNAPSHOT:
+            np.save(
+                os.path.join(diretorio, f"{nome}.npy"),
+                np.ascontiguousarray(getattr(indice, f"_{nome}")),
+            )
+
+    @classmethod
+    def ler_manifesto(cls, diretorio: str) -> Dict[str, Any]:
+        """
+        Lê o manifesto da versão atual de um snapshot.
+
+        Parâmetros:
+        - diretorio (str): diretório raiz do snapshot
+
+        Retorno:
+        - dict: conteúdo do manifesto
+        """
+        diretorio_versao = cls._diretorio_versao_atual(diretorio)
+        return cls._ler_json(os.path.join(diretorio_versao, cls.ARQUIVO_MANIFESTO))
+
+    def salvar_snapshot(self, diretorio: str, origem: Any = None) -> None:
+        """
+        Grava o índice como uma nova versão do snapshot e a publica.
+
+        Cada versão fica em um subdiretório próprio e o arquivo ATUAL aponta
+        para a versão publicada, trocado com `os.replace`. Processos que já
+        abriram uma versão anterior continuam lendo seus próprios arquivos.
+        Um delta pendente é incorporado antes da gravação.
+
+        Parâmetros:
+        - diretorio (str): diretório raiz do snapshot
+        - origem (Any): descrição serializável dos arquivos de origem
+        """
+        if self._delta is not None:
+            self.compactar().salvar_snapshot(diretorio, origem)
+            return
+
+        versao = uuid.uuid4().hex
+        diretorio_versao = os.path.join(diretorio, versao)
+        os.makedirs(diretorio_versao)
+
+        try:
+            self._gravar_arrays(self, diretorio_versao)
+            manifesto = {
+                "versao": self.VERSAO_SNAPSHOT,
+                "metricas": Configuracoes.METRICAS_HISTORICAS,
+                "alunos": int(len(self._chaves)),
+                "registros": int(len(self._anos)),
+                "origem": origem,
+                "revisao": self.revisao,
+            }
+            self._gravar_manifesto(diretorio_versao, manifesto)
+        except Exception:
+            shutil.rmtree(diretorio_versao, ignore_errors=True)
+            raise
+
+        ponteiro_temporario = os.path.join(diretorio, f"{self.ARQUIVO_ATUAL}.{versao}")
+        with open(ponteiro_temporario, "w") as arquivo:
+            arquivo.write(versao)
+        os.replace(ponteiro_temporario, os.path.join(diretorio, self.ARQUIVO_ATUAL))
+
+        self._remover_versoes_antigas(diretorio, versao)
+
+    def salvar_delta(self, diretorio: str) -> None:
+        """
+        Grava apenas o delta na versão publicada do snapshot.
+
+        O custo é proporcional ao delta, não ao histórico. O delta vai para um
+        subdiretório novo e o manifesto passa a apontá-lo com `os.replace`. A
+        origem do manifesto é mantida: ela descreve os arquivos que geraram a
+        base, não os registros do delta.
+
+        Parâmetros:
+        - diretorio (str): diretório raiz do snapshot
+
+        Exceções:
+        - ValueError: quando o índice não tem delta
+        - FileNotFoundError: quando não há snapshot publicado
+        """
+        if self._delta is None:
+            raise ValueError("Índice sem delta para gravar.")
+
+        diretorio_versao = self._diretorio_versao_atual(diretorio)
+        manifesto = self._ler_json(os.path.join(diretorio_versao, self.ARQUIVO_MANIFESTO))
+        nome_delta = f"{self.PREFIXO_DELTA}{uuid.uuid4().hex}"
+        diretorio_delta = os.path.join(diretorio_versao, nome_delta)
+        os.makedirs(diretorio_delta)
+
+        try:
+            self._gravar_arrays(self._delta, diretorio_delta)
+        except Exception:
+            shutil.rmtree(diretorio_delta, ignore_errors=True)
+            raise
+
+        delta_anterior = manifesto.get("delta")
+        manifesto.update({"delta": nome_delta, "revisao": self.revisao})
+        self._gravar_manifesto(diretorio_versao, manifesto)
+
+        # Mantém o delta anterior para processos que ainda estão abrindo a versão antiga do manifesto.
+        for nome in os.listdir(diretorio_versao):
+            if nome.startswith(self.PREFIXO_DELTA) and nome not in (nome_delta, delta_anterior):
+                shutil.rmtree(os.path.join(diretorio_versao, nome), ignore_errors=True)
+
+    def atualizar(self, novos: pd.DataFrame) -> Tuple["IndiceHistorico", Dict[str, int]]:
+        """
+        Incorpora registros novos ou alterados, gerando um novo índice.
+
+        Só os RAs com registros inseridos ou alterados têm o histórico
+        reconstruído, no delta; o índice base é compartilhado sem cópia.
+
+        Parâmetros:
+        - novos (pd.DataFrame): registros com RA normalizado e ANO_REFERENCIA
+
+        Retorno:
+        - tuple: (novo índice ou o próprio quando nada mudou, relatório com
+          received, inserted, updated, unchanged e students_affected)
+        """
+        registros = self._normalizar_registros(novos)
+        relatorio = {
+            "received": int(len(novos)),
+            "inserted": 0,
+            "updated": 0,
+            "unchanged": 0,
+            "students_affected": 0,
+        }
+        if registros.empty:
+            return self, relatorio
+
+        atuais = self._registros(pd.unique(registros["RA"]))
+        comparacao = registros.merge(
+            atuais, on=["RA", "ANO_REFERENCIA"], how="left", suffixes=("", "_ATUAL"), indicator=True
+        )
+        existentes = (comparacao["_merge"] == "both").to_numpy()
+        iguais = existentes.copy()
+        for metrica in Configuracoes.METRICAS_HISTORICAS:
+            iguais &= (
+                comparacao[metrica].to_numpy(dtype=self.DTYPE_VALORES)
+                == comparacao[f"{metrica}_ATUAL"].to_numpy(dtype=self.DTYPE_VALORES)
+            )
+
+        relatorio["inserted"] = int((~existentes).sum())
+        relatorio["updated"] = int((existentes & ~iguais).sum())
+        relatorio["unchanged"] = int(iguais.sum())
+
+        alterados = registros.loc[~iguais]
+        if alterados.empty:
+            return self, relatorio
+
+        ras_afetados = pd.unique(alterados["RA"])
+        relatorio["students_affected"] = int(len(ras_afetados))
+
+        chaves_alteradas = pd.MultiIndex.from_frame(alterados[["RA", "ANO_REFERENCIA"]])
+        atuais = atuais.loc[atuais["RA"].isin(ras_afetados)]
+        mantidos = atuais.loc[~pd.MultiIndex.from_frame(atuais[["RA", "ANO_REFERENCIA"]]).isin(chaves_alteradas)]
+
+        partes = [mantidos, alterados]
+        if self._delta is not None:
+            delta = self._delta._registros(self._delta._chaves)
+            partes.insert(0, delta.loc[~delta["RA"].isin(ras_afetados)])
+        novo_delta = self.construir(pd.concat(partes, ignore_index=True))
+
+        atualizado = IndiceHistorico(
+            self._chaves, self._limites, self._anos, self._valores, self._posicoes,
+            delta=novo_delta, revisao=self.revisao + 1,
+        )
+        return atualizado, relatorio
+
+    def memoria_bytes(self) -> int:
+        """
+        Bytes ocupados pelos arrays do índice e do delta.
+
+        Retorno:
+        - int: soma de `nbytes` dos arrays (mapeados ou em heap)
+        """
+        total = sum(int(getattr(self, f"_{nome}").nbytes) for nome in self.ARRAYS_SNAPSHOT)
+        return total + (0 if self._delta is None else self._delta.memoria_bytes())
+
+    def tamanho_delta(self) -> int:
+        """
+        Quantidade de alunos mantidos no delta.
+
+        Retorno:
+        - int: alunos no delta (0 sem delta)
+        """
+        return 0 if self._delta is None else len(self._delta._chaves)
+
+    def compactar(self) -> "IndiceHistorico":
+        """
+        Incorpora o delta ao índice base em blocos contíguos.
+
+        Retorno:
+        - IndiceHistorico: índice sem delta, com a mesma revisão
+        """
+        if self._delta is None:
+            return self
+
+        base = self._registros(self._chaves, usar_delta=False)
+        base = base.loc[~base["RA"].isin(self._delta._chaves)]
+        compactado = self.construir(
+            pd.concat([base, self._delta._registros(self._delta._chaves)], ignore_index=True)
+        )
+        compactado.revisao = self.revisao
+        return compactado
+
+    def _registros(self, ras: Sequence[str], usar_delta: bool = True) -> pd.DataFrame:
+        """
+        Extrai os registros armazenados para um conjunto de RAs.
+
+        Parâmetros:
+        - ras (Sequence[str]): RAs normalizados
+        - usar_delta (bool): dá precedência ao delta quando o RA está nele
+
+        Retorno:
+        - pd.DataFrame: RA, ANO_REFERENCIA e métricas dos RAs existentes
+        """
+        blocos_ras, blocos_anos, blocos_valores = [], [], []
+        for ra in ras:
+            fonte = self
+            posicao = None
+            if usar_delta and self._delta is not None:
+                posicao = self._delta._localizar(ra)
+                fonte = self._delta if posicao is not None else self
+            if posicao is None:
+                posicao = self._localizar(ra)
+            if posicao is None:
+                continue
+            inicio, fim = int(fonte._limites[posicao]), int(fonte._limites[posicao + 1])
+            blocos_ras.append(np.full(fim - inicio, ra, dtype=object))
+            blocos_anos.append(np.asarray(fonte._anos[inicio:fim]))
+            blocos_valores.append(np.asarray(fonte._valores[inicio:fim]))
+
+        metricas = Configuracoes.METRICAS_HISTORICAS
+        if not blocos_ras:
+            return pd.DataFrame(columns=["RA", "ANO_REFERENCIA", *metricas]).astype(
+                {"RA": object, "ANO_REFERENCIA": np.int64, **{m: np.float64 for m in metricas}}
+            )
+
+        registros = pd.DataFrame(np.concatenate(blocos_valores), columns=metricas)
+        registros.insert(0, "ANO_REFERENCIA", np.concatenate(blocos_anos).astype(np.int64))
+        registros.insert(0, "RA", np.concatenate(blocos_ras))
+        return registros
+
+    @classmethod
+    def _normalizar_registros(cls, novos: pd.DataFrame) -> pd.DataFrame:
+        """
+        Converte registros de entrada para o formato armazenado no índice.
+
+        Registros sem ano válido são descartados, métricas ausentes viram 0 e,
+        para o mesmo (RA, ANO_REFERENCIA), prevalece o último registro.
+
+        Parâmetros:
+        - novos (pd.DataFrame): registros com RA e ANO_REFERENCIA
+
+        Retorno:
+        - pd.DataFrame: RA, ANO_REFERENCIA e métricas
+        """
+        anos = pd.to_numeric(novos["ANO_REFERENCIA"], errors="coerce")
+        validos = novos.loc[anos.notna().to_numpy()]
+        registros = pd.DataFrame({
+            "RA": validos["RA"].astype(str).to_numpy(dtype=object),
+            "ANO_REFERENCIA": anos.dropna().to_numpy(dtype=np.int64),
+        })
+        for metrica in Configuracoes.METRICAS_HISTORICAS:
+            registros[metrica] = cls._coluna_numerica(validos, metrica)
+        return registros.drop_duplicates(subset=["RA", "ANO_REFERENCIA"], keep="last").reset_index(drop=True)
+
+    def _gravar_manifesto(self, diretorio_versao: str, manifesto: Dict[str, Any]) -> None:
+        """
+        Grava o manifesto de uma versão de forma atômica.
+
+        Parâmetros:
+        - diretorio_versao (str): diretório da versão
+        - manifesto (dict): conteúdo do manifesto
+        """
+        caminho = os.path.join(diretorio_versao, self.ARQUIVO_MANIFESTO)
+        temporario = f"{caminho}.{uuid.uuid4().hex}"
+        with open(temporario, "w") as arquivo:
+            json.dump(manifesto, arquivo)
+        os.replace(temporario, caminho)
+
+    @classmethod
+    def _diretorio_versao_atual(cls, diretorio: str) -> str:
+        """
+        Resolve o diretório da versão publicada.
+
+        Parâmetros:
+        - diretorio (str): diretório raiz do snapshot
+
+        Retorno:
+        - str: diretório da versão atual
+        """
+        with open(os.path.join(diretorio, cls.ARQUIVO_ATUAL), "r") as arquivo:
+            return os.path.join(diretorio, arquivo.read().strip())
+
+    @classmethod
+    def _remover_versoes_antigas(cls, diretorio: str, versao_atual: str) -> None:
+        """
+        Remove versões não publicadas, mantendo a atual e a imediatamente anterior.
+
+        No Linux, arquivos removidos continuam válidos para quem já os mapeou.
+
+        Parâmetros:
+        - diretorio (str): diretório raiz do snapshot
+        - versao_atual (str): versão recém-publicada
+        """
+        versoes = [
+            os.path.join(diretorio, nome)
+            for nome in os.listdir(diretorio)
+            if nome != versao_atual and os.path.isdir(os.path.join(diretorio, nome))
+        ]
+        versoes.sort(key=os.path.getmtime, reverse=True)
+        for antiga in versoes[1:]:
+            shutil.rmtree(antiga, ignore_errors=True)
+
+    @staticmethod
+    def _ler_json(caminho: str) -> Dict[str, Any]:
+        """
+        Lê um arquivo JSON.
+
+        Parâmetros:
+        - caminho (str): caminho do arquivo
+
+        Retorno:
+        - dict: conteúdo lido
+        """
+        with open(caminho, "r") as arquivo:
+            return json.load(arquivo)
+
+    def obter(self, ra: str, ano_referencia: Optional[int] = None) -> Optional[Dict[str, float]]:
+        """
+        Busca as features históricas de um aluno.
+
+        Com ano de referência, usa o registro mais recente estritamente anterior
+        a esse ano. Sem ano, usa o registro imediatamente anterior ao último,
+        para evitar vazamento de dados futuros.
+
+        Parâmetros:
+        - ra (str): RA normalizado
+        - ano_referencia (int | None): ano da predição
+
+        Retorno:
+        - dict | None: features de lag ou None quando não há histórico anterior
+        """
+        if self._delta is not None and self._delta._localizar(ra) is not None:
+            return self._delta.obter(ra, ano_referencia)
+
+        posicao = self._localizar(ra)
+        if posicao is None:
+            return None
+
+        inicio = int(self._limites[posicao])
+        fim = int(self._limites[posicao + 1])
+
+        if ano_referencia is None:
+            alvo = fim - 2
+        else:
+            alvo = inicio + int(np.searchsorted(self._anos[inicio:fim], ano_referencia, side="left")) - 1
+
+        if alvo < inicio:
+            return None
+
+        valores = np.round(self._valores[alvo].astype(np.float64), self.CASAS_DECIMAIS)
+        historico = dict(zip(self.COLUNAS_LAG, valores.tolist()))
+        historico["ALUNO_NOVO"] = 0
+        return historico
+
+    def obter_lote(
+        self,
+        ras: Sequence[str],
+        anos_referencia: Optional[Sequence[int]] = None,
+    ) -> pd.DataFrame:
+        """
+        Busca as features históricas de vários alunos de uma vez.
+
+        Aplica a mesma regra de `obter` a cada posição, com uma busca binária
+        vetorizada sobre as chaves e uma única coleta das linhas de métricas.
+
+        Parâmetros:
+        - ras (Sequence[str]): RAs normalizados
+        - anos_referencia (Sequence[int] | None): ano da predição de cada RA;
+          posições sem ano seguem a regra de `obter` sem ano
+
+        Retorno:
+        - pd.DataFrame: uma linha por RA, na ordem de entrada, com as colunas de
+          lag (0.0 para alunos novos) e ALUNO_NOVO (1 quando não há histórico)
+
+        Exceções:
+        - ValueError: quando `anos_referencia` não tem o mesmo tamanho de `ras`
+        """
+        consultas = np.asarray(ras, dtype=str).reshape(-1)
+        quantidade = len(consultas)
+        encontrado = np.zeros(quantidade, dtype=bool)
+        alvo = np.full(quantidade, -1, dtype=np.int64)
+
+        if len(self._chaves) > 0 and quantidade > 0:
+            posicoes = np.searchsorted(self._chaves, consultas)
+            posicoes = np.minimum(posicoes, len(self._chaves) - 1)
+            existe = self._chaves[posicoes] == consultas
+            inicio = self._limites[posicoes]
+            fim = self._limites[posicoes + 1]
+
+            if anos_referencia is None:
+                alvo = fim - 2
+            else:
+                anos = pd.to_numeric(pd.Series(np.asarray(anos_referencia).reshape(-1)), errors="coerce")
+                if len(anos) != quantidade:
+                    raise ValueError("anos_referencia deve ter o mesmo tamanho de ras")
+                anos = anos.to_numpy(dtype=np.float64)
+                sem_ano = np.isnan(anos)
+                alvo = self._buscar_anteriores(posicoes, np.where(sem_ano, 0.0, anos)) - 1
+                alvo = np.where(sem_ano, fim - 2, alvo)
+
+            encontrado = existe & (alvo >= inicio)
+
+        valores = np.zeros((quantidade, len(self.COLUNAS_LAG)), dtype=np.float64)
+        valores[encontrado] = self._valores[alvo[encontrado]]
+        np.round(valores, self.CASAS_DECIMAIS, out=valores)
+
+        resultado = pd.DataFrame(valores, columns=self.COLUNAS_LAG)
+        resultado["ALUNO_NOVO"] = (~encontrado).astype(np.int64)
+
+        if self._delta is not None and quantidade > 0:
+            no_delta = self._delta._contem(consultas)
+            if no_delta.any():
+                anos_delta = None if anos_referencia is None else np.asarray(anos_referencia).reshape(-1)[no_delta]
+                resultado.loc[no_delta] = self._delta.obter_lote(consultas[no_delta], anos_delta).to_numpy()
+        return resultado
+
+    def _contem(self, ras: np.ndarray) -> np.ndarray:
+        """
+        Indica, para cada RA, se ele tem bloco no índice (sem considerar o delta).
+
+        Parâmetros:
+        - ras (np.ndarray): RAs normalizados
+
+        Retorno:
+        - np.ndarray: máscara booleana alinhada a `ras`
+        """
+        ras = np.asarray(ras, dtype=str)
+        if len(self._chaves) == 0 or len(ras) == 0:
+            return np.zeros(len(ras), dtype=bool)
+        posicoes = np.minimum(np.searchsorted(self._chaves, ras), len(self._chaves) - 1)
+        return self._chaves[posicoes] == ras
+
+    def _buscar_anteriores(self, posicoes: np.ndarray, anos: np.ndarray) -> np.ndarray:
+        """
+        Localiza, para cada consulta, o primeiro registro do bloco com ano >= ano consultado.
+
+        Usa chaves compostas (bloco, ano) ordenadas, de modo que uma única
+        busca binária resolve todas as consultas.
+
+        Parâmetros:
+        - posicoes (np.ndarray): posição do bloco de cada consulta
+        - anos (np.ndarray): ano de referência de cada consulta
+
+        Retorno:
+        - np.ndarray: índice global do registro encontrado
+        """
+        ano_minimo = int(self._anos.min())
+        amplitude = int(self._anos.max()) - ano_minimo + 2
+
+        if self._chaves_compostas is None:
+            blocos = np.repeat(np.arange(len(self._chaves), dtype=np.int64), np.diff(self._limites))
+            self._chaves_compostas = blocos * amplitude + (self._anos - ano_minimo)
+
+        deslocamentos = np.clip(np.ceil(anos) - ano_minimo, 0, amplitude - 1).astype(np.int64)
+        return np.searchsorted(self._chaves_compostas, posicoes.astype(np.int64) * amplitude + deslocamentos)
+
+    def _localizar(self, ra: str) -> Optional[int]:
+        """
+        Localiza a posição do bloco de um RA.
+
+        Parâmetros:
+        - ra (str): RA normalizado
+
+        Retorno:
+        - int | None: posição do bloco ou None se o RA não existe
+        """
+        if self._posicoes is not None:
+            return self._posicoes.get(ra)
+
+        posicao = int(np.searchsorted(self._chaves, ra))
+        if posicao < len(self._chaves) and self._chaves[posicao] == ra:
+            return posicao
+        return None
+
+    @staticmethod
+    def _coluna_numerica(dados: pd.DataFrame, coluna: str) -> np.ndarray:
+        """
+        Converte uma métrica para float, tratando ausências e valores inválidos como 0.
+
+        Parâmetros:
+        - dados (pd.DataFrame): registros selecionados
+        - coluna (str): nome da métrica
+
+        Retorno:
+        - np.ndarray: valores numéricos
+        """
+        if coluna not in dados.columns:
+            return np.zeros(len(dados), dtype=np.float64)
+        return pd.to_numeric(dados[coluna], errors="coerce").fillna(0.0).to_numpy(dtype=np.float64)
@@ -5,27 +5,55 @@ Responsabilidades:
 - Carregar dataset de referência
 - Fornecer histórico do aluno
 - Aplicar normalizações de RA
+- Compartilhar snapshots compilados entre workers
+- Recarregar o índice em segundo plano com troca atômica
+- Selecionar o backend (memória ou SQLite) pela configuração
+- Incorporar registros novos sem recarga completa
 """
 
+import glob
 import os
+import threading
+import weakref
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Iterator, Optional, Sequence, Tuple, Union
+
 import pandas as pd
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - plataformas sem fcntl (Windows)
+    fcntl = None
+
 from src.config.settings import Configuracoes
+from src.infrastructure.data.historical_index import IndiceHistorico
+from src.infrastructure.data.sqlite_feature_store import IndiceHistoricoSQLite
 from src.util.logger import logger
 
+IndiceFeatureStore = Union[IndiceHistorico, IndiceHistoricoSQLite]
+
 
 class RepositorioHistorico:
     """
     Repositório singleton para consulta de histórico.
 
     Responsabilidades:
-    - Manter dados carregados em memória
-    - Recarregar quando necessário
+    - Manter o índice de histórico em memória, mapeado do snapshot ou em SQLite
+    - Recarregar em segundo plano, trocando o índice de forma atômica
     - Buscar métricas do ano anterior
     """
 
     _instancia = None
-    _dados = None
+    _indice = None
+    _origem = None
+    _revisao = None
+    _versao = 0
+    _carregado_em = None
+    _lock = threading.Lock()
+    _lock_recarga = threading.Lock()
+    _monitor = None
+    _parar_monitor = None
 
     def __new__(cls):
         """
@@ -35,87 +63,583 @@ class RepositorioHistorico:
         - RepositorioHistorico: instância singleton
         """
         if cls._instancia is None:
-            cls._instancia = super(RepositorioHistorico, cls).__new__(cls)
-            cls._instancia._carregar_dados()
+            with cls._lock:
+                if cls._instancia is None:
+                    instancia = super(RepositorioHistorico, cls).__new__(cls)
+                    instancia._carregar_dados()
+                    # Publicada só após a carga, para que nenhuma thread veja o índice incompleto.
+                    cls._instancia = instancia
         return cls._instancia
 
+    @classmethod
+    def inicializado(cls) -> bool:
+        """
+        Indica se a instância já foi criada e a carga inicial concluída.
+
+        Retorno:
+        - bool: True quando a Feature Store está pronta para consultas
+        """
+        return cls._instancia is not None
+
     def _carregar_dados(self):
         """
-        Carrega o dataset de referência ou o arquivo bruto.
+        Abre o snapshot compilado da Feature Store ou constrói o índice a partir dos dados brutos.
 
         Retorno:
         - None: não retorna valor
         """
         try:
             logger.info("Carregando base histórica para Feature Store...")
+            origem = self._descrever_origem()
+            self._publicar(self._obter_indice(origem), origem)
+        except Exception as erro:
+            logger.error(f"Erro ao carregar Feature Store: {erro}")
+            self._indice = None
+
+    def recarregar(self, forcar: bool = True, aguardar: bool = False) -> bool:
+        """
+        Reconstrói o índice em segundo plano e o publica com uma troca atômica.
+
+        Consultas em andamento continuam usando a versão anterior, sem locks:
+        cada leitura captura a referência do índice uma única vez. A versão
+        anterior é liberada quando a última leitura que a referencia termina.
+
+        Parâmetros:
+        - forcar (bool): relê os dados brutos mesmo com snapshot atualizado
+        - aguardar (bool): bloqueia até a recarga terminar
+
+        Retorno:
+        - bool: True se a recarga foi iniciada, False se já havia uma em andamento
+        """
+        if not self._lock_recarga.acquire(blocking=False):
+            logger.info("Recarga da Feature Store já em andamento.")
+            return False
+
+        thread = threading.Thread(
+            target=self._executar_recarga, args=(forcar,), name="feature-store-reload", daemon=True
+        )
+        thread.start()
+        if aguardar:
+            thread.join()
+        return True
+
+    def status(self) -> dict:
+        """
+        Resume o estado da versão publicada.
+
+        Retorno:
+        - dict: estado do índice e da recarga
+        """
+        indice = self._indice
+        return {
+            "loaded": indice is not None,
+            "students": len(indice) if indice is not None else 0,
+            "memory_bytes": indice.memoria_bytes() if isinstance(indice, IndiceHistorico) else None,
+            "version": self._versao,
+            "loaded_at": self._carregado_em,
+            "reloading": self._lock_recarga.locked(),
+        }
+
+    def atualizar_registros(self, registros: pd.DataFrame) -> dict:
+        """
+        Incorpora registros novos ou alterados sem recarregar todo o histórico.
+
+        Apenas os RAs afetados têm o histórico reconstruído. No backend em
+        memória, o delta é gravado no snapshot publicado (ou o snapshot é
+        compactado quando o delta passa de FEATURE_STORE_DELTA_MAX_FRACTION
+        dos alunos); no SQLite, os registros são gravados no próprio arquivo.
+        Quando os arquivos brutos mudaram desde a publicação, o histórico é
+        relido antes de aplicar os registros. Registros que não forem gravados
+        também nos arquivos brutos são perdidos na próxima reconstrução completa.
+
+        Parâmetros:
+        - registros (pd.DataFrame): registros com RA e ANO_REFERENCIA
+
+        Retorno:
+        - dict: linhas recebidas, inseridas, alteradas e inalteradas, alunos
+          afetados, compactação e versão publicada
+
+        Exceções:
+        - ValueError: quando faltam as colunas RA ou ANO_REFERENCIA
+        """
+        faltantes = {"RA", "ANO_REFERENCIA"} - set(registros.columns)
+        if faltantes:
+            raise ValueError(f"Colunas obrigatórias ausentes: {sorted(faltantes)}")
+
+        registros = registros.copy()
+        registros["RA"] = self._normalizar_ra(registros["RA"])
 
-            if Configuracoes.HISTORICAL_PATH and os.path.exists(Configuracoes.HISTORICAL_PATH):
-                self._dados = pd.read_csv(Configuracoes.HISTORICAL_PATH)
-                if "RA" not in self._dados.columns:
-                    logger.warning("CSV histórico sem RA. Recarregando do Excel...")
-                    from src.infrastructure.data.data_loader import CarregadorDados
-                    self._dados = CarregadorDados().carregar_dados()
+        with self._lock_recarga:
+            origem = self._descrever_origem()
+            # Arquivos brutos alterados desde a publicação: o upsert é aplicado sobre o
+            # histórico relido, senão as linhas novas dos arquivos ficariam de fora.
+            defasado = origem is not None and origem != self._origem
+            if isinstance(self._indice, IndiceHistoricoSQLite):
+                indice = self._obter_indice_sqlite(origem) if defasado else self._indice
+                if indice is None:
+                    indice = self._indice
+                atualizado, relatorio = indice.atualizar(registros)
+                relatorio["compacted"] = False
+                if relatorio["students_affected"] or defasado:
+                    self._publicar(atualizado, origem)
             else:
-                from src.infrastructure.data.data_loader import CarregadorDados
-                self._dados = CarregadorDados().carregar_dados()
+                # Sob o lock entre workers, a atualização parte do snapshot publicado (e não do
+                # índice deste processo, que pode estar defasado), para não descartar o delta
+                # gravado por outro worker e para que a revisão continue crescendo.
+                with self._bloquear_snapshot(origem):
+                    indice = self._abrir_snapshot(origem)
+                    if indice is None and defasado:
+                        indice = self._construir_indice(origem)
+                    if indice is None:
+                        indice = self._indice
+                    if indice is None:
+                        indice = IndiceHistorico.construir(registros.iloc[:0])
+                    atualizado, relatorio = indice.atualizar(registros)
+                    relatorio["compacted"] = False
+                    if relatorio["students_affected"]:
+                        atualizado, relatorio["compacted"] = self._persistir_atualizacao(atualizado, origem)
+                    if relatorio["students_affected"] or defasado:
+                        self._publicar(atualizado, origem)
+
+        relatorio["version"] = self._versao
+        logger.info(f"Feature Store atualizada incrementalmente: {relatorio}")
+        return relatorio
+
+    def _persistir_atualizacao(
+        self, indice: IndiceHistorico, origem: Optional[list]
+    ) -> Tuple[IndiceHistorico, bool]:
+        """
+        Persiste uma atualização incremental do backend em memória.
+
+        Deve ser chamado com o lock do snapshot (`_bloquear_snapshot`) já adquirido.
+
+        Parâmetros:
+        - indice (IndiceHistorico): índice atualizado
+        - origem (list | None): descrição dos arquivos de origem
+
+        Retorno:
+        - tuple: (índice a publicar, True quando o delta foi compactado)
+        """
+        base = len(indice) - indice.tamanho_delta()
+        compactar = indice.tamanho_delta() > Configuracoes.FEATURE_STORE_DELTA_MAX_FRACTION * max(base, 1)
+        if compactar:
+            indice = indice.compactar()
+
+        if not self._snapshot_ativo(origem):
+            return indice, compactar
 
-            if "RA" not in self._dados.columns:
-                logger.warning("Coluna RA não encontrada no histórico! A busca smart falhará.")
+        diretorio = Configuracoes.FEATURE_STORE_SNAPSHOT_DIR
+        try:
+            if compactar:
+                indice.salvar_snapshot(diretorio, origem)
+                indice = IndiceHistorico.abrir_snapshot(diretorio)
+            else:
+                indice.salvar_delta(diretorio)
+        except Exception as erro:
+            logger.warning(f"Falha ao persistir atualização da Feature Store: {erro}")
+        return indice, compactar
+
+    def _executar_recarga(self, forcar: bool) -> None:
+        """
+        Executa a recarga e libera o lock ao final.
+
+        Parâmetros:
+        - forcar (bool): relê os dados brutos mesmo com snapshot atualizado
+        """
+        try:
+            logger.info("Recarregando Feature Store em segundo plano...")
+            origem = self._descrever_origem()
+            indice = self._obter_indice(origem, forcar=forcar)
+            if indice is None:
+                logger.warning("Recarga da Feature Store sem dados válidos. Mantendo a versão atual.")
                 return
+            self._publicar(indice, origem)
+        except Exception as erro:
+            logger.error(f"Erro ao recarregar Feature Store: {erro}. Mantendo a versão atual.")
+        finally:
+            self._lock_recarga.release()
+
+    def _publicar(self, indice: Optional[IndiceFeatureStore], origem: Optional[list]) -> None:
+        """
+        Publica um novo índice trocando a referência de forma atômica.
+
+        Parâmetros:
+        - indice (IndiceFeatureStore | None): índice a publicar
+        - origem (list | None): descrição dos arquivos que geraram o índice
+        """
+        anterior = self._indice
+        self._indice = indice
+        self._origem = origem
+        self._revisao = getattr(indice, "revisao", None)
+        self._versao += 1
+        self._carregado_em = datetime.now().isoformat()
+
+        if anterior is not None and anterior is not indice:
+            versao_anterior = self._versao - 1
+            weakref.finalize(anterior, logger.info, f"Versão {versao_anterior} da Feature Store liberada.")
+        logger.info(f"Feature Store versão {self._versao} publicada.")
+
+    def _obter_indice(self, origem: Optional[list], forcar: bool = False) -> Optional[IndiceFeatureStore]:
+        """
+        Obtém o índice do snapshot atualizado ou o constrói sob lock entre workers.
+
+        Com FEATURE_STORE_BACKEND=sqlite, delega para o backend em SQLite.
+
+        Parâmetros:
+        - origem (list | None): descrição dos arquivos de origem
+        - forcar (bool): ignora o snapshot e relê os dados brutos
+
+        Retorno:
+        - IndiceHistorico | IndiceHistoricoSQLite | None: índice pronto para consulta
+        """
+        if Configuracoes.FEATURE_STORE_BACKEND == "sqlite":
+            return self._obter_indice_sqlite(origem, forcar)
+
+        indice = None if forcar else self._abrir_snapshot(origem)
+        if indice is not None:
+            return indice
 
-            self._dados["RA"] = (
-                self._dados["RA"].astype(str).str.strip().str.replace(r"\.0$", "", regex=True)
+        with self._bloquear_snapshot(origem):
+            # Outro worker pode ter publicado o snapshot enquanto aguardávamos o lock.
+            if not forcar:
+                indice = self._abrir_snapshot(origem)
+            if indice is None:
+                indice = self._construir_indice(origem)
+        return indice
+
+    def _obter_indice_sqlite(self, origem: Optional[list], forcar: bool = False) -> Optional[IndiceHistoricoSQLite]:
+        """
+        Abre o arquivo SQLite atualizado ou o reconstrói sob lock entre workers.
+
+        Parâmetros:
+        - origem (list | None): descrição dos arquivos de origem
+        - forcar (bool): ignora o arquivo existente e relê os dados brutos
+
+        Retorno:
+        - IndiceHistoricoSQLite | None: índice pronto para consulta
+        """
+        caminho = Configuracoes.FEATURE_STORE_SQLITE_PATH
+        reutilizavel = not forcar and origem is not None
+
+        indice = IndiceHistoricoSQLite.abrir(caminho, origem) if reutilizavel else None
+        if indice is not None:
+            logger.info(f"Feature Store SQLite aberta com {len(indice)} alunos indexados.")
+            return indice
+
+        with self._bloquear_arquivo(f"{caminho}.lock"):
+            # Outro worker pode ter reconstruído o arquivo enquanto aguardávamos o lock.
+            indice = IndiceHistoricoSQLite.abrir(caminho, origem) if reutilizavel else None
+            if indice is None:
+                indice = IndiceHistoricoSQLite.construir(self._ler_lotes_historico(), caminho, origem)
+                if indice is not None:
+                    logger.info(f"Feature Store SQLite construída em {caminho} com {len(indice)} alunos.")
+        return indice
+
+    def _ler_lotes_historico(self) -> Iterator[pd.DataFrame]:
+        """
+        Lê o histórico bruto em lotes, com RA normalizado.
+
+        O CSV histórico é lido em blocos de STREAM_CHUNK_SIZE linhas; sem ele (ou
+        sem coluna RA), os dados vêm do CarregadorDados em um único lote.
+
+        Retorno:
+        - Iterator[pd.DataFrame]: lotes com RA e ANO_REFERENCIA
+        """
+        caminho = Configuracoes.HISTORICAL_PATH
+        if caminho and os.path.exists(caminho) and "RA" in pd.read_csv(caminho, nrows=0).columns:
+            lotes = pd.read_csv(
+                caminho, usecols=self._coluna_necessaria, chunksize=Configuracoes.STREAM_CHUNK_SIZE
             )
-            self._dados = self._dados.sort_values(by=["RA", "ANO_REFERENCIA"])
+            for lote in lotes:
+                lote["RA"] = self._normalizar_ra(lote["RA"])
+                yield lote
+            return
+
+        from src.infrastructure.data.data_loader import CarregadorDados
+        dados = CarregadorDados().carregar_dados()
+        if "RA" not in dados.columns:
+            logger.warning("Coluna RA não encontrada no histórico! A busca smart falhará.")
+            return
+        dados["RA"] = self._normalizar_ra(dados["RA"])
+        yield dados
+
+    @staticmethod
+    def _coluna_necessaria(coluna: str) -> bool:
+        """
+        Indica se uma coluna do histórico bruto é usada pela Feature Store.
+
+        Parâmetros:
+        - coluna (str): nome da coluna
+
+        Retorno:
+        - bool: True para RA, ANO_REFERENCIA e métricas históricas
+        """
+        return coluna in ("RA", "ANO_REFERENCIA") or coluna in Configuracoes.METRICAS_HISTORICAS
 
-            logger.info(f"Feature Store carregada com {len(self._dados)} registros.")
+    @staticmethod
+    def _normalizar_ra(ras: pd.Series) -> pd.Series:
+        """
+        Normaliza RAs para texto sem espaços e sem sufixo decimal.
+
+        Parâmetros:
+        - ras (pd.Series): RAs brutos
+
+        Retorno:
+        - pd.Series: RAs normalizados
+        """
+        return ras.astype(str).str.strip().str.replace(r"\.0$", "", regex=True)
+
+    @classmethod
+    def iniciar_monitoramento(cls, intervalo: Optional[float] = None) -> None:
+        """
+        Inicia a thread que recarrega o índice quando os arquivos de origem mudam.
+
+        Parâmetros:
+        - intervalo (float | None): segundos entre verificações (0 desativa)
+        """
+        intervalo = Configuracoes.FEATURE_STORE_WATCH_INTERVAL if intervalo is None else intervalo
+        if intervalo <= 0 or (cls._monitor is not None and cls._monitor.is_alive()):
+            return
+
+        cls._parar_monitor = threading.Event()
+        cls._monitor = threading.Thread(
+            target=cls._monitorar_origem,
+            args=(intervalo, cls._parar_monitor),
+            name="feature-store-watch",
+            daemon=True,
+        )
+        cls._monitor.start()
+        logger.info(f"Monitorando alterações da Feature Store a cada {intervalo}s.")
+
+    @classmethod
+    def parar_monitoramento(cls) -> None:
+        """
+        Interrompe a thread de monitoramento, se ativa.
+        """
+        if cls._parar_monitor is not None:
+            cls._parar_monitor.set()
+        cls._monitor = None
+
+    @classmethod
+    def _monitorar_origem(cls, intervalo: float, parar: threading.Event) -> None:
+        """
+        Laço de verificação dos arquivos de origem.
+
+        Parâmetros:
+        - intervalo (float): segundos entre verificações
+        - parar (threading.Event): sinal de encerramento
+        """
+        while not parar.wait(intervalo):
+            instancia = cls._instancia
+            if instancia is None:
+                continue
+            origem = cls._descrever_origem()
+            if origem is not None and origem != instancia._origem:
+                logger.info("Alteração detectada nos dados históricos. Recarregando Feature Store...")
+                instancia.recarregar(forcar=False)
+            elif cls._revisao_publicada(origem) not in (None, instancia._revisao):
+                logger.info("Snapshot atualizado por outro processo. Reabrindo Feature Store...")
+                instancia.recarregar(forcar=False)
+
+    def _construir_indice(self, origem: Optional[list]) -> Optional[IndiceHistorico]:
+        """
+        Lê o histórico bruto, constrói o índice e publica o snapshot.
+
+        Parâmetros:
+        - origem (list | None): descrição dos arquivos de origem
+
+        Retorno:
+        - IndiceHistorico | None: índice construído ou None sem coluna RA
+        """
+        if Configuracoes.HISTORICAL_PATH and os.path.exists(Configuracoes.HISTORICAL_PATH):
+            dados = pd.read_csv(Configuracoes.HISTORICAL_PATH, usecols=self._coluna_necessaria)
+            if "RA" not in dados.columns:
+                logger.warning("CSV histórico sem RA. Recarregando do Excel...")
+                from src.infrastructure.data.data_loader import CarregadorDados
+                dados = CarregadorDados().carregar_dados()
+        else:
+            from src.infrastructure.data.data_loader import CarregadorDados
+            dados = CarregadorDados().carregar_dados()
+
+        if "RA" not in dados.columns:
+            logger.warning("Coluna RA não encontrada no histórico! A busca smart falhará.")
+            return None
+
+        memoria_lida = int(dados.memory_usage(deep=True).sum())
+        dados = dados[[coluna for coluna in dados.columns if self._coluna_necessaria(coluna)]]
+        dados["RA"] = self._normalizar_ra(dados["RA"])
+        indice = IndiceHistorico.construir(dados)
+        logger.info(
+            f"Feature Store carregada com {len(dados)} registros e {len(indice)} alunos indexados "
+            f"(memória: {memoria_lida / 1e6:.2f} MB lidos -> {indice.memoria_bytes() / 1e6:.2f} MB no índice)."
+        )
+
+        if not self._snapshot_ativo(origem):
+            return indice
+
+        try:
+            indice.salvar_snapshot(Configuracoes.FEATURE_STORE_SNAPSHOT_DIR, origem)
+            logger.info(f"Snapshot da Feature Store publicado em {Configuracoes.FEATURE_STORE_SNAPSHOT_DIR}")
+            # Reabre via memory-map para descartar a cópia em heap e compartilhar o page cache.
+            return IndiceHistorico.abrir_snapshot(Configuracoes.FEATURE_STORE_SNAPSHOT_DIR)
         except Exception as erro:
-            logger.error(f"Erro ao carregar Feature Store: {erro}")
-            self._dados = pd.DataFrame()
+            logger.warning(f"Falha ao publicar snapshot da Feature Store: {erro}")
+            return indice
+
+    @staticmethod
+    def _abrir_snapshot(origem: Optional[list]) -> Optional[IndiceHistorico]:
+        """
+        Abre o snapshot publicado se ele corresponder aos arquivos de origem atuais.
+
+        Parâmetros:
+        - origem (list | None): descrição dos arquivos de origem
+
+        Retorno:
+        - IndiceHistorico | None: índice mapeado ou None se ausente/desatualizado
+        """
+        if not RepositorioHistorico._snapshot_ativo(origem):
+            return None
+
+        diretorio = Configuracoes.FEATURE_STORE_SNAPSHOT_DIR
+        try:
+            if IndiceHistorico.ler_manifesto(diretorio).get("origem") != origem:
+                logger.info("Snapshot da Feature Store desatualizado. Reconstruindo...")
+                return None
+            indice = IndiceHistorico.abrir_snapshot(diretorio)
+        except (OSError, ValueError):
+            return None
+
+        logger.info(f"Feature Store aberta do snapshot com {len(indice)} alunos indexados.")
+        return indice
 
-    def obter_historico_estudante(self, ra_estudante: str) -> dict:
+    @staticmethod
+    def _revisao_publicada(origem: Optional[list]) -> Optional[int]:
+        """
+        Lê a revisão incremental do snapshot publicado em memória.
+
+        Parâmetros:
+        - origem (list | None): descrição dos arquivos de origem
+
+        Retorno:
+        - int | None: revisão do manifesto ou None quando não se aplica
+        """
+        if Configuracoes.FEATURE_STORE_BACKEND == "sqlite" or not RepositorioHistorico._snapshot_ativo(origem):
+            return None
+        try:
+            return IndiceHistorico.ler_manifesto(Configuracoes.FEATURE_STORE_SNAPSHOT_DIR).get("revisao")
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _descrever_origem() -> Optional[list]:
+        """
+        Descreve os arquivos de origem (caminho, tamanho e mtime) para detectar alterações.
+
+        Retorno:
+        - list | None: descrição dos arquivos ou None quando não podem ser inspecionados
+        """
+        caminhos = []
+        if Configuracoes.HISTORICAL_PATH and os.path.exists(Configuracoes.HISTORICAL_PATH):
+            caminhos.append(Configuracoes.HISTORICAL_PATH)
+        for padrao in ("*.xlsx", "*.csv"):
+            caminhos.extend(sorted(glob.glob(os.path.join(Configuracoes.DATA_DIR, padrao))))
+
+        try:
+            origem = []
+            for caminho in caminhos:
+                estado = os.stat(caminho)
+                origem.append([os.path.abspath(caminho), estado.st_size, estado.st_mtime_ns])
+            return origem or None
+        except OSError:
+            return None
+
+    @staticmethod
+    def _snapshot_ativo(origem: Optional[list]) -> bool:
+        """
+        Indica se o snapshot compilado deve ser usado.
+
+        Parâmetros:
+        - origem (list | None): descrição dos arquivos de origem
+
+        Retorno:
+        - bool: True quando habilitado e com origem conhecida
+        """
+        return origem is not None and Configuracoes.FEATURE_STORE_SNAPSHOT_ENABLED
+
+    @staticmethod
+    @contextmanager
+    def _bloquear_snapshot(origem: Optional[list]):
+        """
+        Serializa a construção do snapshot entre workers com um lock de arquivo.
+
+        Parâmetros:
+        - origem (list | None): descrição dos arquivos de origem
+        """
+        if not RepositorioHistorico._snapshot_ativo(origem):
+            yield
+            return
+
+        with RepositorioHistorico._bloquear_arquivo(os.path.join(Configuracoes.FEATURE_STORE_SNAPSHOT_DIR, ".lock")):
+            yield
+
+    @staticmethod
+    @contextmanager
+    def _bloquear_arquivo(caminho_lock: str):
+        """
+        Mantém um lock exclusivo de arquivo (no-op sem fcntl).
+
+        Parâmetros:
+        - caminho_lock (str): arquivo usado como lock
+        """
+        if fcntl is None:
+            yield
+            return
+
+        os.makedirs(os.path.dirname(os.path.abspath(caminho_lock)), exist_ok=True)
+        with open(caminho_lock, "w") as arquivo_lock:
+            fcntl.flock(arquivo_lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(arquivo_lock, fcntl.LOCK_UN)
+
+    def obter_historico_estudante(self, ra_estudante: str, ano_referencia: Optional[int] = None) -> dict:
         """
         Busca métricas do ano anterior para um aluno.
 
         Parâmetros:
         - ra_estudante (str): RA do aluno
+        - ano_referencia (int | None): ano da predição; usa o último registro anterior a ele
 
         Retorno:
         - dict: métricas históricas ou vazio para aluno novo
         """
-        if self._dados is None or self._dados.empty:
+        indice = self._indice
+        if indice is None or len(indice) == 0:
             return {}
 
-        ra_alvo = str(ra_estudante).strip()
-        historico = self._dados[self._dados["RA"] == ra_alvo]
+        return indice.obter(str(ra_estudante).strip(), ano_referencia)
 
-        if historico.empty:
-            return None
+    def obter_historicos(
+        self,
+        ras: Sequence[str],
+        anos_referencia: Optional[Sequence[int]] = None,
+    ) -> pd.DataFrame:
+        """
+        Busca métricas históricas de vários alunos em uma única operação.
 
-        # Usa o registro imediatamente anterior para evitar vazamento de dados futuros.
-        if len(historico) < 2:
-            return None
+        Parâmetros:
+        - ras (Sequence[str]): RAs dos alunos
+        - anos_referencia (Sequence[int] | None): ano da predição de cada RA
 
-        ultimo_registro = historico.iloc[-2]
+        Retorno:
+        - pd.DataFrame: uma linha por RA, na ordem de entrada, com as colunas de
+          lag e a máscara ALUNO_NOVO
+        """
+        ras_normalizados = pd.Series(ras, dtype=object).astype(str).str.strip().to_numpy()
 
-        def _obter_seguro(nome_coluna):
-            valor = ultimo_registro.get(nome_coluna, 0.0)
-            try:
-                convertido = float(valor)
-                if pd.isna(convertido):
-                    return 0.0
-                return convertido
-            except (ValueError, TypeError):
-                return 0.0
+        indice = self._indice
+        if indice is None:
+            indice = IndiceHistorico.construir(pd.DataFrame({"RA": [], "ANO_REFERENCIA": []}))
 
-        return {
-            "INDE_ANTERIOR": _obter_seguro("INDE"),
-            "IAA_ANTERIOR": _obter_seguro("IAA"),
-            "IEG_ANTERIOR": _obter_seguro("IEG"),
-            "IPS_ANTERIOR": _obter_seguro("IPS"),
-            "IDA_ANTERIOR": _obter_seguro("IDA"),
-            "IPP_ANTERIOR": _obter_seguro("IPP"),
-            "IPV_ANTERIOR": _obter_seguro("IPV"),
-            "IAN_ANTERIOR": _obter_seguro("IAN"),
-            "ALUNO_NOVO": 0,
-        }
+        return indice.obter_lote(ras_normalizados, anos_referencia)
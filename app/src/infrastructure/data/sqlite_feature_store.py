@@ -0,0 +1,423 @@
+"""
+Feature Store histórica em SQLite.
+
+Responsabilidades:
+- Persistir o histórico em um arquivo SQLite indexado por (RA, ANO_REFERENCIA)
+- Responder consultas sem carregar o histórico inteiro em memória
+- Reaproveitar conexões por thread e manter um cache LRU das consultas
+- Incorporar registros novos ou alterados sem reconstruir o arquivo
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import uuid
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.config.settings import Configuracoes
+
+
+class IndiceHistoricoSQLite:
+    """
+    Índice de histórico apoiado em um arquivo SQLite somente leitura.
+
+    Expõe a mesma interface de consulta de `IndiceHistorico`, de modo que o
+    repositório possa trocar de backend sem alterar os chamadores.
+
+    Responsabilidades:
+    - Construir o arquivo a partir de lotes de registros
+    - Abrir uma conexão somente leitura por thread
+    - Consultar o registro mais recente estritamente anterior a um ano
+    """
+
+    COLUNAS_LAG = [f"{metrica}_ANTERIOR" for metrica in Configuracoes.METRICAS_HISTORICAS]
+    VERSAO_BANCO = 1
+    CACHE_STATEMENTS = 16
+
+    _SELECAO = ", ".join(f'"{metrica}"' for metrica in Configuracoes.METRICAS_HISTORICAS)
+    CONSULTA_ANTERIOR_AO_ANO = (
+        f"SELECT {_SELECAO} FROM historico WHERE ra = ? AND ano < ? ORDER BY ano DESC LIMIT 1"
+    )
+    CONSULTA_PENULTIMO = (
+        f"SELECT {_SELECAO} FROM historico WHERE ra = ? ORDER BY ano DESC LIMIT 1 OFFSET 1"
+    )
+    CONSULTA_REGISTRO = f"SELECT {_SELECAO} FROM historico WHERE ra = ? AND ano = ?"
+    CONSULTA_ALUNO_EXISTE = "SELECT 1 FROM historico WHERE ra = ? LIMIT 1"
+
+    def __init__(self, caminho: str, tamanho_cache: Optional[int] = None):
+        """
+        Abre o índice sobre um arquivo já construído.
+
+        Parâmetros:
+        - caminho (str): arquivo SQLite gerado por `construir`
+        - tamanho_cache (int | None): entradas do cache LRU (padrão: configuração)
+
+        Exceções:
+        - FileNotFoundError: quando o arquivo não existe
+        """
+        if not os.path.exists(caminho):
+            raise FileNotFoundError(f"Feature Store SQLite não encontrada em {caminho}")
+
+        self._caminho = caminho
+        self._local = threading.local()
+        self._metadados = self._ler_metadados()
+        tamanho = Configuracoes.FEATURE_STORE_SQLITE_CACHE_SIZE if tamanho_cache is None else tamanho_cache
+        self._consultar = lru_cache(maxsize=tamanho)(self._consultar_banco)
+
+    def __len__(self) -> int:
+        """Quantidade de alunos indexados."""
+        return int(self._metadados.get("alunos", 0))
+
+    @property
+    def metadados(self) -> Dict[str, Any]:
+        """Metadados gravados na construção (versão, métricas, origem e contagens)."""
+        return dict(self._metadados)
+
+    @classmethod
+    def construir(
+        cls,
+        lotes: Iterable[pd.DataFrame],
+        caminho: str,
+        origem: Any = None,
+    ) -> Optional["IndiceHistoricoSQLite"]:
+        """
+        Constrói o arquivo SQLite a partir de lotes de registros e o publica.
+
+        O arquivo é gravado ao lado do destino e publicado com `os.replace`;
+        conexões abertas sobre a versão anterior continuam válidas.
+
+        Parâmetros:
+        - lotes (Iterable[pd.DataFrame]): registros com RA normalizado e ANO_REFERENCIA
+        - caminho (str): arquivo de destino
+        - origem (Any): descrição serializável dos arquivos de origem
+
+        Retorno:
+        - IndiceHistoricoSQLite | None: índice aberto ou None quando não há registros
+        """
+        diretorio = os.path.dirname(os.path.abspath(caminho))
+        os.makedirs(diretorio, exist_ok=True)
+        temporario = os.path.join(diretorio, f".{os.path.basename(caminho)}.{uuid.uuid4().hex}")
+
+        try:
+            registros = cls._gravar_registros(lotes, temporario, origem)
+            if registros == 0:
+                os.remove(temporario)
+                return None
+            os.replace(temporario, caminho)
+        finally:
+            if os.path.exists(temporario):
+                os.remove(temporario)
+
+        return cls(caminho)
+
+    @classmethod
+    def abrir(cls, caminho: str, origem: Any = None) -> Optional["IndiceHistoricoSQLite"]:
+        """
+        Abre o arquivo existente se ele for compatível e corresponder à origem.
+
+        Parâmetros:
+        - caminho (str): arquivo SQLite
+        - origem (Any): descrição esperada dos arquivos de origem
+
+        Retorno:
+        - IndiceHistoricoSQLite | None: índice aberto ou None se ausente/desatualizado
+        """
+        try:
+            indice = cls(caminho)
+        except (OSError, sqlite3.Error, ValueError):
+            return None
+
+        metadados = indice.metadados
+        compativel = (
+            metadados.get("versao") == cls.VERSAO_BANCO
+            and metadados.get("metricas") == Configuracoes.METRICAS_HISTORICAS
+            and metadados.get("origem") == origem
+        )
+        return indice if compativel else None
+
+    def obter(self, ra: str, ano_referencia: Optional[int] = None) -> Optional[Dict[str, float]]:
+        """
+        Busca as features históricas de um aluno.
+
+        Segue a mesma regra de `IndiceHistorico.obter`: com ano, o registro mais
+        recente estritamente anterior; sem ano, o penúltimo registro.
+
+        Parâmetros:
+        - ra (str): RA normalizado
+        - ano_referencia (int | None): ano da predição
+
+        Retorno:
+        - dict | None: features de lag ou None quando não há histórico anterior
+        """
+        self._sincronizar_cache()
+        valores = self._consultar(ra, ano_referencia)
+        if valores is None:
+            return None
+
+        historico = dict(zip(self.COLUNAS_LAG, valores))
+        historico["ALUNO_NOVO"] = 0
+        return historico
+
+    def obter_lote(
+        self,
+        ras: Sequence[str],
+        anos_referencia: Optional[Sequence[int]] = None,
+    ) -> pd.DataFrame:
+        """
+        Busca as features históricas de vários alunos.
+
+        Cada consulta passa pelo cache LRU e pelo statement preparado da
+        conexão da thread atual.
+
+        Parâmetros:
+        - ras (Sequence[str]): RAs normalizados
+        - anos_referencia (Sequence[int] | None): ano da predição de cada RA
+
+        Retorno:
+        - pd.DataFrame: uma linha por RA, na ordem de entrada, com as colunas de
+          lag (0.0 para alunos novos) e ALUNO_NOVO
+
+        Exceções:
+        - ValueError: quando `anos_referencia` não tem o mesmo tamanho de `ras`
+        """
+        consultas = np.asarray(ras, dtype=str).reshape(-1)
+        if anos_referencia is None:
+            anos = [None] * len(consultas)
+        else:
+            anos = pd.to_numeric(pd.Series(np.asarray(anos_referencia).reshape(-1)), errors="coerce")
+            if len(anos) != len(consultas):
+                raise ValueError("anos_referencia deve ter o mesmo tamanho de ras")
+            anos = [None if pd.isna(ano) else float(ano) for ano in anos]
+
+        self._sincronizar_cache()
+        valores = np.zeros((len(consultas), len(self.COLUNAS_LAG)), dtype=np.float64)
+        novos = np.ones(len(consultas), dtype=np.int64)
+        for posicao, (ra, ano) in enumerate(zip(consultas.tolist(), anos)):
+            linha = self._consultar(ra, ano)
+            if linha is not None:
+                valores[posicao] = linha
+                novos[posicao] = 0
+
+        resultado = pd.DataFrame(valores, columns=self.COLUNAS_LAG)
+        resultado["ALUNO_NOVO"] = novos
+        return resultado
+
+    def atualizar(self, novos: pd.DataFrame) -> Tuple["IndiceHistoricoSQLite", Dict[str, int]]:
+        """
+        Insere ou substitui no arquivo apenas os registros novos ou alterados.
+
+        Cada registro é comparado pela chave primária (RA, ANO_REFERENCIA); o
+        custo é proporcional à quantidade de registros recebidos. Leitores de
+        outras conexões descartam o cache LRU ao perceber a alteração. A origem
+        dos metadados é mantida, pois descreve os arquivos que geraram a base.
+
+        Parâmetros:
+        - novos (pd.DataFrame): registros com RA normalizado e ANO_REFERENCIA
+
+        Retorno:
+        - tuple: (o próprio índice, relatório com received, inserted, updated,
+          unchanged e students_affected)
+        """
+        registros = {(linha[0], linha[1]): linha for linha in self._linhas(novos)}
+        relatorio = {
+            "received": int(len(novos)),
+            "inserted": 0,
+            "updated": 0,
+            "unchanged": 0,
+            "students_affected": 0,
+        }
+        insercao = (
+            f"INSERT OR REPLACE INTO historico (ra, ano, {self._SELECAO}) "
+            f"VALUES ({', '.join('?' * (len(Configuracoes.METRICAS_HISTORICAS) + 2))})"
+        )
+
+        conexao = sqlite3.connect(self._caminho)
+        try:
+            alterados = []
+            ras_novos = set()
+            for (ra, ano), linha in registros.items():
+                atual = conexao.execute(self.CONSULTA_REGISTRO, (ra, ano)).fetchone()
+                if atual is None:
+                    relatorio["inserted"] += 1
+                    if conexao.execute(self.CONSULTA_ALUNO_EXISTE, (ra,)).fetchone() is None:
+                        ras_novos.add(ra)
+                elif tuple(atual) != linha[2:]:
+                    relatorio["updated"] += 1
+                else:
+                    relatorio["unchanged"] += 1
+                    continue
+                alterados.append(linha)
+
+            relatorio["students_affected"] = len({linha[0] for linha in alterados})
+            if alterados:
+                conexao.executemany(insercao, alterados)
+                metadados = {
+                    "registros": self._metadados.get("registros", 0) + relatorio["inserted"],
+                    "alunos": self._metadados.get("alunos", 0) + len(ras_novos),
+                    "revisao": self._metadados.get("revisao", 0) + 1,
+                }
+                conexao.executemany(
+                    "INSERT OR REPLACE INTO metadados (chave, valor) VALUES (?, ?)",
+                    [(chave, json.dumps(valor)) for chave, valor in metadados.items()],
+                )
+                conexao.commit()
+        finally:
+            conexao.close()
+
+        if relatorio["students_affected"]:
+            self._metadados = self._ler_metadados()
+            self._consultar.cache_clear()
+        return self, relatorio
+
+    def _sincronizar_cache(self) -> None:
+        """
+        Descarta o cache LRU quando outra conexão alterou o arquivo.
+
+        Usa `PRAGMA data_version`, que muda para uma conexão sempre que outra
+        conexão (inclusive de outro processo) confirma uma escrita.
+        """
+        versao = self._conexao().execute("PRAGMA data_version").fetchone()[0]
+        anterior = getattr(self._local, "versao_dados", versao)
+        if versao != anterior:
+            self._consultar.cache_clear()
+            self._metadados = self._ler_metadados()
+        self._local.versao_dados = versao
+
+    def _consultar_banco(self, ra: str, ano_referencia: Optional[float]) -> Optional[Tuple[float, ...]]:
+        """
+        Executa a consulta no banco (envolvida pelo cache LRU).
+
+        Parâmetros:
+        - ra (str): RA normalizado
+        - ano_referencia (float | None): ano da predição
+
+        Retorno:
+        - tuple | None: métricas do registro encontrado
+        """
+        conexao = self._conexao()
+        if ano_referencia is None:
+            linha = conexao.execute(self.CONSULTA_PENULTIMO, (ra,)).fetchone()
+        else:
+            linha = conexao.execute(self.CONSULTA_ANTERIOR_AO_ANO, (ra, ano_referencia)).fetchone()
+        return None if linha is None else tuple(linha)
+
+    def _conexao(self) -> sqlite3.Connection:
+        """
+        Retorna a conexão somente leitura da thread atual, abrindo-a na primeira vez.
+
+        O módulo sqlite3 mantém por conexão o cache de statements preparados,
+        reaproveitado pelas consultas de texto fixo desta classe.
+
+        Retorno:
+        - sqlite3.Connection: conexão da thread
+        """
+        conexao = getattr(self._local, "conexao", None)
+        if conexao is None:
+            conexao = sqlite3.connect(
+                f"file:{self._caminho}?mode=ro",
+                uri=True,
+                cached_statements=self.CACHE_STATEMENTS,
+            )
+            conexao.execute("PRAGMA query_only = ON")
+            self._local.conexao = conexao
+        return conexao
+
+    def _ler_metadados(self) -> Dict[str, Any]:
+        """
+        Lê a tabela de metadados do arquivo.
+
+        Retorno:
+        - dict: metadados decodificados
+
+        Exceções:
+        - ValueError: quando o arquivo não contém metadados
+        """
+        linhas = self._conexao().execute("SELECT chave, valor FROM metadados").fetchall()
+        if not linhas:
+            raise ValueError(f"Feature Store SQLite sem metadados em {self._caminho}")
+        return {chave: json.loads(valor) for chave, valor in linhas}
+
+    @classmethod
+    def _gravar_registros(cls, lotes: Iterable[pd.DataFrame], caminho: str, origem: Any = None) -> int:
+        """
+        Cria o esquema e insere os lotes em um arquivo novo.
+
+        Parâmetros:
+        - lotes (Iterable[pd.DataFrame]): registros a inserir
+        - caminho (str): arquivo temporário de destino
+        - origem (Any): descrição dos arquivos de origem
+
+        Retorno:
+        - int: quantidade de registros gravados
+        """
+        metricas = Configuracoes.METRICAS_HISTORICAS
+        colunas = ", ".join(f'"{metrica}" REAL NOT NULL' for metrica in metricas)
+        insercao = (
+            f"INSERT OR REPLACE INTO historico (ra, ano, {cls._SELECAO}) "
+            f"VALUES ({', '.join('?' * (len(metricas) + 2))})"
+        )
+
+        conexao = sqlite3.connect(caminho)
+        try:
+            conexao.execute("PRAGMA journal_mode = OFF")
+            conexao.execute("PRAGMA synchronous = OFF")
+            conexao.execute(
+                f"CREATE TABLE historico (ra TEXT NOT NULL, ano INTEGER NOT NULL, {colunas}, "
+                "PRIMARY KEY (ra, ano)) WITHOUT ROWID"
+            )
+            conexao.execute("CREATE TABLE metadados (chave TEXT PRIMARY KEY, valor TEXT NOT NULL)")
+
+            for lote in lotes:
+                conexao.executemany(insercao, cls._linhas(lote))
+
+            registros, alunos = conexao.execute("SELECT COUNT(*), COUNT(DISTINCT ra) FROM historico").fetchone()
+            metadados = {
+                "versao": cls.VERSAO_BANCO,
+                "metricas": metricas,
+                "origem": origem,
+                "registros": registros,
+                "alunos": alunos,
+            }
+            conexao.executemany(
+                "INSERT INTO metadados (chave, valor) VALUES (?, ?)",
+                [(chave, json.dumps(valor)) for chave, valor in metadados.items()],
+            )
+            conexao.commit()
+        finally:
+            conexao.close()
+        return registros
+
+    @staticmethod
+    def _linhas(lote: pd.DataFrame) -> Iterable[tuple]:
+        """
+        Converte um lote em tuplas (ra, ano, métricas...) prontas para inserção.
+
+        Registros sem ano válido são descartados; métricas ausentes viram 0.
+
+        Parâmetros:
+        - lote (pd.DataFrame): registros com RA e ANO_REFERENCIA
+
+        Retorno:
+        - Iterable[tuple]: linhas para `executemany`
+        """
+        anos = pd.to_numeric(lote["ANO_REFERENCIA"], errors="coerce")
+        validos = anos.notna()
+        colunas = {
+            "ra": lote.loc[validos, "RA"].astype(str),
+            "ano": anos[validos].astype(np.int64),
+        }
+        for metrica in Configuracoes.METRICAS_HISTORICAS:
+            if metrica in lote.columns:
+                colunas[metrica] = pd.to_numeric(lote.loc[validos, metrica], errors="coerce").fillna(0.0)
+            else:
+                colunas[metrica] = 0.0
+        tabela = pd.DataFrame(colunas, index=lote.index[validos])
+        return (
+            (ra, int(ano), *map(float, metricas))
+            for ra, ano, *metricas in tabela.itertuples(index=False, name=None)
+        )
@@ -28,6 +28,7 @@ class LoggerPredicao:
 
     _instancia = None
     _lock = threading.Lock()
+    _preparado = False
 
     def __new__(cls):
         """
@@ -42,6 +43,30 @@ class LoggerPredicao:
                     cls._instancia = super(LoggerPredicao, cls).__new__(cls)
         return cls._instancia
 
+    def preparar(self) -> None:
+        """
+        Prepara o destino do log antes da primeira predição.
+
+        Responsabilidades:
+        - Criar o diretório do log
+        - Marcar o logger como pronto
+
+        Exceções:
+        - OSError: quando o diretório não pode ser criado
+        """
+        with self._lock:
+            os.makedirs(os.path.dirname(Configuracoes.LOG_PATH), exist_ok=True)
+            self._preparado = True
+
+    def esta_pronto(self) -> bool:
+        """
+        Indica se o logger foi preparado.
+
+        Retorno:
+        - bool: True quando `preparar` foi concluído
+        """
+        return self._preparado
+
     def registrar_predicao(self, features: dict, dados_predicao: dict, versao_modelo: str = "2.1.0"):
         """
         Escreve um registro de predição de forma atômica.
@@ -0,0 +1,355 @@
+"""
+Backtesting temporal com origem móvel.
+
+Responsabilidades:
+- Treinar e avaliar um modelo por ano de origem (treino < T, teste == T)
+- Processar cada dobra com estatísticas calculadas só nos anos de treino
+- Distribuir as dobras em processos que compartilham a matriz de engenharia
+- Consolidar métricas por dobra e agregadas com o tempo de execução
+"""
+
+import os
+import shutil
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+from sklearn.metrics import f1_score, precision_score, recall_score
+
+from src.application.feature_processor import ProcessadorFeatures
+from src.config.settings import Configuracoes
+from src.infrastructure.data.columnar_store import ArmazenamentoColunar
+from src.infrastructure.model.inference_benchmark import MedidorInferencia
+from src.infrastructure.model.ml_pipeline import PipelineML
+from src.util.helpers import resolver_workers, salvar_relatorio
+from src.util.logger import logger
+
+# Matriz aberta com memory-map por cada processo do pool (somente leitura).
+_MATRIZ_COMPARTILHADA: Optional[pd.DataFrame] = None
+# Dobras já processadas a partir da matriz compartilhada, por ano de teste.
+_DOBRAS_COMPARTILHADAS: Dict[Any, pd.DataFrame] = {}
+
+
+class BacktestTemporal:
+    """
+    Avalia o pipeline em várias origens temporais.
+
+    A engenharia de features (do cache de treino quando disponível) é feita
+    uma única vez e reaproveitada por todas as dobras. O processamento, que
+    imputa com estatísticas dos dados, é refeito em cada dobra apenas com os
+    anos de treino, para que o ano de teste não influencie o modelo avaliado.
+
+    Responsabilidades:
+    - Definir as dobras a partir de ANO_REFERENCIA
+    - Executar as dobras em série ou em um pool de processos
+    - Gravar o relatório em BACKTEST_PATH
+    """
+
+    METRICAS = ("recall", "f1_score", "precision")
+
+    def __init__(self, pipeline: Optional[PipelineML] = None):
+        """
+        Inicializa o backtesting.
+
+        Parâmetros:
+        - pipeline (PipelineML | None): pipeline usado para preparar as matrizes
+        """
+        self.pipeline = pipeline or PipelineML()
+
+    def executar(self, dados: pd.DataFrame) -> Dict[str, Any]:
+        """
+        Executa uma dobra por ano de origem e consolida as métricas.
+
+        Parâmetros:
+        - dados (pd.DataFrame): dados brutos
+
+        Retorno:
+        - dict: métricas por dobra, agregadas e tempos de execução
+
+        Exceções:
+        - ValueError: quando há menos de dois anos de referência
+        """
+        inicio = time.perf_counter()
+        dados_engenharia, dados_processados, _, _, _ = self.pipeline.obter_matrizes(dados)
+        features = PipelineML.selecionar_features(dados_processados)
+        matriz = matriz_engenharia(dados_engenharia)
+
+        anos = sorted(pd.unique(matriz["ANO_REFERENCIA"]))[1:]
+        if not anos:
+            raise ValueError("Backtesting exige ao menos dois anos de referência.")
+
+        workers = min(resolver_workers(Configuracoes.BACKTEST_WORKERS), len(anos))
+        logger.info(f"Backtesting: {len(anos)} dobras ({anos[0]}..{anos[-1]}) em {workers} processo(s)")
+        if workers > 1:
+            dobras = self._executar_em_paralelo(matriz, features, anos, workers)
+        else:
+            dobras = [avaliar_dobra(processar_dobra(matriz, ano), features, ano) for ano in anos]
+
+        relatorio = {
+            "timestamp": datetime.now().isoformat(),
+            "workers": workers,
+            "dobras": dobras,
+            "agregado": self._agregar(dobras),
+            "tempo_dobras_s": round(sum(dobra["tempo_s"] for dobra in dobras), 3),
+            "tempo_total_s": round(time.perf_counter() - inicio, 3),
+        }
+        logger.info(f"Backtesting concluído: {relatorio['agregado']} em {relatorio['tempo_total_s']}s")
+        salvar_relatorio(Configuracoes.BACKTEST_PATH, relatorio, "backtesting")
+        return relatorio
+
+    @staticmethod
+    def _executar_em_paralelo(matriz: pd.DataFrame, features: List[str], anos: list, workers: int) -> List[dict]:
+        """
+        Executa as dobras em um pool de processos que compartilham a matriz.
+
+        Parâmetros:
+        - matriz (pd.DataFrame): matriz de engenharia (ver `matriz_engenharia`)
+        - features (list[str]): features do modelo
+        - anos (list): anos de teste das dobras
+        - workers (int): máximo de processos
+
+        Retorno:
+        - list[dict]: métricas por dobra, na ordem dos anos
+        """
+        with pool_matriz_compartilhada(matriz, workers) as executor:
+            return list(executor.map(_avaliar_dobra_compartilhada, [features] * len(anos), anos))
+
+    @classmethod
+    def _agregar(cls, dobras: List[dict]) -> Dict[str, Any]:
+        """
+        Consolida as métricas das dobras avaliadas.
+
+        Parâmetros:
+        - dobras (list[dict]): métricas por dobra
+
+        Retorno:
+        - dict: média, desvio padrão e mínimo de cada métrica
+        """
+        avaliadas = [dobra for dobra in dobras if dobra["status"] == "ok"]
+        agregado: Dict[str, Any] = {
+            "dobras_avaliadas": len(avaliadas),
+            "dobras_ignoradas": len(dobras) - len(avaliadas),
+        }
+        for metrica in cls.METRICAS:
+            valores = np.array([dobra[metrica] for dobra in avaliadas], dtype=float)
+            if valores.size == 0:
+                continue
+            agregado[metrica] = {
+                "media": round(float(valores.mean()), 4),
+                "desvio": round(float(valores.std()), 4),
+                "minimo": round(float(valores.min()), 4),
+            }
+        return agregado
+
+
+def matriz_engenharia(dados_engenharia: pd.DataFrame) -> pd.DataFrame:
+    """
+    Recorta as colunas de engenharia que o processamento de uma dobra lê.
+
+    Parâmetros:
+    - dados_engenharia (pd.DataFrame): dados com alvo e lags, antes do processamento
+
+    Retorno:
+    - pd.DataFrame: colunas de features brutas, ANO_INGRESSO, alvo e ANO_REFERENCIA
+    """
+    brutas = dict.fromkeys(["ANO_INGRESSO", *Configuracoes.FEATURES_NUMERICAS, *Configuracoes.FEATURES_CATEGORICAS])
+    colunas = [coluna for coluna in brutas if coluna in dados_engenharia.columns]
+    return dados_engenharia[colunas + [Configuracoes.TARGET_COL, "ANO_REFERENCIA"]]
+
+
+def processar_dobra(matriz: pd.DataFrame, ano_teste) -> pd.DataFrame:
+    """
+    Processa as linhas de uma dobra com estatísticas apenas dos anos de treino.
+
+    Parâmetros:
+    - matriz (pd.DataFrame): matriz de engenharia (ver `matriz_engenharia`)
+    - ano_teste (Any): ano avaliado; anos posteriores são descartados
+
+    Retorno:
+    - pd.DataFrame: features processadas, alvo e ANO_REFERENCIA dos anos <= ano_teste
+    """
+    anos = matriz["ANO_REFERENCIA"].to_numpy()
+    linhas = matriz.loc[anos <= ano_teste]
+    estatisticas = PipelineML._calcular_estatisticas_treino(linhas, anos[anos <= ano_teste] < ano_teste)
+    processados = ProcessadorFeatures.processar(linhas, estatisticas=estatisticas)
+    processados[Configuracoes.TARGET_COL] = linhas[Configuracoes.TARGET_COL]
+    processados["ANO_REFERENCIA"] = linhas["ANO_REFERENCIA"]
+    return processados
+
+
+def avaliar_dobra(
+    matriz: pd.DataFrame,
+    features: List[str],
+    ano_teste,
+    configuracao: Optional[Dict[str, Any]] = None,
+    fracao_treino: float = 1.0,
+    medir_latencia: bool = False,
+) -> Dict[str, Any]:
+    """
+    Treina com os anos anteriores a `ano_teste` e avalia em `ano_teste`.
+
+    Parâmetros:
+    - matriz (pd.DataFrame): dobra processada por `processar_dobra`
+    - features (list[str]): features do modelo
+    - ano_teste (Any): ano avaliado
+    - configuracao (dict | None): classificador e hiperparâmetros (padrão: PipelineML.CONFIGURACAO_PADRAO)
+    - fracao_treino (float): fração amostrada das linhas de treino
+    - medir_latencia (bool): inclui a latência de inferência do modelo da dobra
+
+    Retorno:
+    - dict: métricas, tamanhos e tempo da dobra
+    """
+    inicio = time.perf_counter()
+    anos = matriz["ANO_REFERENCIA"].to_numpy()
+    mascara_treino = anos < ano_teste
+    mascara_teste = anos == ano_teste
+    if fracao_treino < 1.0:
+        mascara_treino = _amostrar_mascara(mascara_treino, fracao_treino)
+    alvo = matriz[Configuracoes.TARGET_COL]
+    alvo_treino, alvo_teste = alvo[mascara_treino], alvo[mascara_teste]
+
+    dobra: Dict[str, Any] = {
+        "ano_teste": int(ano_teste),
+        "anos_treino": [int(ano) for ano in sorted(pd.unique(anos[mascara_treino]))],
+        "train_size": int(mascara_treino.sum()),
+        "test_size": int(mascara_teste.sum()),
+    }
+    if alvo_treino.nunique() < 2:
+        logger.warning(f"Dobra {ano_teste} ignorada: treino com uma única classe.")
+        dobra.update({"status": "ignorada", "tempo_s": round(time.perf_counter() - inicio, 3)})
+        return dobra
+
+    matriz_treino = matriz.loc[mascara_treino, features]
+    matriz_teste = matriz.loc[mascara_teste, features]
+    modelo = PipelineML._criar_modelo(matriz_treino, configuracao)
+    modelo.fit(matriz_treino, alvo_treino)
+    probabilidades = modelo.predict_proba(matriz_teste)[:, 1]
+    threshold = PipelineML._calcular_threshold(alvo_teste, probabilidades)
+    predicoes = (probabilidades >= threshold).astype(int)
+
+    dobra.update({
+        "status": "ok",
+        "recall": round(float(recall_score(alvo_teste, predicoes, zero_division=0)), 4),
+        "f1_score": round(float(f1_score(alvo_teste, predicoes, zero_division=0)), 4),
+        "precision": round(float(precision_score(alvo_teste, predicoes, zero_division=0)), 4),
+        "risk_threshold": round(float(threshold), 4),
+        "tempo_s": round(time.perf_counter() - inicio, 3),
+    })
+    if medir_latencia:
+        dobra["latencia"] = MedidorInferencia.medir_latencia(modelo, matriz_teste)
+    logger.info(f"Dobra {ano_teste}: {dobra}")
+    return dobra
+
+
+def _amostrar_mascara(mascara: np.ndarray, fracao: float) -> np.ndarray:
+    """
+    Mantém uma fração determinística das linhas selecionadas pela máscara.
+
+    Parâmetros:
+    - mascara (np.ndarray): máscara booleana original
+    - fracao (float): fração mantida, entre 0 e 1
+
+    Retorno:
+    - np.ndarray: nova máscara booleana
+    """
+    indices = np.flatnonzero(mascara)
+    tamanho = min(len(indices), max(2, int(round(len(indices) * fracao))))
+    rng = np.random.default_rng(Configuracoes.RANDOM_STATE)
+    amostrada = np.zeros_like(mascara, dtype=bool)
+    amostrada[rng.choice(indices, size=tamanho, replace=False)] = True
+    return amostrada
+
+
+@contextmanager
+def pool_matriz_compartilhada(matriz: pd.DataFrame, workers: int) -> Iterator[ProcessPoolExecutor]:
+    """
+    Abre um pool de processos em que cada processo lê a mesma matriz.
+
+    A matriz é gravada uma vez em formato colunar e cada processo a abre com
+    memory-map somente leitura, sem copiar os dados por tarefa. As tarefas a
+    acessam por `matriz_compartilhada()`.
+
+    Parâmetros:
+    - matriz (pd.DataFrame): matriz compartilhada
+    - workers (int): máximo de processos
+
+    Retorno:
+    - Iterator[ProcessPoolExecutor]: pool pronto para receber tarefas
+    """
+    os.makedirs(Configuracoes.TRAINING_CACHE_DIR, exist_ok=True)
+    diretorio = tempfile.mkdtemp(prefix="pool-", dir=Configuracoes.TRAINING_CACHE_DIR)
+    try:
+        caminho_matriz = os.path.join(diretorio, "matriz")
+        ArmazenamentoColunar.salvar(matriz, caminho_matriz)
+        executor = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_abrir_matriz_compartilhada,
+            initargs=(caminho_matriz,),
+        )
+        try:
+            yield executor
+        finally:
+            # Sem esperar: tarefas já em execução não podem ser canceladas e
+            # terminam em segundo plano em vez de estourar o orçamento de quem usa o pool.
+            executor.shutdown(wait=False, cancel_futures=True)
+    finally:
+        shutil.rmtree(diretorio, ignore_errors=True)
+
+
+def matriz_compartilhada() -> pd.DataFrame:
+    """
+    Retorna a matriz aberta pelo processo corrente do pool.
+
+    Retorno:
+    - pd.DataFrame: matriz somente leitura
+    """
+    return _MATRIZ_COMPARTILHADA
+
+
+def dobra_compartilhada(ano_teste) -> pd.DataFrame:
+    """
+    Retorna a dobra processada a partir da matriz compartilhada.
+
+    Cada processo processa uma dobra na primeira vez que ela é pedida e
+    reaproveita o resultado nas tarefas seguintes.
+
+    Parâmetros:
+    - ano_teste (Any): ano avaliado
+
+    Retorno:
+    - pd.DataFrame: dobra processada por `processar_dobra`
+    """
+    if ano_teste not in _DOBRAS_COMPARTILHADAS:
+        _DOBRAS_COMPARTILHADAS[ano_teste] = processar_dobra(_MATRIZ_COMPARTILHADA, ano_teste)
+    return _DOBRAS_COMPARTILHADAS[ano_teste]
+
+
+def _abrir_matriz_compartilhada(caminho_matriz: str) -> None:
+    """
+    Inicializa um processo do pool abrindo a matriz com memory-map.
+
+    Parâmetros:
+    - caminho_matriz (str): diretório gravado por ArmazenamentoColunar
+    """
+    global _MATRIZ_COMPARTILHADA
+    _MATRIZ_COMPARTILHADA = ArmazenamentoColunar.carregar(caminho_matriz, mmap=True)
+    _DOBRAS_COMPARTILHADAS.clear()
+
+
+def _avaliar_dobra_compartilhada(features: List[str], ano_teste) -> Dict[str, Any]:
+    """
+    Ponto de entrada dos processos: avalia uma dobra sobre a matriz compartilhada.
+
+    Parâmetros:
+    - features (list[str]): features do modelo
+    - ano_teste (Any): ano avaliado
+
+    Retorno:
+    - dict: métricas da dobra
+    """
+    return avaliar_dobra(dobra_compartilhada(ano_teste), features, ano_teste)
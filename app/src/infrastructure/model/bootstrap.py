@@ -0,0 +1,121 @@
+"""
+Intervalos de confiança bootstrap para métricas de classificação binária.
+
+Responsabilidades:
+- Reduzir as predições de teste às contagens da matriz de confusão
+- Reamostrar as contagens de forma vetorizada
+- Calcular intervalos percentis de recall, precisão e F1
+"""
+
+from typing import Dict, Optional
+
+import numpy as np
+
+from src.application.group_metrics import MatrizConfusaoGrupos
+from src.config.settings import Configuracoes
+
+
+class IntervalosBootstrap:
+    """
+    Bootstrap percentil sobre as contagens TP/FP/FN/TN.
+
+    Reamostrar n linhas com reposição e recontar a matriz de confusão equivale a
+    sortear uma multinomial com n tentativas e as frequências observadas das
+    quatro células. Por isso o custo independe do tamanho do conjunto de teste:
+    milhares de reamostragens de vários grupos saem de uma única chamada.
+
+    Responsabilidades:
+    - Contar a matriz de confusão das predições
+    - Sortear as reamostragens de todos os grupos de uma vez
+    - Resumir cada métrica pelos percentis do nível de confiança
+    """
+
+    METRICAS = ("recall", "precision", "f1_score")
+
+    @staticmethod
+    def contar(alvo, predicoes) -> np.ndarray:
+        """
+        Conta a matriz de confusão binária.
+
+        Parâmetros:
+        - alvo (array-like): valores reais (0/1)
+        - predicoes (array-like): predições (0/1)
+
+        Retorno:
+        - np.ndarray: contagens [TP, FP, FN, TN]
+        """
+        alvo = np.asarray(alvo) == 1
+        predicoes = np.asarray(predicoes) == 1
+        return np.array([
+            np.sum(alvo & predicoes),
+            np.sum(~alvo & predicoes),
+            np.sum(alvo & ~predicoes),
+            np.sum(~alvo & ~predicoes),
+        ], dtype=np.int64)
+
+    @classmethod
+    def metricas(cls, contagens: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Calcula recall, precisão e F1 a partir das contagens (zero_division=0).
+
+        Parâmetros:
+        - contagens (np.ndarray): [..., 4] com TP, FP, FN, TN no último eixo
+
+        Retorno:
+        - dict[str, np.ndarray]: métrica -> valores com o formato dos eixos iniciais
+        """
+        taxas = MatrizConfusaoGrupos.taxas(contagens)
+        return {metrica: taxas[metrica] for metrica in cls.METRICAS}
+
+    @classmethod
+    def calcular(
+        cls,
+        contagens: np.ndarray,
+        reamostragens: Optional[int] = None,
+        confianca: Optional[float] = None,
+        semente: Optional[int] = None,
+    ) -> Dict[str, Dict[str, np.ndarray]]:
+        """
+        Calcula intervalos de confiança para um ou vários grupos.
+
+        Parâmetros:
+        - contagens (np.ndarray): [4] ou [grupos, 4] com TP, FP, FN, TN
+        - reamostragens (int | None): sorteios por grupo (padrão: BOOTSTRAP_RESAMPLES)
+        - confianca (float | None): nível do intervalo (padrão: BOOTSTRAP_CONFIDENCE)
+        - semente (int | None): semente do gerador (padrão: RANDOM_STATE)
+
+        Retorno:
+        - dict: métrica -> {"lower", "upper"} com um valor por grupo
+        """
+        reamostragens = reamostragens or Configuracoes.BOOTSTRAP_RESAMPLES
+        confianca = confianca or Configuracoes.BOOTSTRAP_CONFIDENCE
+        rng = np.random.default_rng(Configuracoes.RANDOM_STATE if semente is None else semente)
+
+        contagens = np.atleast_2d(np.asarray(contagens, dtype=np.int64))
+        totais = contagens.sum(axis=1)
+        frequencias = contagens / np.maximum(totais, 1)[:, None]
+        frequencias[totais == 0] = [0.0, 0.0, 0.0, 1.0]
+
+        sorteios = rng.multinomial(totais, frequencias, size=(reamostragens, len(contagens)))
+        alfa = (1 - confianca) / 2
+        return {
+            metrica: dict(zip(("lower", "upper"), np.quantile(valores, [alfa, 1 - alfa], axis=0)))
+            for metrica, valores in cls.metricas(sorteios).items()
+        }
+
+    @classmethod
+    def resumir(cls, intervalos: Dict[str, Dict[str, np.ndarray]], posicao: int = 0) -> Dict[str, Dict[str, float]]:
+        """
+        Extrai os intervalos de um grupo em formato serializável.
+
+        Parâmetros:
+        - intervalos (dict): retorno de `calcular`
+        - posicao (int): índice do grupo
+
+        Retorno:
+        - dict: métrica -> {"lower": float, "upper": float}
+        """
+        return {
+            metrica: {limite: round(float(valores[posicao]), 4) for limite, valores in intervalos[metrica].items()}
+            for metrica in cls.METRICAS
+        }
@@ -0,0 +1,331 @@
+"""
+Busca de hiperparâmetros por successive halving com orçamento de tempo.
+
+Responsabilidades:
+- Declarar o espaço de busca do RandomForest e de classificadores alternativos
+- Avaliar candidatos em dobras temporais sobre as matrizes em cache
+- Descartar candidatos a cada rodada e aumentar a fração de treino dos restantes
+- Registrar métricas e latência de inferência de cada candidato
+"""
+
+import itertools
+import math
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from contextlib import ExitStack
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.config.settings import Configuracoes
+from src.infrastructure.model.backtesting import (
+    avaliar_dobra,
+    dobra_compartilhada,
+    matriz_engenharia,
+    pool_matriz_compartilhada,
+    processar_dobra,
+)
+from src.infrastructure.model.ml_pipeline import PipelineML
+from src.util.helpers import resolver_workers, salvar_relatorio
+from src.util.logger import logger
+
+
+class BuscaHiperparametros:
+    """
+    Seleciona a configuração do classificador antes do treino final.
+
+    As dobras de validação usam apenas anos anteriores ao ano de teste do
+    Quality Gate (treino < T, validação == T), para que a configuração escolhida
+    seja avaliada pelo gate em dados não vistos pela busca.
+
+    Responsabilidades:
+    - Gerar os candidatos a partir da grade declarada
+    - Executar as rodadas em série ou em um pool de processos
+    - Interromper a busca quando o orçamento de tempo se esgota
+    - Gravar o relatório em HYPERPARAM_SEARCH_PATH
+    """
+
+    # Modelo -> hiperparâmetro -> valores avaliados.
+    GRADE: Dict[str, Dict[str, tuple]] = {
+        "random_forest": {
+            "n_estimators": (100, 200, 400),
+            "max_depth": (6, 10, None),
+            "min_samples_leaf": (1, 5),
+        },
+        "extra_trees": {
+            "n_estimators": (200, 400),
+            "max_depth": (10, None),
+            "min_samples_leaf": (1, 5),
+        },
+        "logistic_regression": {
+            "C": (0.1, 1.0, 10.0),
+        },
+    }
+
+    # Fração de treino da primeira rodada; cada rodada multiplica por ETA até 1.
+    FRACAO_MINIMA = 1 / 9
+
+    def __init__(self, pipeline: Optional[PipelineML] = None):
+        """
+        Inicializa a busca.
+
+        Parâmetros:
+        - pipeline (PipelineML | None): pipeline usado para preparar as matrizes
+        """
+        self.pipeline = pipeline or PipelineML()
+
+    @classmethod
+    def gerar_candidatos(cls) -> List[Dict[str, Any]]:
+        """
+        Expande a grade em configurações aceitas por `PipelineML._criar_modelo`.
+
+        Retorno:
+        - list[dict]: configurações com "modelo" e "parametros"
+        """
+        candidatos = []
+        for modelo, grade in cls.GRADE.items():
+            nomes = list(grade)
+            for valores in itertools.product(*(grade[nome] for nome in nomes)):
+                candidatos.append({"modelo": modelo, "parametros": dict(zip(nomes, valores))})
+        return candidatos
+
+    def executar(self, dados: pd.DataFrame) -> Dict[str, Any]:
+        """
+        Executa o successive halving e retorna o relatório com a melhor configuração.
+
+        Parâmetros:
+        - dados (pd.DataFrame): dados brutos
+
+        Retorno:
+        - dict: melhor configuração, rodadas com métricas e latência, e tempos
+
+        Exceções:
+        - ValueError: quando há menos de três anos de referência
+        """
+        inicio = time.perf_counter()
+        dados_engenharia, dados_processados, _, _, _ = self.pipeline.obter_matrizes(dados)
+        features = PipelineML.selecionar_features(dados_processados)
+        matriz = matriz_engenharia(dados_engenharia)
+
+        anos = sorted(pd.unique(matriz["ANO_REFERENCIA"]))
+        anos_validacao = anos[1:-1]
+        if not anos_validacao:
+            raise ValueError("Busca de hiperparâmetros exige ao menos três anos de referência.")
+        matriz = matriz[matriz["ANO_REFERENCIA"] < anos[-1]]
+
+        candidatos = self.gerar_candidatos()
+        eta = max(2, Configuracoes.HYPERPARAM_SEARCH_ETA)
+        orcamento = Configuracoes.HYPERPARAM_SEARCH_BUDGET_S
+        workers = resolver_workers(Configuracoes.HYPERPARAM_SEARCH_WORKERS)
+        logger.info(
+            f"Busca de hiperparâmetros: {len(candidatos)} candidatos, dobras {anos_validacao}, "
+            f"{workers} processo(s), orçamento {orcamento}s"
+        )
+
+        rodadas: List[Dict[str, Any]] = []
+        interrompida = False
+        with ExitStack() as pilha:
+            executor, dobras = None, None
+            if workers > 1:
+                executor = pilha.enter_context(pool_matriz_compartilhada(matriz, workers))
+            else:
+                dobras = {ano: processar_dobra(matriz, ano) for ano in anos_validacao}
+            for numero, fracao in enumerate(self._fracoes(eta)):
+                restante = orcamento - (time.perf_counter() - inicio)
+                if restante <= 0:
+                    interrompida = True
+                    break
+                resultados = self._avaliar_rodada(
+                    executor, dobras, candidatos, features, fracao, anos_validacao, restante
+                )
+                completa = len(resultados) == len(candidatos)
+                rodadas.append({
+                    "rodada": numero,
+                    "fracao_treino": round(fracao, 4),
+                    "completa": completa,
+                    "candidatos": resultados,
+                })
+                logger.info(f"Rodada {numero} (fração {fracao:.3f}): {len(resultados)}/{len(candidatos)} avaliados")
+                if not completa:
+                    interrompida = True
+                    break
+                sobreviventes = self._ordenar(resultados)[: math.ceil(len(resultados) / eta)]
+                candidatos = [resultado["configuracao"] for resultado in sobreviventes]
+
+        melhor = self._escolher_melhor(rodadas)
+        relatorio = {
+            "timestamp": datetime.now().isoformat(),
+            "workers": workers,
+            "orcamento_s": orcamento,
+            "interrompida_por_orcamento": interrompida,
+            "anos_validacao": [int(ano) for ano in anos_validacao],
+            "melhor": melhor,
+            "rodadas": rodadas,
+            "tempo_total_s": round(time.perf_counter() - inicio, 3),
+        }
+        logger.info(f"Melhor configuração: {melhor} em {relatorio['tempo_total_s']}s")
+        salvar_relatorio(Configuracoes.HYPERPARAM_SEARCH_PATH, relatorio, "busca de hiperparâmetros")
+        return relatorio
+
+    @staticmethod
+    def _avaliar_rodada(
+        executor: Optional[ProcessPoolExecutor],
+        dobras: Optional[Dict[Any, pd.DataFrame]],
+        candidatos: List[dict],
+        features: List[str],
+        fracao: float,
+        anos: list,
+        restante: float,
+    ) -> List[dict]:
+        """
+        Avalia os candidatos de uma rodada dentro do tempo restante.
+
+        No pool, todos os candidatos são submetidos de uma vez; ao fim do
+        orçamento as tarefas pendentes são canceladas e as que já estão em
+        execução são descartadas (terminam em segundo plano, sem prender a busca).
+
+        Parâmetros:
+        - executor (ProcessPoolExecutor | None): pool com a matriz compartilhada, ou None para série
+        - dobras (dict | None): dobras processadas por ano, usadas na execução em série
+        - candidatos (list[dict]): configurações
+        - features (list[str]): features do modelo
+        - fracao (float): fração de treino da rodada
+        - anos (list): anos de validação
+        - restante (float): segundos disponíveis
+
+        Retorno:
+        - list[dict]: resultados dos candidatos concluídos, na ordem dos candidatos
+        """
+        limite = time.perf_counter() + restante
+        if executor is None:
+            resultados = []
+            for configuracao in candidatos:
+                if time.perf_counter() >= limite:
+                    break
+                resultados.append(_avaliar_candidato(dobras, features, configuracao, fracao, anos))
+            return resultados
+
+        futuros = [
+            executor.submit(_avaliar_candidato_compartilhado, features, configuracao, fracao, anos)
+            for configuracao in candidatos
+        ]
+        pendentes = set(futuros)
+        while pendentes and time.perf_counter() < limite:
+            _, pendentes = wait(pendentes, timeout=limite - time.perf_counter(), return_when=FIRST_COMPLETED)
+        for futuro in pendentes:
+            futuro.cancel()
+        return [futuro.result() for futuro in futuros if futuro.done() and not futuro.cancelled()]
+
+    @classmethod
+    def _fracoes(cls, eta: int) -> List[float]:
+        """
+        Calcula a fração de treino de cada rodada.
+
+        Parâmetros:
+        - eta (int): fator de redução dos candidatos e de aumento da fração
+
+        Retorno:
+        - list[float]: frações crescentes terminando em 1.0
+        """
+        rodadas = max(1, math.ceil(math.log(1 / cls.FRACAO_MINIMA, eta) - 1e-9) + 1)
+        return [min(1.0, cls.FRACAO_MINIMA * eta ** rodada) for rodada in range(rodadas)]
+
+    @staticmethod
+    def _ordenar(resultados: List[dict]) -> List[dict]:
+        """
+        Ordena candidatos: primeiro os que atingem MIN_RECALL, depois por F1.
+
+        Parâmetros:
+        - resultados (list[dict]): resultados de uma rodada
+
+        Retorno:
+        - list[dict]: resultados do melhor para o pior
+        """
+        return sorted(
+            resultados,
+            key=lambda r: (r.get("recall", 0) >= Configuracoes.MIN_RECALL, r.get("f1_score", -1)),
+            reverse=True,
+        )
+
+    @classmethod
+    def _escolher_melhor(cls, rodadas: List[dict]) -> Dict[str, Any]:
+        """
+        Escolhe o melhor candidato da última rodada completa.
+
+        Uma rodada cortada pelo orçamento só contém os candidatos que terminaram
+        primeiro (os mais rápidos de treinar) e por isso não entra na escolha.
+
+        Parâmetros:
+        - rodadas (list[dict]): rodadas executadas
+
+        Retorno:
+        - dict: configuração vencedora (CONFIGURACAO_PADRAO se nenhuma rodada completou)
+        """
+        for rodada in reversed(rodadas):
+            if not rodada["completa"]:
+                continue
+            avaliados = [r for r in rodada["candidatos"] if "f1_score" in r]
+            if avaliados:
+                return cls._ordenar(avaliados)[0]["configuracao"]
+        logger.warning("Nenhuma rodada completa dentro do orçamento. Usando a configuração padrão.")
+        return PipelineML.CONFIGURACAO_PADRAO
+
+
+def _avaliar_candidato(
+    dobras: Dict[Any, pd.DataFrame],
+    features: List[str],
+    configuracao: Dict[str, Any],
+    fracao: float,
+    anos: list,
+) -> Dict[str, Any]:
+    """
+    Avalia uma configuração em todas as dobras de validação.
+
+    Parâmetros:
+    - dobras (dict): dobra processada por `processar_dobra` para cada ano de validação
+    - features (list[str]): features do modelo
+    - configuracao (dict): classificador e hiperparâmetros
+    - fracao (float): fração de treino
+    - anos (list): anos de validação
+
+    Retorno:
+    - dict: configuração, médias das métricas, latência da última dobra e tempo
+    """
+    inicio = time.perf_counter()
+    dobras = [
+        avaliar_dobra(dobras[ano], features, ano, configuracao, fracao, medir_latencia=(ano == anos[-1]))
+        for ano in anos
+    ]
+    avaliadas = [dobra for dobra in dobras if dobra["status"] == "ok"]
+    resultado: Dict[str, Any] = {"configuracao": configuracao, "dobras_avaliadas": len(avaliadas)}
+    if avaliadas:
+        for metrica in ("recall", "f1_score", "precision"):
+            resultado[metrica] = round(float(np.mean([dobra[metrica] for dobra in avaliadas])), 4)
+        if "latencia" in dobras[-1]:
+            resultado["latencia"] = dobras[-1]["latencia"]
+    resultado["tempo_s"] = round(time.perf_counter() - inicio, 3)
+    return resultado
+
+
+def _avaliar_candidato_compartilhado(
+    features: List[str],
+    configuracao: Dict[str, Any],
+    fracao: float,
+    anos: list,
+) -> Dict[str, Any]:
+    """
+    Ponto de entrada dos processos: avalia um candidato sobre a matriz compartilhada.
+
+    Parâmetros:
+    - features (list[str]): features do modelo
+    - configuracao (dict): classificador e hiperparâmetros
+    - fracao (float): fração de treino
+    - anos (list): anos de validação
+
+    Retorno:
+    - dict: resultado do candidato
+    """
+    dobras = {ano: dobra_compartilhada(ano) for ano in anos}
+    return _avaliar_candidato(dobras, features, configuracao, fracao, anos)
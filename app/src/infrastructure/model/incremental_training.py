@@ -0,0 +1,181 @@
+"""
+Retreino incremental do modelo promovido.
+
+Responsabilidades:
+- Carregar o modelo promovido e verificar se ele aceita novas árvores
+- Identificar os anos de treino que o modelo ainda não viu
+- Acrescentar árvores treinadas só nesses anos e aposentar as mais antigas
+"""
+
+import json
+import os
+import warnings
+from typing import Any, Dict, List, Optional, Tuple
+
+import pandas as pd
+from joblib import load
+from sklearn.ensemble import ExtraTreesClassifier, RandomForestClassifier
+
+from src.config.settings import Configuracoes
+from src.infrastructure.model.model_manager import GerenciadorModelo
+from src.util.logger import logger
+
+
+class TreinoIncremental:
+    """
+    Warm start de florestas sobre os anos novos.
+
+    O pré-processador do modelo promovido fica congelado: as árvores existentes
+    dependem da escala e das categorias aprendidas nele. As novas árvores são
+    ajustadas apenas nas linhas dos anos que não constam em `trained_years` das
+    métricas promovidas, de modo que o custo do ajuste acompanha o volume novo.
+    Sempre que o incremental não se aplica, `ajustar` retorna None e o chamador
+    segue com o treino completo.
+
+    Responsabilidades:
+    - Validar modelo, métricas, features e classes antes de alterar a floresta
+    - Ajustar INCREMENTAL_NEW_TREES árvores com warm start
+    - Manter no máximo INCREMENTAL_MAX_TREES árvores (0 desativa o limite)
+    """
+
+    CLASSIFICADORES = (RandomForestClassifier, ExtraTreesClassifier)
+
+    @classmethod
+    def ajustar(
+        cls,
+        matriz_treino: pd.DataFrame,
+        alvo_treino: pd.Series,
+        anos_treino: pd.Series,
+    ) -> Optional[Tuple[Any, Dict[str, Any]]]:
+        """
+        Atualiza o modelo promovido com os anos de treino ainda não vistos.
+
+        Parâmetros:
+        - matriz_treino (pd.DataFrame): features de treino de todos os anos
+        - alvo_treino (pd.Series): alvo de treino
+        - anos_treino (pd.Series): ANO_REFERENCIA de cada linha de treino
+
+        Retorno:
+        - tuple | None: modelo atualizado e detalhes do incremental, ou None para treino completo
+        """
+        base = cls._carregar_base(list(matriz_treino.columns))
+        if base is None:
+            return None
+        modelo, metricas_atuais = base
+
+        anos_novos = cls._anos_novos(metricas_atuais["trained_years"], anos_treino)
+        if not anos_novos:
+            return None
+
+        mascara_nova = anos_treino.isin(anos_novos).to_numpy()
+        alvo_novo = alvo_treino[mascara_nova]
+        classificador = modelo.named_steps["classifier"]
+        if set(pd.unique(alvo_novo)) != set(classificador.classes_):
+            logger.warning("Anos novos não contêm todas as classes do modelo. Usando treino completo.")
+            return None
+
+        detalhes = cls._acrescentar_arvores(
+            classificador,
+            modelo.named_steps["preprocessor"].transform(matriz_treino[mascara_nova]),
+            alvo_novo,
+        )
+        configuracao = dict(metricas_atuais.get("model_config") or {})
+        configuracao["parametros"] = {
+            **configuracao.get("parametros", {}),
+            "n_estimators": detalhes["n_estimators"],
+        }
+        logger.info(f"Treino incremental: anos {anos_novos}, {detalhes}")
+        return modelo, {
+            "base_model_version": metricas_atuais.get("model_version"),
+            "new_years": anos_novos,
+            "new_rows": int(mascara_nova.sum()),
+            **detalhes,
+            "model_config": configuracao,
+        }
+
+    @classmethod
+    def _carregar_base(cls, features: List[str]) -> Optional[Tuple[Any, Dict[str, Any]]]:
+        """
+        Carrega o modelo e as métricas promovidos, se servirem de base.
+
+        Parâmetros:
+        - features (list[str]): features do treino atual, na ordem de uso
+
+        Retorno:
+        - tuple | None: modelo e métricas promovidos, ou None quando não há base válida
+        """
+        if not (os.path.exists(Configuracoes.MODEL_PATH) and os.path.exists(Configuracoes.METRICS_FILE)):
+            logger.warning("Nenhum modelo promovido para o treino incremental. Usando treino completo.")
+            return None
+        try:
+            with open(Configuracoes.METRICS_FILE, "r") as arquivo:
+                metricas_atuais = json.load(arquivo)
+            if not metricas_atuais.get("trained_years"):
+                logger.warning("Métricas promovidas sem trained_years. Usando treino completo.")
+                return None
+            GerenciadorModelo._validar_hash_modelo()
+            modelo = load(Configuracoes.MODEL_PATH)
+        except Exception as erro:
+            logger.warning(f"Falha ao carregar o modelo promovido: {erro}. Usando treino completo.")
+            return None
+
+        passos = getattr(modelo, "named_steps", {})
+        if not isinstance(passos.get("classifier"), cls.CLASSIFICADORES) or "preprocessor" not in passos:
+            logger.warning("Modelo promovido não é uma floresta. Usando treino completo.")
+            return None
+        if list(getattr(passos["preprocessor"], "feature_names_in_", [])) != features:
+            logger.warning("Features do modelo promovido diferem das atuais. Usando treino completo.")
+            return None
+        return modelo, metricas_atuais
+
+    @staticmethod
+    def _anos_novos(anos_vistos: List[int], anos_treino: pd.Series) -> List[int]:
+        """
+        Lista os anos de treino que o modelo promovido ainda não viu.
+
+        Parâmetros:
+        - anos_vistos (list[int]): trained_years das métricas promovidas
+        - anos_treino (pd.Series): ANO_REFERENCIA das linhas de treino
+
+        Retorno:
+        - list[int]: anos novos em ordem crescente (vazia quando o incremental não se aplica)
+        """
+        disponiveis = {int(ano) for ano in anos_treino.unique()}
+        if not set(anos_vistos) <= disponiveis:
+            logger.warning("Anos do modelo promovido ausentes no treino atual. Usando treino completo.")
+            return []
+        anos_novos = sorted(disponiveis - set(anos_vistos))
+        if not anos_novos:
+            logger.warning("Nenhum ano novo desde o modelo promovido. Usando treino completo.")
+        return anos_novos
+
+    @staticmethod
+    def _acrescentar_arvores(classificador, matriz_nova, alvo_novo) -> Dict[str, int]:
+        """
+        Ajusta novas árvores com warm start e aposenta as mais antigas.
+
+        Parâmetros:
+        - classificador (RandomForestClassifier | ExtraTreesClassifier): floresta treinada
+        - matriz_nova: linhas novas já transformadas pelo pré-processador
+        - alvo_novo (pd.Series): alvo das linhas novas
+
+        Retorno:
+        - dict: árvores acrescentadas, aposentadas e total final
+        """
+        acrescentadas = Configuracoes.INCREMENTAL_NEW_TREES
+        classificador.set_params(warm_start=True, n_estimators=len(classificador.estimators_) + acrescentadas)
+        with warnings.catch_warnings():
+            # O class_weight "balanced" passa a refletir só os anos novos, que é o desejado aqui.
+            warnings.filterwarnings("ignore", message=".*warm_start.*", category=UserWarning)
+            classificador.fit(matriz_nova, alvo_novo)
+
+        aposentadas = 0
+        if 0 < Configuracoes.INCREMENTAL_MAX_TREES < len(classificador.estimators_):
+            aposentadas = len(classificador.estimators_) - Configuracoes.INCREMENTAL_MAX_TREES
+            classificador.estimators_ = classificador.estimators_[aposentadas:]
+        classificador.set_params(warm_start=False, n_estimators=len(classificador.estimators_))
+        return {
+            "trees_added": acrescentadas,
+            "trees_retired": aposentadas,
+            "n_estimators": len(classificador.estimators_),
+        }
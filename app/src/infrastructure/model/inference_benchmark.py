@@ -0,0 +1,93 @@
+"""
+Medição do custo de inferência de um modelo treinado.
+
+Responsabilidades:
+- Medir a latência de predição unitária e em lote
+- Medir o tamanho serializado do modelo
+- Usar amostras reais da matriz de avaliação
+"""
+
+import io
+import time
+from typing import Any, Dict, Optional
+
+import numpy as np
+import pandas as pd
+from joblib import dump
+
+from src.config.settings import Configuracoes
+
+
+class MedidorInferencia:
+    """
+    Mede a latência de `predict_proba` nos tamanhos de requisição da API.
+
+    Responsabilidades:
+    - Aquecer o modelo antes da medição
+    - Reportar a mediana de várias repetições em milissegundos
+    - Reportar o tamanho do artefato que seria gravado em disco
+    """
+
+    TAMANHO_LOTE = 256
+
+    @classmethod
+    def medir_latencia(
+        cls,
+        modelo: Any,
+        matriz: pd.DataFrame,
+        repeticoes: Optional[int] = None,
+    ) -> Dict[str, float]:
+        """
+        Mede a latência de uma linha e de um lote de linhas.
+
+        Parâmetros:
+        - modelo (Any): modelo com `predict_proba`
+        - matriz (pd.DataFrame): linhas de entrada do modelo
+        - repeticoes (int | None): medições por tamanho (padrão: LATENCY_BENCHMARK_REPEATS)
+
+        Retorno:
+        - dict: medianas em ms para uma linha e para o lote
+        """
+        repeticoes = repeticoes or Configuracoes.LATENCY_BENCHMARK_REPEATS
+        indices = np.resize(np.arange(len(matriz)), cls.TAMANHO_LOTE)
+        lote = matriz.iloc[indices]
+        return {
+            "unitaria_ms": cls._mediana_ms(modelo, matriz.iloc[:1], repeticoes),
+            f"lote_{cls.TAMANHO_LOTE}_ms": cls._mediana_ms(modelo, lote, repeticoes),
+        }
+
+    @staticmethod
+    def medir_tamanho_mb(modelo: Any) -> float:
+        """
+        Mede o tamanho do modelo serializado como na promoção (joblib, sem compressão).
+
+        Parâmetros:
+        - modelo (Any): modelo treinado
+
+        Retorno:
+        - float: tamanho em MB
+        """
+        buffer = io.BytesIO()
+        dump(modelo, buffer)
+        return round(buffer.getbuffer().nbytes / 1024 / 1024, 3)
+
+    @staticmethod
+    def _mediana_ms(modelo: Any, entrada: pd.DataFrame, repeticoes: int) -> float:
+        """
+        Executa `predict_proba` repetidas vezes e retorna a mediana.
+
+        Parâmetros:
+        - modelo (Any): modelo com `predict_proba`
+        - entrada (pd.DataFrame): linhas avaliadas
+        - repeticoes (int): medições
+
+        Retorno:
+        - float: mediana em milissegundos
+        """
+        modelo.predict_proba(entrada)
+        tempos = []
+        for _ in range(repeticoes):
+            inicio = time.perf_counter()
+            modelo.predict_proba(entrada)
+            tempos.append(time.perf_counter() - inicio)
+        return round(float(np.median(tempos)) * 1000, 3)
@@ -12,21 +12,29 @@ import json
 import os
 import shutil
 from datetime import datetime
-from typing import Dict, Any, Tuple
+from typing import Dict, Any, Optional, Tuple
 
 import numpy as np
 import pandas as pd
-from joblib import dump
+from joblib import dump, load
 from sklearn.compose import ColumnTransformer
-from sklearn.ensemble import RandomForestClassifier
+from sklearn.ensemble import ExtraTreesClassifier, RandomForestClassifier
 from sklearn.impute import SimpleImputer
+from sklearn.linear_model import LogisticRegression
 from sklearn.metrics import recall_score, f1_score, precision_score, precision_recall_curve
 from sklearn.pipeline import Pipeline
 from sklearn.preprocessing import OneHotEncoder, StandardScaler
 
 from src.application.feature_processor import ProcessadorFeatures
+from src.application.group_metrics import MatrizConfusaoGrupos
 from src.config.settings import Configuracoes
+from src.infrastructure.model.bootstrap import IntervalosBootstrap
+from src.infrastructure.model.incremental_training import TreinoIncremental
+from src.infrastructure.model.inference_benchmark import MedidorInferencia
+from src.infrastructure.model.model_manager import GerenciadorModelo
+from src.infrastructure.model.training_cache import CacheMatrizesTreino
 from src.util.logger import logger
+from src.util.profiler import perfil_treino
 
 
 class PipelineML:
@@ -39,14 +47,25 @@ class PipelineML:
     - Promover modelo quando aplicável
     """
 
-    def __init__(self):
+    # Classificador usado quando nenhuma configuração é informada (ex.: pela busca de hiperparâmetros).
+    CONFIGURACAO_PADRAO: Dict[str, Any] = {
+        "modelo": "random_forest",
+        "parametros": {"n_estimators": 200, "max_depth": 10},
+    }
+
+    def __init__(self, cache: CacheMatrizesTreino = None):
         """
         Inicializa o pipeline.
 
+        Parâmetros:
+        - cache (CacheMatrizesTreino | None): cache de matrizes de treino
+
         Responsabilidades:
         - Instanciar o processador de features
+        - Configurar o cache de matrizes processadas
         """
         self.processador = ProcessadorFeatures()
+        self.cache = cache or CacheMatrizesTreino()
 
     @staticmethod
     def criar_target(dados: pd.DataFrame) -> pd.DataFrame:
@@ -60,15 +79,13 @@ class PipelineML:
         - pd.DataFrame: dados com coluna alvo
         """
         if "DEFASAGEM" in dados.columns:
-            dados[Configuracoes.TARGET_COL] = dados["DEFASAGEM"].apply(
-                lambda valor: 1 if (isinstance(valor, (int, float)) and valor < 0) else 0
-            )
+            dados[Configuracoes.TARGET_COL] = PipelineML._defasagem_negativa(dados["DEFASAGEM"])
         elif "INDE" in dados.columns:
             dados["INDE"] = pd.to_numeric(dados["INDE"], errors="coerce")
             dados[Configuracoes.TARGET_COL] = (dados["INDE"] < 6.0).astype(int)
         elif "PEDRA" in dados.columns:
-            dados[Configuracoes.TARGET_COL] = dados["PEDRA"].astype(str).str.upper().apply(
-                lambda valor: 1 if "QUARTZO" in valor else 0
+            dados[Configuracoes.TARGET_COL] = (
+                dados["PEDRA"].astype(str).str.upper().str.contains("QUARTZO", regex=False, na=False).astype(int)
             )
         else:
             raise ValueError("Colunas de target ausentes para criação do rótulo.")
@@ -76,12 +93,38 @@ class PipelineML:
         return dados
 
     @staticmethod
-    def criar_features_lag(dados: pd.DataFrame) -> pd.DataFrame:
+    def _defasagem_negativa(defasagem: pd.Series) -> pd.Series:
+        """
+        Marca com 1 as defasagens numéricas negativas.
+
+        Valores textuais não contam como defasagem, mesmo quando representam um
+        número (ex.: "-1"); só colunas de objeto mistas precisam da checagem por valor.
+
+        Parâmetros:
+        - defasagem (pd.Series): coluna DEFASAGEM
+
+        Retorno:
+        - pd.Series: 1 para defasagem negativa, 0 caso contrário
+        """
+        if pd.api.types.is_numeric_dtype(defasagem):
+            return (defasagem < 0).fillna(False).astype(int)
+        if defasagem.dtype != object:
+            return pd.Series(0, index=defasagem.index)
+        negativos = [isinstance(valor, (int, float)) and valor < 0 for valor in defasagem.to_numpy()]
+        return pd.Series(negativos, index=defasagem.index).astype(int)
+
+    @staticmethod
+    def criar_features_lag(dados: pd.DataFrame, passos: int = 1) -> pd.DataFrame:
         """
         Gera features históricas (Lag).
 
+        Os dados são ordenados uma vez por RA e ano; o deslocamento é aplicado ao
+        bloco inteiro de métricas e invalidado onde a linha anterior é de outro aluno.
+
         Parâmetros:
         - dados (pd.DataFrame): dados de entrada
+        - passos (int): anos anteriores gerados; T-1 vira `<METRICA>_ANTERIOR` e
+          T-k (k > 1) vira `<METRICA>_ANTERIOR_<k>`
 
         Retorno:
         - pd.DataFrame: dados com features de histórico
@@ -92,12 +135,17 @@ class PipelineML:
             return dados
 
         dados = dados.sort_values(by=["RA", "ANO_REFERENCIA"])
-        metricas = ["INDE", "IAA", "IEG", "IPS", "IDA", "IPP", "IPV", "IAN"]
-
-        for coluna in metricas:
-            if coluna in dados.columns:
-                nome_coluna = f"{coluna}_ANTERIOR"
-                dados[nome_coluna] = dados.groupby("RA")[coluna].shift(1).fillna(0)
+        metricas = [coluna for coluna in Configuracoes.METRICAS_HISTORICAS if coluna in dados.columns]
+        if metricas:
+            ra = dados["RA"]
+            bloco = dados[metricas]
+            for passo in range(1, passos + 1):
+                anteriores = bloco.shift(passo)
+                anteriores.loc[(ra != ra.shift(passo)).to_numpy()] = np.nan
+                anteriores = anteriores.fillna(0)
+                sufixo = "_ANTERIOR" if passo == 1 else f"_ANTERIOR_{passo}"
+                for coluna in metricas:
+                    dados[f"{coluna}{sufixo}"] = anteriores[coluna]
 
         if "INDE_ANTERIOR" in dados.columns:
             dados["ALUNO_NOVO"] = (dados["INDE_ANTERIOR"] == 0).astype(int)
@@ -106,37 +154,33 @@ class PipelineML:
 
         return dados
 
-    def treinar(self, dados: pd.DataFrame):
+    def treinar(
+        self,
+        dados: pd.DataFrame,
+        configuracao: Optional[Dict[str, Any]] = None,
+        incremental: bool = False,
+    ):
         """
         Executa o treinamento do modelo.
 
         Parâmetros:
         - dados (pd.DataFrame): dados para treinamento
+        - configuracao (dict | None): classificador e hiperparâmetros (padrão: CONFIGURACAO_PADRAO)
+        - incremental (bool): acrescenta árvores ao modelo promovido com os anos novos;
+          sem base válida, treina do zero
 
         Exceções:
         - ValueError: quando ANO_REFERENCIA não está disponível
         """
         logger.info("Iniciando pipeline de treinamento Enterprise (Anti-Leakage)...")
 
-        dados = self.criar_target(dados)
-        dados = self.criar_features_lag(dados)
-        dados = self._remover_colunas_proibidas(dados)
-
-        mascara_treino, mascara_teste = self._definir_particao_temporal(dados)
+        with perfil_treino.etapa("treino.matrizes"):
+            dados, dados_processados, estatisticas, mascara_treino, mascara_teste = self.obter_matrizes(dados)
 
-        estatisticas = self._calcular_estatisticas_treino(dados, mascara_treino)
         logger.info(f"Estatísticas de Treino calculadas: {estatisticas}")
         self._salvar_estatisticas(estatisticas)
 
-        dados_processados = self.processador.processar(dados, estatisticas=estatisticas)
-        dados_processados[Configuracoes.TARGET_COL] = dados[Configuracoes.TARGET_COL]
-        dados_processados["ANO_REFERENCIA"] = dados["ANO_REFERENCIA"]
-
-        features_uso = [
-            f
-            for f in Configuracoes.FEATURES_MODELO_NUMERICAS + Configuracoes.FEATURES_MODELO_CATEGORICAS
-            if f in dados_processados.columns
-        ]
+        features_uso = self.selecionar_features(dados_processados)
 
         matriz_treino = dados_processados.loc[mascara_treino, features_uso]
         alvo_treino = dados_processados.loc[mascara_treino, Configuracoes.TARGET_COL]
@@ -144,32 +188,145 @@ class PipelineML:
         matriz_teste = dados_processados.loc[mascara_teste, features_uso]
         alvo_teste = dados_processados.loc[mascara_teste, Configuracoes.TARGET_COL]
 
-        logger.info(f"Treino: {matriz_treino.shape}, Teste: {matriz_teste.shape}")
+        anos_treino = dados_processados.loc[mascara_treino, "ANO_REFERENCIA"]
 
-        modelo = self._criar_modelo(matriz_treino)
-        modelo.fit(matriz_treino, alvo_treino)
-        probabilidades = modelo.predict_proba(matriz_teste)[:, 1]
-        threshold = self._calcular_threshold(alvo_teste, probabilidades)
-        predicoes = (probabilidades >= threshold).astype(int)
-
-        novas_metricas = self._calcular_metricas(
-            alvo_teste,
-            predicoes,
-            threshold,
-            dados.loc[mascara_teste],
-            matriz_treino,
-            matriz_teste,
-        )
-        logger.info(f"Métricas: {novas_metricas}")
+        logger.info(f"Treino: {matriz_treino.shape}, Teste: {matriz_teste.shape}")
 
-        if self._deve_promover_modelo(novas_metricas):
-            self._promover_modelo(
-                modelo,
-                novas_metricas,
-                dados_processados.loc[mascara_teste],
+        with perfil_treino.etapa("treino.ajuste"):
+            resultado_incremental = (
+                TreinoIncremental.ajustar(matriz_treino, alvo_treino, anos_treino) if incremental else None
+            )
+            if resultado_incremental is None:
+                modelo = self._criar_modelo(matriz_treino, configuracao)
+                modelo.fit(matriz_treino, alvo_treino)
+            else:
+                modelo, detalhes_incremental = resultado_incremental
+                configuracao = detalhes_incremental.pop("model_config")
+        with perfil_treino.etapa("treino.predicao"):
+            probabilidades = modelo.predict_proba(matriz_teste)[:, 1]
+        with perfil_treino.etapa("treino.threshold"):
+            threshold = self._calcular_threshold(alvo_teste, probabilidades)
+            predicoes = (probabilidades >= threshold).astype(int)
+
+        with perfil_treino.etapa("treino.metricas"):
+            novas_metricas = self._calcular_metricas(
                 alvo_teste,
                 predicoes,
+                threshold,
+                dados.loc[mascara_teste],
+                matriz_treino,
+                matriz_teste,
             )
+        novas_metricas["model_config"] = configuracao or self.CONFIGURACAO_PADRAO
+        novas_metricas["training_mode"] = "full" if resultado_incremental is None else "incremental"
+        novas_metricas["trained_years"] = sorted(int(ano) for ano in anos_treino.unique())
+        if resultado_incremental is not None:
+            novas_metricas["incremental"] = detalhes_incremental
+        with perfil_treino.etapa("treino.inferencia"):
+            novas_metricas["inference"] = self._medir_inferencia(modelo, matriz_teste)
+        logger.info(f"Métricas: {novas_metricas}")
+
+        with perfil_treino.etapa("treino.gate"):
+            promover = self._deve_promover_modelo(novas_metricas)
+        if promover:
+            with perfil_treino.etapa("treino.promocao"):
+                self._promover_modelo(
+                    modelo,
+                    novas_metricas,
+                    dados_processados.loc[mascara_teste],
+                    alvo_teste,
+                    predicoes,
+                )
+            # O perfil só fica completo (gate e promoção incluídos) ao fim da execução.
+            perfil_treino.anexar_relatorio(Configuracoes.METRICS_FILE)
+
+    def obter_matrizes(self, dados: pd.DataFrame):
+        """
+        Obtém as matrizes de treino do cache ou executa a engenharia de features.
+
+        Parâmetros:
+        - dados (pd.DataFrame): dados brutos
+
+        Retorno:
+        - tuple: dados de engenharia, dados processados, estatísticas e máscaras
+
+        Exceções:
+        - ValueError: quando ANO_REFERENCIA não está disponível
+        """
+        chave_cache = self.cache.calcular_chave(dados, self._componentes_cache())
+        em_cache = self.cache.carregar(chave_cache)
+
+        if em_cache is not None:
+            dados, dados_processados, estatisticas = em_cache
+            mascara_treino, mascara_teste = self._definir_particao_temporal(dados)
+            return dados, dados_processados, estatisticas, mascara_treino, mascara_teste
+
+        dados, dados_processados, estatisticas, mascara_treino, mascara_teste = self._preparar_matrizes(dados)
+        self.cache.salvar(chave_cache, dados, dados_processados, estatisticas)
+        return dados, dados_processados, estatisticas, mascara_treino, mascara_teste
+
+    @staticmethod
+    def selecionar_features(dados_processados: pd.DataFrame) -> list:
+        """
+        Seleciona as features do modelo presentes nos dados processados.
+
+        Parâmetros:
+        - dados_processados (pd.DataFrame): dados processados
+
+        Retorno:
+        - list: nomes das features na ordem de uso pelo modelo
+        """
+        return [
+            f
+            for f in Configuracoes.FEATURES_MODELO_NUMERICAS + Configuracoes.FEATURES_MODELO_CATEGORICAS
+            if f in dados_processados.columns
+        ]
+
+    def _preparar_matrizes(self, dados: pd.DataFrame):
+        """
+        Executa a engenharia de features e o processamento das matrizes.
+
+        Parâmetros:
+        - dados (pd.DataFrame): dados brutos
+
+        Retorno:
+        - tuple: dados de engenharia, dados processados, estatísticas e máscaras
+        """
+        # Cópia: os dados brutos não mudam e continuam gerando a mesma chave de cache.
+        with perfil_treino.etapa("treino.alvo"):
+            dados = self.criar_target(dados.copy())
+        with perfil_treino.etapa("treino.lags"):
+            dados = self.criar_features_lag(dados)
+        dados = self._remover_colunas_proibidas(dados)
+
+        mascara_treino, mascara_teste = self._definir_particao_temporal(dados)
+        estatisticas = self._calcular_estatisticas_treino(dados, mascara_treino)
+
+        with perfil_treino.etapa("treino.processamento"):
+            dados_processados = self.processador.processar(dados, estatisticas=estatisticas)
+        dados_processados[Configuracoes.TARGET_COL] = dados[Configuracoes.TARGET_COL]
+        dados_processados["ANO_REFERENCIA"] = dados["ANO_REFERENCIA"]
+
+        return dados, dados_processados, estatisticas, mascara_treino, mascara_teste
+
+    @staticmethod
+    def _componentes_cache() -> list:
+        """
+        Lista o código que determina o conteúdo das matrizes em cache.
+
+        Retorno:
+        - list: funções e classes cujo código compõe a chave do cache
+        """
+        return [
+            ProcessadorFeatures,
+            PipelineML.criar_target,
+            PipelineML._defasagem_negativa,
+            PipelineML.criar_features_lag,
+            PipelineML._remover_colunas_proibidas,
+            PipelineML._definir_particao_temporal,
+            PipelineML._calcular_estatisticas_treino,
+            PipelineML._preparar_matrizes,
+        ]
 
     @staticmethod
     def _definir_particao_temporal(dados: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
@@ -263,12 +420,13 @@ class PipelineML:
         return dados
 
     @staticmethod
-    def _criar_modelo(matriz_treino: pd.DataFrame) -> Pipeline:
+    def _criar_modelo(matriz_treino: pd.DataFrame, configuracao: Optional[Dict[str, Any]] = None) -> Pipeline:
         """
         Cria pipeline de pré-processamento e modelo.
 
         Parâmetros:
         - matriz_treino (pd.DataFrame): dados de treino
+        - configuracao (dict | None): classificador e hiperparâmetros (padrão: CONFIGURACAO_PADRAO)
 
         Retorno:
         - Pipeline: pipeline do modelo
@@ -299,18 +457,35 @@ class PipelineML:
 
         return Pipeline(steps=[
             ("preprocessor", preprocessor),
-            (
-                "classifier",
-                RandomForestClassifier(
-                    n_estimators=200,
-                    max_depth=10,
-                    random_state=Configuracoes.RANDOM_STATE,
-                    class_weight="balanced",
-                    n_jobs=Configuracoes.N_JOBS,
-                ),
-            ),
+            ("classifier", PipelineML._criar_classificador(configuracao or PipelineML.CONFIGURACAO_PADRAO)),
         ])
 
+    @staticmethod
+    def _criar_classificador(configuracao: Dict[str, Any]):
+        """
+        Instancia o classificador descrito pela configuração.
+
+        Parâmetros:
+        - configuracao (dict): "modelo" (random_forest, extra_trees ou logistic_regression) e "parametros"
+
+        Retorno:
+        - Any: classificador sklearn não treinado
+
+        Exceções:
+        - ValueError: quando o modelo não é suportado
+        """
+        modelo = configuracao["modelo"]
+        parametros = dict(configuracao.get("parametros", {}))
+        comuns = {"random_state": Configuracoes.RANDOM_STATE, "class_weight": "balanced"}
+
+        if modelo == "random_forest":
+            return RandomForestClassifier(**comuns, n_jobs=Configuracoes.N_JOBS, **parametros)
+        if modelo == "extra_trees":
+            return ExtraTreesClassifier(**comuns, n_jobs=Configuracoes.N_JOBS, **parametros)
+        if modelo == "logistic_regression":
+            return LogisticRegression(**comuns, max_iter=1000, **parametros)
+        raise ValueError(f"Modelo não suportado: {modelo}")
+
     @staticmethod
     def _calcular_metricas(
         alvo_teste,
@@ -342,6 +517,12 @@ class PipelineML:
             "model_version": "candidate",
             "risk_threshold": round(float(threshold), 4),
         }
+        intervalos = IntervalosBootstrap.calcular(IntervalosBootstrap.contar(alvo_teste, predicoes))
+        metricas["confidence_intervals"] = {
+            "level": Configuracoes.BOOTSTRAP_CONFIDENCE,
+            "resamples": Configuracoes.BOOTSTRAP_RESAMPLES,
+            **IntervalosBootstrap.resumir(intervalos),
+        }
         metricas["group_metrics"] = PipelineML._calcular_metricas_grupo(
             dados_teste, alvo_teste, predicoes
         )
@@ -367,26 +548,56 @@ class PipelineML:
         """
         Calcula métricas por grupos sensíveis para auditoria.
 
+        As contagens de todos os grupos saem de uma única passada de
+        `MatrizConfusaoGrupos` e os intervalos bootstrap de uma única reamostragem.
+
         Retorno:
-        - dict: métricas agregadas por grupo
+        - dict: métricas agregadas por grupo, com intervalos de confiança bootstrap
         """
-        metricas_grupo = {}
-        for coluna in Configuracoes.FEATURES_CATEGORICAS:
-            if coluna not in dados_teste.columns:
-                continue
-            metricas_coluna = {}
-            for valor, indices in dados_teste.groupby(coluna).groups.items():
-                y_true = alvo_teste.loc[indices]
-                y_pred = pd.Series(predicoes, index=alvo_teste.index).loc[indices]
-                metricas_coluna[str(valor)] = {
-                    "recall": round(recall_score(y_true, y_pred, zero_division=0), 4),
-                    "precision": round(precision_score(y_true, y_pred, zero_division=0), 4),
-                    "f1_score": round(f1_score(y_true, y_pred, zero_division=0), 4),
-                    "support": int(len(indices)),
-                }
-            metricas_grupo[coluna] = metricas_coluna
+        colunas = [coluna for coluna in Configuracoes.FEATURES_CATEGORICAS if coluna in dados_teste.columns]
+        metricas_grupo: Dict[str, Any] = {coluna: {} for coluna in colunas}
+        if isinstance(alvo_teste, pd.Series) and not alvo_teste.index.equals(dados_teste.index):
+            predicoes = pd.Series(predicoes, index=alvo_teste.index).loc[dados_teste.index]
+            alvo_teste = alvo_teste.loc[dados_teste.index]
+        contagens = MatrizConfusaoGrupos.contar(dados_teste, alvo_teste, predicoes, colunas)
+        if contagens.empty:
+            return metricas_grupo
+
+        taxas = MatrizConfusaoGrupos.taxas(contagens)
+        intervalos = IntervalosBootstrap.calcular(contagens[list(MatrizConfusaoGrupos.CELULAS)].to_numpy())
+        for posicao, (coluna, valor, suporte) in enumerate(
+            zip(contagens["coluna"], contagens["valor"], contagens["support"])
+        ):
+            metricas_grupo[coluna][str(valor)] = {
+                "recall": round(float(taxas["recall"][posicao]), 4),
+                "precision": round(float(taxas["precision"][posicao]), 4),
+                "f1_score": round(float(taxas["f1_score"][posicao]), 4),
+                "support": int(suporte),
+                "confidence_intervals": IntervalosBootstrap.resumir(intervalos, posicao),
+            }
         return metricas_grupo
 
+    @staticmethod
+    def _valor_gate(metricas: Dict[str, Any], nome: str) -> float:
+        """
+        Valor de uma métrica usado pelo Quality Gate.
+
+        Com QUALITY_GATE_LOWER_BOUND ativo, usa o limite inferior do intervalo de
+        confiança quando ele existe; caso contrário, a estimativa pontual.
+
+        Parâmetros:
+        - metricas (dict): métricas do modelo
+        - nome (str): recall, precision ou f1_score
+
+        Retorno:
+        - float: valor comparado pelo gate
+        """
+        if Configuracoes.QUALITY_GATE_LOWER_BOUND:
+            intervalo = metricas.get("confidence_intervals", {}).get(nome)
+            if intervalo is not None:
+                return intervalo["lower"]
+        return metricas.get(nome, 0)
+
     @staticmethod
     def _deve_promover_modelo(novas_metricas: Dict[str, Any]) -> bool:
         """
@@ -398,18 +609,121 @@ class PipelineML:
         Retorno:
         - bool: True se deve promover
         """
-        if novas_metricas.get("recall", 0) < Configuracoes.MIN_RECALL:
+        if PipelineML._valor_gate(novas_metricas, "recall") < Configuracoes.MIN_RECALL:
             logger.warning("Recall abaixo do mínimo configurado. Modelo não promovido.")
             return False
-        if not os.path.exists(Configuracoes.METRICS_FILE):
+
+        atual = PipelineML._carregar_metricas_promovidas()
+        inferencia = novas_metricas.get("inference") or {}
+        referencia = inferencia.get("baseline") or (atual or {}).get("inference")
+        if not PipelineML._dentro_do_orcamento(inferencia, referencia):
+            return False
+
+        if atual is None:
             return True
         try:
-            with open(Configuracoes.METRICS_FILE, "r") as arquivo:
-                atual = json.load(arquivo)
-            return novas_metricas["f1_score"] >= (atual.get("f1_score", 0) * 0.95)
+            return PipelineML._valor_gate(novas_metricas, "f1_score") >= (atual.get("f1_score", 0) * 0.95)
         except Exception:
             return True
 
+    @staticmethod
+    def _carregar_metricas_promovidas() -> Optional[Dict[str, Any]]:
+        """
+        Lê as métricas do modelo promovido.
+
+        Retorno:
+        - dict | None: métricas promovidas, ou None quando ausentes ou ilegíveis
+        """
+        if not os.path.exists(Configuracoes.METRICS_FILE):
+            return None
+        try:
+            with open(Configuracoes.METRICS_FILE, "r") as arquivo:
+                return json.load(arquivo)
+        except Exception:
+            return None
+
+    @staticmethod
+    def _medir_inferencia(modelo, matriz_teste: pd.DataFrame) -> Dict[str, Any]:
+        """
+        Mede latência e tamanho do candidato e, no mesmo host e matriz, do modelo promovido.
+
+        Parâmetros:
+        - modelo (Any): modelo candidato
+        - matriz_teste (pd.DataFrame): matriz de teste
+
+        Retorno:
+        - dict: unitaria_ms, lote_256_ms, tamanho_mb e, se houver modelo promovido, baseline
+        """
+        try:
+            inferencia = PipelineML._custo_inferencia(modelo, matriz_teste)
+        except Exception as erro:
+            logger.warning(f"Falha ao medir o custo de inferência do candidato: {erro}")
+            return {}
+
+        if os.path.exists(Configuracoes.MODEL_PATH):
+            try:
+                GerenciadorModelo._validar_hash_modelo()
+                inferencia["baseline"] = PipelineML._custo_inferencia(load(Configuracoes.MODEL_PATH), matriz_teste)
+            except Exception as erro:
+                logger.warning(f"Falha ao medir o custo de inferência do modelo promovido: {erro}")
+        return inferencia
+
+    @staticmethod
+    def _custo_inferencia(modelo, matriz: pd.DataFrame) -> Dict[str, float]:
+        """
+        Mede latência unitária, latência do lote e tamanho serializado.
+
+        Parâmetros:
+        - modelo (Any): modelo treinado
+        - matriz (pd.DataFrame): linhas de entrada
+
+        Retorno:
+        - dict: unitaria_ms, lote_256_ms e tamanho_mb
+        """
+        return {
+            **MedidorInferencia.medir_latencia(modelo, matriz),
+            "tamanho_mb": MedidorInferencia.medir_tamanho_mb(modelo),
+        }
+
+    @staticmethod
+    def _dentro_do_orcamento(inferencia: Dict[str, Any], referencia: Optional[Dict[str, Any]]) -> bool:
+        """
+        Verifica os orçamentos de latência e tamanho do candidato.
+
+        Cada medida tem um limite absoluto (0 desativa) e um limite relativo à
+        referência, que é o modelo promovido medido no mesmo treino ou, na falta
+        dele, o custo registrado nas métricas promovidas.
+
+        Parâmetros:
+        - inferencia (dict): custo medido do candidato
+        - referencia (dict | None): custo do modelo promovido
+
+        Retorno:
+        - bool: True quando nenhum orçamento é excedido
+        """
+        limites = {
+            "unitaria_ms": (Configuracoes.QUALITY_GATE_MAX_SINGLE_ROW_MS, Configuracoes.QUALITY_GATE_MAX_LATENCY_RATIO),
+            f"lote_{MedidorInferencia.TAMANHO_LOTE}_ms": (
+                Configuracoes.QUALITY_GATE_MAX_BATCH_MS,
+                Configuracoes.QUALITY_GATE_MAX_LATENCY_RATIO,
+            ),
+            "tamanho_mb": (Configuracoes.QUALITY_GATE_MAX_MODEL_MB, Configuracoes.QUALITY_GATE_MAX_SIZE_RATIO),
+        }
+        violacoes = []
+        for nome, (maximo, razao_maxima) in limites.items():
+            valor = inferencia.get(nome)
+            if valor is None:
+                continue
+            if maximo > 0 and valor > maximo:
+                violacoes.append(f"{nome}={valor} > {maximo}")
+            base = (referencia or {}).get(nome)
+            if razao_maxima > 0 and base and valor > base * razao_maxima:
+                violacoes.append(f"{nome}={valor} > {razao_maxima}x {base}")
+
+        if violacoes:
+            logger.warning(f"Orçamento de inferência excedido ({'; '.join(violacoes)}). Modelo não promovido.")
+        return not violacoes
+
     @staticmethod
     def _promover_modelo(modelo, metricas, dados_teste_original, alvo_teste, predicoes):
         """
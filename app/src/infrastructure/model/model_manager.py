@@ -55,18 +55,31 @@ class GerenciadorModelo:
             logger.info("Modelo já carregado em memória. Reutilizando.")
             return
 
-        if not os.path.exists(Configuracoes.MODEL_PATH):
-            logger.critical(f"Arquivo de modelo não encontrado em: {Configuracoes.MODEL_PATH}")
-            raise FileNotFoundError(f"Modelo não encontrado em {Configuracoes.MODEL_PATH}")
-
-        try:
-            self._validar_hash_modelo()
-            logger.info(f"Carregando modelo do disco: {Configuracoes.MODEL_PATH}...")
-            self._modelo = load(Configuracoes.MODEL_PATH)
-            logger.info("Modelo carregado com sucesso!")
-        except Exception as erro:
-            logger.critical(f"Falha fatal ao carregar o modelo: {erro}")
-            raise erro
+        with self._lock:
+            if self._modelo is not None:
+                return
+
+            if not os.path.exists(Configuracoes.MODEL_PATH):
+                logger.critical(f"Arquivo de modelo não encontrado em: {Configuracoes.MODEL_PATH}")
+                raise FileNotFoundError(f"Modelo não encontrado em {Configuracoes.MODEL_PATH}")
+
+            try:
+                self._validar_hash_modelo()
+                logger.info(f"Carregando modelo do disco: {Configuracoes.MODEL_PATH}...")
+                self._modelo = load(Configuracoes.MODEL_PATH)
+                logger.info("Modelo carregado com sucesso!")
+            except Exception as erro:
+                logger.critical(f"Falha fatal ao carregar o modelo: {erro}")
+                raise erro
+
+    def modelo_carregado(self) -> bool:
+        """
+        Indica se o modelo já está em memória, sem disparar a carga.
+
+        Retorno:
+        - bool: True quando o modelo está carregado
+        """
+        return self._modelo is not None
 
     @staticmethod
     def _validar_hash_modelo() -> None:
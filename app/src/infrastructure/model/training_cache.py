@@ -0,0 +1,201 @@
+"""
+Cache endereçado por conteúdo das matrizes de treino.
+
+Responsabilidades:
+- Calcular a chave a partir dos dados brutos, da configuração e do código
+- Persistir matrizes de engenharia e processadas em formato binário
+- Reaproveitar matrizes já calculadas em novos treinos
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import shutil
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+import pandas as pd
+
+from src.config.settings import Configuracoes
+from src.infrastructure.data.columnar_store import ArmazenamentoColunar
+from src.util.logger import logger
+
+
+class CacheMatrizesTreino:
+    """
+    Cache em disco das matrizes derivadas dos dados brutos de treino.
+
+    Responsabilidades:
+    - Gerar chaves determinísticas por conteúdo
+    - Gravar e carregar entradas de forma atômica
+    - Limitar a quantidade de entradas mantidas
+    """
+
+    VERSAO_CACHE = 1
+
+    def __init__(self, diretorio: Optional[str] = None, habilitado: Optional[bool] = None):
+        """
+        Inicializa o cache.
+
+        Parâmetros:
+        - diretorio (str | None): diretório do cache (padrão: configuração)
+        - habilitado (bool | None): liga/desliga o cache (padrão: configuração)
+        """
+        self._diretorio = diretorio
+        self._habilitado = habilitado
+
+    @property
+    def diretorio(self) -> str:
+        """Diretório raiz das entradas do cache."""
+        return self._diretorio or Configuracoes.TRAINING_CACHE_DIR
+
+    @property
+    def habilitado(self) -> bool:
+        """Indica se o cache está ativo."""
+        if self._habilitado is None:
+            return Configuracoes.TRAINING_CACHE_ENABLED
+        return self._habilitado
+
+    def calcular_chave(self, dados: pd.DataFrame, componentes_codigo: Iterable[Any]) -> Optional[str]:
+        """
+        Calcula a chave do cache para um conjunto de dados brutos.
+
+        Parâmetros:
+        - dados (pd.DataFrame): dados brutos antes da engenharia de features
+        - componentes_codigo (Iterable): funções/classes cujo código gera as matrizes
+
+        Retorno:
+        - str | None: chave hexadecimal ou None quando o cache não se aplica
+        """
+        if not self.habilitado:
+            return None
+
+        try:
+            hash_chave = hashlib.sha256()
+            hash_chave.update(f"v{self.VERSAO_CACHE}".encode())
+            hash_chave.update(self._impressao_dados(dados))
+            hash_chave.update(self._impressao_configuracao())
+            for componente in componentes_codigo:
+                hash_chave.update(inspect.getsource(componente).encode())
+            return hash_chave.hexdigest()
+        except Exception as erro:
+            logger.warning(f"Não foi possível calcular a chave do cache de treino: {erro}")
+            return None
+
+    def carregar(self, chave: Optional[str]) -> Optional[Tuple[pd.DataFrame, pd.DataFrame, Dict[str, Any]]]:
+        """
+        Carrega uma entrada do cache.
+
+        Parâmetros:
+        - chave (str | None): chave calculada por `calcular_chave`
+
+        Retorno:
+        - tuple | None: (dados de engenharia, dados processados, estatísticas) ou None
+        """
+        if chave is None:
+            return None
+
+        caminho = os.path.join(self.diretorio, chave)
+        if not os.path.isdir(caminho):
+            logger.info(f"Cache de treino: miss ({chave[:12]})")
+            return None
+
+        try:
+            dados = ArmazenamentoColunar.carregar(os.path.join(caminho, "engenharia"))
+            dados_processados = ArmazenamentoColunar.carregar(os.path.join(caminho, "processados"))
+            with open(os.path.join(caminho, "estatisticas.json"), "r") as arquivo:
+                estatisticas = json.load(arquivo)
+        except Exception as erro:
+            logger.warning(f"Entrada de cache de treino inválida ({chave[:12]}): {erro}")
+            shutil.rmtree(caminho, ignore_errors=True)
+            return None
+
+        os.utime(caminho)
+        logger.info(f"Cache de treino: hit ({chave[:12]})")
+        return dados, dados_processados, estatisticas
+
+    def salvar(
+        self,
+        chave: Optional[str],
+        dados: pd.DataFrame,
+        dados_processados: pd.DataFrame,
+        estatisticas: Dict[str, Any],
+    ) -> None:
+        """
+        Grava uma entrada no cache.
+
+        Parâmetros:
+        - chave (str | None): chave calculada por `calcular_chave`
+        - dados (pd.DataFrame): dados após engenharia de features
+        - dados_processados (pd.DataFrame): matriz processada com target e ano
+        - estatisticas (dict): estatísticas de treino
+        """
+        if chave is None:
+            return
+
+        caminho = os.path.join(self.diretorio, chave)
+        temporario = f"{caminho}.tmp"
+        try:
+            shutil.rmtree(temporario, ignore_errors=True)
+            ArmazenamentoColunar.salvar(dados, os.path.join(temporario, "engenharia"))
+            ArmazenamentoColunar.salvar(dados_processados, os.path.join(temporario, "processados"))
+            with open(os.path.join(temporario, "estatisticas.json"), "w") as arquivo:
+                json.dump(estatisticas, arquivo)
+            shutil.rmtree(caminho, ignore_errors=True)
+            os.replace(temporario, caminho)
+            logger.info(f"Cache de treino gravado: {caminho}")
+            self._podar()
+        except Exception as erro:
+            logger.warning(f"Falha ao gravar cache de treino: {erro}")
+            shutil.rmtree(temporario, ignore_errors=True)
+
+    def _podar(self) -> None:
+        """
+        Remove as entradas menos usadas além do limite configurado.
+        """
+        entradas = [
+            os.path.join(self.diretorio, nome)
+            for nome in os.listdir(self.diretorio)
+            if not nome.endswith(".tmp") and os.path.isdir(os.path.join(self.diretorio, nome))
+        ]
+        entradas.sort(key=os.path.getmtime, reverse=True)
+        for antiga in entradas[Configuracoes.TRAINING_CACHE_MAX_ENTRIES:]:
+            shutil.rmtree(antiga, ignore_errors=True)
+
+    @staticmethod
+    def _impressao_dados(dados: pd.DataFrame) -> bytes:
+        """
+        Gera a impressão digital dos dados brutos.
+
+        Parâmetros:
+        - dados (pd.DataFrame): dados brutos
+
+        Retorno:
+        - bytes: digest do conteúdo, colunas e tipos
+        """
+        hash_dados = hashlib.sha256()
+        hash_dados.update(json.dumps([str(c) for c in dados.columns]).encode())
+        hash_dados.update(json.dumps([str(t) for t in dados.dtypes]).encode())
+        hash_dados.update(pd.util.hash_pandas_object(dados, index=True).to_numpy().tobytes())
+        return hash_dados.digest()
+
+    @staticmethod
+    def _impressao_configuracao() -> bytes:
+        """
+        Gera a impressão digital da configuração de features.
+
+        Retorno:
+        - bytes: configuração serializada
+        """
+        configuracao = {
+            "target": Configuracoes.TARGET_COL,
+            "numericas": Configuracoes.FEATURES_NUMERICAS,
+            "categoricas": Configuracoes.FEATURES_CATEGORICAS,
+            "modelo_numericas": Configuracoes.FEATURES_MODELO_NUMERICAS,
+            "modelo_categoricas": Configuracoes.FEATURES_MODELO_CATEGORICAS,
+            "proibidas": Configuracoes.COLUNAS_PROIBIDAS_NO_TREINO,
+            "historicas": Configuracoes.METRICAS_HISTORICAS,
+            "sensiveis": Configuracoes.FEATURES_SENSIVEIS,
+            "random_state": Configuracoes.RANDOM_STATE,
+        }
+        return json.dumps(configuracao, sort_keys=True).encode()
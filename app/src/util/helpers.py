@@ -0,0 +1,45 @@
+"""
+Funções auxiliares compartilhadas pelas rotinas offline.
+
+Responsabilidades:
+- Resolver a quantidade de processos a partir da configuração
+- Gravar relatórios JSON sem interromper a rotina em caso de falha
+"""
+
+import json
+import os
+from typing import Any, Dict
+
+from src.util.logger import logger
+
+
+def resolver_workers(configurados: int) -> int:
+    """
+    Resolve a quantidade de processos de um pool.
+
+    Parâmetros:
+    - configurados (int): valor da configuração (ex.: BACKTEST_WORKERS)
+
+    Retorno:
+    - int: workers configurados (valores <= 0 usam todas as CPUs)
+    """
+    if configurados <= 0:
+        return os.cpu_count() or 1
+    return configurados
+
+
+def salvar_relatorio(caminho: str, relatorio: Dict[str, Any], descricao: str) -> None:
+    """
+    Grava um relatório em JSON, registrando um aviso em caso de falha.
+
+    Parâmetros:
+    - caminho (str): arquivo de destino
+    - relatorio (dict): relatório consolidado
+    - descricao (str): nome do relatório usado no log (ex.: "backtesting")
+    """
+    try:
+        os.makedirs(os.path.dirname(caminho), exist_ok=True)
+        with open(caminho, "w") as arquivo:
+            json.dump(relatorio, arquivo, default=str)
+    except Exception as erro:
+        logger.warning(f"Falha ao salvar relatório de {descricao}: {erro}")
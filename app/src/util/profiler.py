@@ -0,0 +1,247 @@
+"""
+Perfil de execução do treinamento por etapa.
+
+Responsabilidades:
+- Medir tempo de parede, tempo de CPU e pico de memória rastreada por etapa
+- Registrar etapas aninhadas e repetidas
+- Gerar o relatório do perfil e, opcionalmente, um cProfile de uma etapa
+- Anexar o relatório final a arquivos de métricas gravados durante a execução
+"""
+
+import cProfile
+import json
+import os
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional
+
+from src.config.settings import Configuracoes
+from src.util.logger import logger
+
+
+class PerfilExecucao:
+    """
+    Coletor das medições de cada etapa de uma execução.
+
+    Fora de uma execução iniciada, `etapa` não mede nada. O pico de memória
+    vem do tracemalloc e só é registrado quando o rastreamento está ativo;
+    em etapas aninhadas, o pico de uma etapa inclui o das etapas internas.
+
+    Responsabilidades:
+    - Iniciar e encerrar o rastreamento de memória da execução
+    - Acumular medições por nome de etapa
+    - Salvar o relatório em PROFILE_PATH e nos arquivos registrados
+    """
+
+    def __init__(self):
+        """
+        Inicializa o coletor inativo.
+        """
+        self.ativo = False
+        self._etapas: Dict[str, Dict[str, Any]] = {}
+        self._picos_abertos: List[int] = []
+        self._inicio: Optional[float] = None
+        self._rastreamento_proprio = False
+        self._anexos: List[str] = []
+
+    def iniciar(self, rastrear_memoria: Optional[bool] = None) -> None:
+        """
+        Inicia uma nova execução, descartando as medições anteriores.
+
+        Parâmetros:
+        - rastrear_memoria (bool | None): liga o tracemalloc (padrão: PROFILE_MEMORY)
+        """
+        rastrear_memoria = Configuracoes.PROFILE_MEMORY if rastrear_memoria is None else rastrear_memoria
+        self._etapas = {}
+        self._picos_abertos = []
+        self._anexos = []
+        self._inicio = time.perf_counter()
+        if rastrear_memoria and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._rastreamento_proprio = True
+        self.ativo = True
+
+    def finalizar(self) -> Dict[str, Any]:
+        """
+        Encerra a execução e salva o relatório.
+
+        Além de PROFILE_PATH, o relatório é gravado em `profile` de cada
+        arquivo registrado por `anexar_relatorio`.
+
+        Retorno:
+        - dict: relatório final
+        """
+        relatorio = self.relatorio()
+        self.ativo = False
+        if self._rastreamento_proprio:
+            tracemalloc.stop()
+            self._rastreamento_proprio = False
+        self._salvar(relatorio)
+        for caminho in self._anexos:
+            self._anexar(caminho, relatorio)
+        self._anexos = []
+        return relatorio
+
+    def anexar_relatorio(self, caminho: str) -> None:
+        """
+        Registra um JSON que recebe o relatório final em `profile` ao fim da execução.
+
+        Fora de uma execução iniciada, não faz nada.
+
+        Parâmetros:
+        - caminho (str): arquivo JSON já gravado (ex.: METRICS_FILE)
+        """
+        if self.ativo and caminho not in self._anexos:
+            self._anexos.append(caminho)
+
+    @contextmanager
+    def etapa(self, nome: str) -> Iterator[None]:
+        """
+        Mede um bloco de código como uma etapa.
+
+        Parâmetros:
+        - nome (str): nome da etapa (ex.: "treino.ajuste")
+
+        Retorno:
+        - Iterator[None]: contexto da etapa
+        """
+        if not self.ativo:
+            yield
+            return
+
+        self._etapas.setdefault(nome, {"stage": nome, "calls": 0, "wall_s": 0.0, "cpu_s": 0.0})
+        rastreando = tracemalloc.is_tracing()
+        if rastreando:
+            self._fechar_trecho_pico()
+            self._picos_abertos.append(0)
+        perfilador = self._iniciar_cprofile(nome)
+        inicio_parede, inicio_cpu = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            tempo, cpu = time.perf_counter() - inicio_parede, time.process_time() - inicio_cpu
+            self._finalizar_cprofile(nome, perfilador)
+            pico = None
+            if rastreando and tracemalloc.is_tracing():
+                self._fechar_trecho_pico()
+                pico = self._picos_abertos.pop()
+                if self._picos_abertos:
+                    self._picos_abertos[-1] = max(self._picos_abertos[-1], pico)
+            self._registrar(nome, tempo, cpu, pico)
+
+    def relatorio(self) -> Dict[str, Any]:
+        """
+        Consolida as medições da execução corrente.
+
+        Retorno:
+        - dict: etapas em ordem de início, com tempo, CPU, pico de memória e chamadas
+        """
+        total = time.perf_counter() - self._inicio if self._inicio is not None else 0.0
+        return {
+            "timestamp": datetime.now().isoformat(),
+            "total_wall_s": round(total, 3),
+            "stages": [dict(etapa) for etapa in self._etapas.values()],
+        }
+
+    def _registrar(self, nome: str, tempo: float, cpu: float, pico: Optional[int]) -> None:
+        """
+        Acumula a medição de uma etapa.
+
+        Parâmetros:
+        - nome (str): nome da etapa
+        - tempo (float): tempo de parede em segundos
+        - cpu (float): tempo de CPU do processo em segundos
+        - pico (int | None): pico de memória rastreada em bytes
+        """
+        etapa = self._etapas[nome]
+        etapa["calls"] += 1
+        etapa["wall_s"] = round(etapa["wall_s"] + tempo, 4)
+        etapa["cpu_s"] = round(etapa["cpu_s"] + cpu, 4)
+        if pico is not None:
+            etapa["peak_traced_mb"] = round(max(etapa.get("peak_traced_mb", 0.0), pico / 1024 / 1024), 2)
+
+    def _fechar_trecho_pico(self) -> None:
+        """
+        Transfere o pico desde o último reset para a etapa aberta mais interna.
+        """
+        _, pico = tracemalloc.get_traced_memory()
+        if self._picos_abertos:
+            self._picos_abertos[-1] = max(self._picos_abertos[-1], pico)
+        tracemalloc.reset_peak()
+
+    @staticmethod
+    def _iniciar_cprofile(nome: str) -> Optional[cProfile.Profile]:
+        """
+        Liga o cProfile quando a etapa é a configurada em PROFILE_STAGE.
+
+        Parâmetros:
+        - nome (str): nome da etapa
+
+        Retorno:
+        - cProfile.Profile | None: perfilador ativo
+        """
+        if nome != Configuracoes.PROFILE_STAGE:
+            return None
+        perfilador = cProfile.Profile()
+        perfilador.enable()
+        return perfilador
+
+    @staticmethod
+    def _finalizar_cprofile(nome: str, perfilador: Optional[cProfile.Profile]) -> None:
+        """
+        Desliga o cProfile e grava as estatísticas da etapa.
+
+        Parâmetros:
+        - nome (str): nome da etapa
+        - perfilador (cProfile.Profile | None): perfilador ativo
+        """
+        if perfilador is None:
+            return
+        perfilador.disable()
+        caminho = os.path.join(Configuracoes.MONITORING_DIR, f"profile_{nome}.prof")
+        try:
+            os.makedirs(Configuracoes.MONITORING_DIR, exist_ok=True)
+            perfilador.dump_stats(caminho)
+            logger.info(f"cProfile da etapa {nome} salvo em {caminho}")
+        except Exception as erro:
+            logger.warning(f"Falha ao salvar cProfile da etapa {nome}: {erro}")
+
+    @staticmethod
+    def _salvar(relatorio: Dict[str, Any]) -> None:
+        """
+        Grava o relatório do perfil.
+
+        Parâmetros:
+        - relatorio (dict): relatório consolidado
+        """
+        try:
+            os.makedirs(os.path.dirname(Configuracoes.PROFILE_PATH), exist_ok=True)
+            with open(Configuracoes.PROFILE_PATH, "w") as arquivo:
+                json.dump(relatorio, arquivo)
+        except Exception as erro:
+            logger.warning(f"Falha ao salvar perfil de execução: {erro}")
+
+    @staticmethod
+    def _anexar(caminho: str, relatorio: Dict[str, Any]) -> None:
+        """
+        Grava o relatório em `profile` de um JSON existente, trocando o arquivo com `os.replace`.
+
+        Parâmetros:
+        - caminho (str): arquivo JSON
+        - relatorio (dict): relatório consolidado
+        """
+        try:
+            with open(caminho) as arquivo:
+                conteudo = json.load(arquivo)
+            conteudo["profile"] = relatorio
+            temporario = f"{caminho}.tmp"
+            with open(temporario, "w") as arquivo:
+                json.dump(conteudo, arquivo)
+            os.replace(temporario, caminho)
+        except Exception as erro:
+            logger.warning(f"Falha ao anexar perfil de execução em {caminho}: {erro}")
+
+
+perfil_treino = PerfilExecucao()
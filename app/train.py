@@ -7,22 +7,85 @@ Responsabilidades:
 - Tratar falhas e finalizar com código de saída
 """
 
+import argparse
+
+from src.config.settings import Configuracoes
 from src.infrastructure.data.data_loader import CarregadorDados
+from src.infrastructure.model.backtesting import BacktestTemporal
+from src.infrastructure.model.hyperparameter_search import BuscaHiperparametros
 from src.infrastructure.model.ml_pipeline import treinador
 from src.util.logger import logger
+from src.util.profiler import perfil_treino
+
+
+def ler_argumentos() -> argparse.Namespace:
+    """
+    Lê os argumentos de linha de comando do treinamento.
+
+    Retorno:
+    - argparse.Namespace: argumentos reconhecidos
+    """
+    parser = argparse.ArgumentParser(description="Treina o modelo de risco de defasagem.")
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignora os caches de dados e de matrizes de treino e relê tudo da origem.",
+    )
+    parser.add_argument(
+        "--backtest",
+        action="store_true",
+        help="Executa o backtesting por ano de origem em vez de treinar e promover o modelo.",
+    )
+    parser.add_argument(
+        "--search",
+        action="store_true",
+        help="Busca hiperparâmetros dentro de HYPERPARAM_SEARCH_BUDGET_S antes do treino final.",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Acrescenta árvores treinadas nos anos novos ao modelo promovido em vez de treinar do zero.",
+    )
+    parser.add_argument(
+        "--profile-stage",
+        default=None,
+        help="Grava um cProfile completo da etapa informada (ex.: treino.ajuste) em app/monitoring.",
+    )
+    argumentos, _ = parser.parse_known_args()
+    return argumentos
 
 
 if __name__ == "__main__":
     logger.info("Iniciando Pipeline de Treinamento...")
 
+    argumentos = ler_argumentos()
+    if argumentos.no_cache:
+        logger.info("Caches desativados por --no-cache.")
+        Configuracoes.DATA_CACHE_ENABLED = False
+        Configuracoes.TRAINING_CACHE_ENABLED = False
+
+    if argumentos.profile_stage:
+        Configuracoes.PROFILE_STAGE = argumentos.profile_stage
+
+    perfil_treino.iniciar()
     try:
-        carregador = CarregadorDados()
-        df_bruto = carregador.carregar_dados()
+        with perfil_treino.etapa("carga"):
+            carregador = CarregadorDados()
+            df_bruto = carregador.carregar_dados()
 
-        treinador.treinar(df_bruto)
+        with perfil_treino.etapa("treino"):
+            if argumentos.backtest:
+                BacktestTemporal(treinador).executar(df_bruto)
+            elif argumentos.search:
+                melhor = BuscaHiperparametros(treinador).executar(df_bruto)["melhor"]
+                treinador.treinar(df_bruto, configuracao=melhor)
+            else:
+                treinador.treinar(df_bruto, incremental=argumentos.incremental)
 
         logger.info("Processo concluído com sucesso!")
 
     except Exception as erro:
         logger.exception(f"Ocorreu um erro fatal durante o pipeline de treinamento: {str(erro)}")
         exit(1)
+    finally:
+        perfil_treino.finalizar()
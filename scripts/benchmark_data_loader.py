@@ -0,0 +1,233 @@
+"""
+Benchmark do carregamento de dados em paralelo.
+
+Responsabilidades:
+- Gerar uma pasta sintética com um Excel de várias abas e CSVs
+- Medir `carregar_dados` com 1, 2 e 4 processos, sem cache
+- Conferir que todas as execuções produzem o mesmo dataset
+- Comparar a memória de pico do `pd.read_excel` com a leitura em streaming
+- Comparar a leitura integral de CSV com a leitura em blocos tipados
+"""
+
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+DIRETORIO_ATUAL = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(DIRETORIO_ATUAL), "app"))
+
+from src.config.settings import Configuracoes  # noqa: E402
+from src.infrastructure.data.data_cache import CacheDadosBrutos  # noqa: E402
+from src.infrastructure.data.data_loader import CarregadorDados  # noqa: E402
+
+ANOS_EXCEL = [2020, 2021, 2022, 2023]
+ANOS_CSV = [2024, 2025]
+LINHAS_POR_ANO = 20_000
+WORKERS = [1, 2, 4]
+COLUNAS_EXTRAS = 30
+TAMANHOS_BLOCO = [5_000, 50_000]
+LINHAS_CSV = 300_000
+
+
+def gerar_aba(ano: int, linhas: int, semente: int) -> pd.DataFrame:
+    """
+    Gera uma aba sintética no formato das planilhas do programa.
+
+    Parâmetros:
+    - ano (int): ano da aba
+    - linhas (int): quantidade de alunos
+    - semente (int): semente do gerador aleatório
+
+    Retorno:
+    - pd.DataFrame: dados da aba
+    """
+    rng = np.random.default_rng(semente)
+    sufixo = str(ano)[-2:]
+    dados = {
+        "RA": [f"RA-{i}" for i in range(linhas)],
+        "Ano ingresso": rng.integers(2016, ano + 1, linhas),
+        f"Defas {sufixo}": rng.integers(-3, 3, linhas),
+        f"Matem {sufixo}": rng.uniform(0, 10, linhas).round(2),
+        f"Portug {sufixo}": rng.uniform(0, 10, linhas).round(2),
+        "Gênero": rng.choice(["Menina", "Menino"], linhas),
+    }
+    for metrica in Configuracoes.METRICAS_HISTORICAS:
+        dados[f"{metrica} {ano}"] = rng.uniform(0, 10, linhas).round(3)
+    return pd.DataFrame(dados)
+
+
+def gerar_pasta(diretorio: str) -> None:
+    """
+    Grava o Excel com uma aba por ano e um CSV por ano adicional.
+
+    Parâmetros:
+    - diretorio (str): pasta de destino
+
+    Retorno:
+    - None: não retorna valor
+    """
+    with pd.ExcelWriter(os.path.join(diretorio, "dados.xlsx")) as escritor:
+        for ano in ANOS_EXCEL:
+            gerar_aba(ano, LINHAS_POR_ANO, ano).to_excel(escritor, sheet_name=f"PEDE{ano}", index=False)
+        pd.DataFrame({"Resumo": [1]}).to_excel(escritor, sheet_name="Resumo", index=False)
+
+    for ano in ANOS_CSV:
+        df = gerar_aba(ano, LINHAS_POR_ANO, ano)
+        df["ANO_REFERENCIA"] = ano
+        df.to_csv(os.path.join(diretorio, f"dados_{ano}.csv"), sep=";", index=False)
+
+
+def medir(workers: int) -> tuple:
+    """
+    Mede uma carga completa com a quantidade de processos informada.
+
+    Parâmetros:
+    - workers (int): processos de leitura
+
+    Retorno:
+    - tuple: tempo em segundos e dataset carregado
+    """
+    Configuracoes.DATA_LOADER_WORKERS = workers
+    carregador = CarregadorDados(cache=CacheDadosBrutos(habilitado=False))
+    inicio = time.perf_counter()
+    dados = carregador.carregar_dados()
+    return time.perf_counter() - inicio, dados
+
+
+def gerar_planilha_larga(caminho: str) -> None:
+    """
+    Grava um Excel com colunas extras que a projeção descarta.
+
+    Parâmetros:
+    - caminho (str): arquivo de destino
+
+    Retorno:
+    - None: não retorna valor
+    """
+    rng = np.random.default_rng(0)
+    with pd.ExcelWriter(caminho) as escritor:
+        for ano in ANOS_EXCEL:
+            df = gerar_aba(ano, LINHAS_POR_ANO, ano)
+            for posicao in range(COLUNAS_EXTRAS):
+                df[f"Observação {posicao}"] = rng.uniform(0, 1, LINHAS_POR_ANO).round(4)
+            df.to_excel(escritor, sheet_name=f"PEDE{ano}", index=False)
+
+
+def medir_memoria(funcao) -> tuple:
+    """
+    Mede tempo e memória de pico (tracemalloc) de uma leitura.
+
+    Parâmetros:
+    - funcao (Callable): leitura a executar
+
+    Retorno:
+    - tuple: tempo em segundos, pico em MB e abas lidas
+    """
+    tracemalloc.start()
+    inicio = time.perf_counter()
+    abas = funcao()
+    tempo = time.perf_counter() - inicio
+    pico = tracemalloc.get_traced_memory()[1] / 1024 / 1024
+    tracemalloc.stop()
+    return tempo, pico, abas
+
+
+def executar_benchmark_streaming(diretorio: str):
+    """
+    Compara `pd.read_excel` com a leitura em streaming na mesma planilha.
+
+    Parâmetros:
+    - diretorio (str): pasta temporária
+
+    Retorno:
+    - None: não retorna valor
+    """
+    caminho = os.path.join(diretorio, "larga.xlsx")
+    gerar_planilha_larga(caminho)
+    carregador = CarregadorDados(cache=CacheDadosBrutos(habilitado=False))
+
+    print(f"\n{'leitura':>18} | {'tempo (s)':>9} | {'pico (MB)':>9} | {'colunas':>7}")
+    tempo, pico, abas = medir_memoria(lambda: carregador._processar_abas(carregador._ler_excel(caminho)))
+    print(f"{'read_excel':>18} | {tempo:>9.2f} | {pico:>9.1f} | {abas[0].shape[1]:>7}")
+    for tamanho in TAMANHOS_BLOCO:
+        Configuracoes.STREAM_CHUNK_SIZE = tamanho
+        tempo, pico, abas = medir_memoria(lambda: carregador._ler_excel_streaming(caminho))
+        print(f"{f'streaming {tamanho}':>18} | {tempo:>9.2f} | {pico:>9.1f} | {abas[0].shape[1]:>7}")
+
+
+def ler_csv_integral(caminho: str) -> pd.DataFrame:
+    """
+    Reproduz a leitura antiga: arquivo inteiro, inferência de tipos e segunda tentativa com `,`.
+
+    Parâmetros:
+    - caminho (str): arquivo CSV
+
+    Retorno:
+    - pd.DataFrame: dados normalizados
+    """
+    df = pd.read_csv(caminho, sep=";")
+    if len(df.columns) <= 1:
+        df = pd.read_csv(caminho, sep=",")
+    return CarregadorDados._processar_dataframe(df, int(df["ANO_REFERENCIA"].iloc[0]))
+
+
+def executar_benchmark_csv(diretorio: str):
+    """
+    Compara a leitura integral de um CSV exportado com `;` e decimal `,` com a leitura em blocos.
+
+    Parâmetros:
+    - diretorio (str): pasta temporária
+
+    Retorno:
+    - None: não retorna valor
+    """
+    caminho = os.path.join(diretorio, "exportacao.csv")
+    df = gerar_aba(2024, LINHAS_CSV, 1)
+    for posicao in range(COLUNAS_EXTRAS):
+        df[f"Observação {posicao}"] = np.random.default_rng(posicao).uniform(0, 1, LINHAS_CSV).round(4)
+    df["ANO_REFERENCIA"] = 2024
+    df.to_csv(caminho, sep=";", decimal=",", index=False)
+    carregador = CarregadorDados(cache=CacheDadosBrutos(habilitado=False))
+
+    tamanho_mb = os.path.getsize(caminho) / 1024 / 1024
+    print(f"\n{f'CSV {tamanho_mb:.0f} MB':>18} | {'tempo (s)':>9} | {'pico (MB)':>9} | {'INDE':>7}")
+    tempo, pico, dados = medir_memoria(lambda: ler_csv_integral(caminho))
+    print(f"{'integral':>18} | {tempo:>9.2f} | {pico:>9.1f} | {str(dados['INDE'].dtype):>7}")
+    tempo, pico, partes = medir_memoria(lambda: carregador._ler_arquivo(caminho))
+    print(f"{'blocos tipados':>18} | {tempo:>9.2f} | {pico:>9.1f} | {str(partes[0]['INDE'].dtype):>7}")
+
+
+def executar_benchmark():
+    """
+    Executa o benchmark e imprime a tabela.
+
+    Retorno:
+    - None: não retorna valor
+    """
+    with tempfile.TemporaryDirectory() as diretorio:
+        gerar_pasta(diretorio)
+        Configuracoes.DATA_DIR = diretorio
+
+        print(f"{'workers':>7} | {'tempo (s)':>9} | {'speedup':>7} | {'linhas':>8} | {'idêntico':>8}")
+        referencia = None
+        for workers in WORKERS:
+            tempo, dados = medir(workers)
+            if referencia is None:
+                referencia = (tempo, dados)
+            identico = dados.equals(referencia[1])
+            print(
+                f"{workers:>7} | {tempo:>9.2f} | {referencia[0] / tempo:>7.2f} | "
+                f"{len(dados):>8} | {str(identico):>8}"
+            )
+
+        executar_benchmark_streaming(diretorio)
+        executar_benchmark_csv(diretorio)
+
+
+if __name__ == "__main__":
+    executar_benchmark()
@@ -0,0 +1,128 @@
+"""
+Benchmark da criação do alvo e das features históricas.
+
+Responsabilidades:
+- Gerar bases sintéticas de 10 mil a 1 milhão de linhas
+- Comparar a implementação anterior (apply e um shift por métrica) com a vetorizada
+- Conferir que as duas produzem o mesmo resultado
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+DIRETORIO_ATUAL = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(DIRETORIO_ATUAL), "app"))
+
+from src.config.settings import Configuracoes  # noqa: E402
+from src.infrastructure.model.ml_pipeline import PipelineML  # noqa: E402
+
+TAMANHOS = [10_000, 100_000, 1_000_000]
+ANOS = [2020, 2021, 2022, 2023, 2024]
+
+
+def gerar_base(linhas: int, semente: int = 0) -> pd.DataFrame:
+    """
+    Gera alunos acompanhados em vários anos, com todas as métricas históricas.
+
+    Parâmetros:
+    - linhas (int): quantidade de linhas
+    - semente (int): semente do gerador aleatório
+
+    Retorno:
+    - pd.DataFrame: base sintética
+    """
+    rng = np.random.default_rng(semente)
+    dados = {
+        "RA": pd.array(rng.integers(0, linhas // 3, linhas).astype(str), dtype="str"),
+        "ANO_REFERENCIA": rng.choice(ANOS, linhas),
+        "DEFASAGEM": rng.integers(-3, 3, linhas).astype(float),
+        "PEDRA": pd.array(rng.choice(["Quartzo", "Ágata", "Ametista", "Topázio"], linhas), dtype="str"),
+    }
+    for metrica in Configuracoes.METRICAS_HISTORICAS:
+        dados[metrica] = rng.uniform(0, 10, linhas)
+    return pd.DataFrame(dados)
+
+
+def criar_target_legado(dados: pd.DataFrame, coluna: str) -> pd.Series:
+    """
+    Reproduz a criação do alvo anterior (apply por valor).
+
+    Parâmetros:
+    - dados (pd.DataFrame): base
+    - coluna (str): DEFASAGEM ou PEDRA
+
+    Retorno:
+    - pd.Series: alvo
+    """
+    if coluna == "DEFASAGEM":
+        return dados["DEFASAGEM"].apply(lambda valor: 1 if (isinstance(valor, (int, float)) and valor < 0) else 0)
+    return dados["PEDRA"].astype(str).str.upper().apply(lambda valor: 1 if "QUARTZO" in valor else 0)
+
+
+def criar_features_lag_legado(dados: pd.DataFrame) -> pd.DataFrame:
+    """
+    Reproduz a geração de lags anterior (um groupby/shift por métrica).
+
+    Parâmetros:
+    - dados (pd.DataFrame): base
+
+    Retorno:
+    - pd.DataFrame: base com lags
+    """
+    dados = dados.sort_values(by=["RA", "ANO_REFERENCIA"])
+    for coluna in Configuracoes.METRICAS_HISTORICAS:
+        dados[f"{coluna}_ANTERIOR"] = dados.groupby("RA")[coluna].shift(1).fillna(0)
+    dados["ALUNO_NOVO"] = (dados["INDE_ANTERIOR"] == 0).astype(int)
+    return dados
+
+
+def medir(funcao) -> tuple:
+    """
+    Mede o tempo de uma chamada.
+
+    Parâmetros:
+    - funcao (Callable): chamada sem argumentos
+
+    Retorno:
+    - tuple: tempo em segundos e resultado
+    """
+    inicio = time.perf_counter()
+    resultado = funcao()
+    return time.perf_counter() - inicio, resultado
+
+
+def executar_benchmark():
+    """
+    Executa o benchmark e imprime a tabela.
+
+    Retorno:
+    - None: não retorna valor
+    """
+    print(f"{'etapa':>16} | {'linhas':>9} | {'anterior (s)':>12} | {'vetorizado (s)':>14} | {'ganho':>6} | idêntico")
+    for linhas in TAMANHOS:
+        base = gerar_base(linhas)
+
+        for coluna in ("DEFASAGEM", "PEDRA"):
+            entrada = base[[coluna]]
+            tempo_antigo, esperado = medir(lambda: criar_target_legado(entrada, coluna))
+            tempo_novo, obtido = medir(lambda: PipelineML.criar_target(entrada.copy())[Configuracoes.TARGET_COL])
+            identico = np.array_equal(esperado.to_numpy(), obtido.to_numpy())
+            print(
+                f"{f'alvo {coluna}':>16} | {linhas:>9} | {tempo_antigo:>12.3f} | {tempo_novo:>14.3f} | "
+                f"{tempo_antigo / tempo_novo:>6.1f} | {identico}"
+            )
+
+        tempo_antigo, esperado = medir(lambda: criar_features_lag_legado(base.copy()))
+        tempo_novo, obtido = medir(lambda: PipelineML.criar_features_lag(base.copy()))
+        print(
+            f"{'lags':>16} | {linhas:>9} | {tempo_antigo:>12.3f} | {tempo_novo:>14.3f} | "
+            f"{tempo_antigo / tempo_novo:>6.1f} | {obtido.equals(esperado)}"
+        )
+
+
+if __name__ == "__main__":
+    executar_benchmark()
@@ -0,0 +1,155 @@
+"""
+Benchmark de consultas da Feature Store histórica.
+
+Responsabilidades:
+- Gerar históricos sintéticos de 1 mil a 1 milhão de alunos
+- Medir a construção do índice e a latência por consulta
+- Medir a abertura do snapshot com memory-map e a latência por consulta nele
+- Medir a consulta em lote (`obter_lote`) por RA
+- Comparar o índice com a varredura booleana por RA
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+DIRETORIO_ATUAL = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(DIRETORIO_ATUAL), "app"))
+
+from src.config.settings import Configuracoes  # noqa: E402
+from src.infrastructure.data.historical_index import IndiceHistorico  # noqa: E402
+
+TAMANHOS = [1_000, 10_000, 100_000, 1_000_000]
+ANOS = [2022, 2023, 2024]
+CONSULTAS_INDICE = 20_000
+CONSULTAS_VARREDURA = 50
+LIMITE_VARREDURA = 100_000
+
+
+def gerar_historico(quantidade_alunos: int, semente: int = 42) -> pd.DataFrame:
+    """
+    Gera um histórico sintético com um registro por aluno e ano.
+
+    Parâmetros:
+    - quantidade_alunos (int): número de alunos distintos
+    - semente (int): semente do gerador aleatório
+
+    Retorno:
+    - pd.DataFrame: histórico com RA, ANO_REFERENCIA e métricas
+    """
+    rng = np.random.default_rng(semente)
+    total = quantidade_alunos * len(ANOS)
+    dados = {
+        "RA": np.repeat(np.arange(quantidade_alunos), len(ANOS)).astype(str),
+        "ANO_REFERENCIA": np.tile(ANOS, quantidade_alunos),
+    }
+    for metrica in Configuracoes.METRICAS_HISTORICAS:
+        dados[metrica] = rng.uniform(0, 10, total).round(2)
+    return pd.DataFrame(dados)
+
+
+def consultar_por_varredura(dados: pd.DataFrame, ra: str):
+    """
+    Reproduz a busca antiga: filtro booleano sobre toda a tabela.
+
+    Parâmetros:
+    - dados (pd.DataFrame): histórico ordenado por RA e ano
+    - ra (str): RA consultado
+
+    Retorno:
+    - pd.Series | None: registro anterior ao último
+    """
+    historico = dados[dados["RA"] == ra]
+    if len(historico) < 2:
+        return None
+    return historico.iloc[-2]
+
+
+def medir(quantidade_alunos: int) -> dict:
+    """
+    Executa o benchmark para um tamanho de Feature Store.
+
+    Parâmetros:
+    - quantidade_alunos (int): número de alunos distintos
+
+    Retorno:
+    - dict: tempos medidos
+    """
+    dados = gerar_historico(quantidade_alunos)
+    rng = np.random.default_rng(7)
+
+    inicio = time.perf_counter()
+    indice = IndiceHistorico.construir(dados)
+    tempo_construcao = time.perf_counter() - inicio
+
+    ras = rng.integers(0, quantidade_alunos, CONSULTAS_INDICE).astype(str)
+    inicio = time.perf_counter()
+    for ra in ras:
+        indice.obter(ra)
+    latencia_indice = (time.perf_counter() - inicio) / len(ras)
+
+    with tempfile.TemporaryDirectory() as diretorio:
+        indice.salvar_snapshot(diretorio)
+        inicio = time.perf_counter()
+        mapeado = IndiceHistorico.abrir_snapshot(diretorio)
+        tempo_abertura = time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        for ra in ras:
+            mapeado.obter(ra)
+        latencia_mmap = (time.perf_counter() - inicio) / len(ras)
+        del mapeado
+
+    anos = rng.choice(ANOS, len(ras))
+    inicio = time.perf_counter()
+    indice.obter_lote(ras, anos)
+    latencia_lote = (time.perf_counter() - inicio) / len(ras)
+
+    latencia_varredura = None
+    if quantidade_alunos <= LIMITE_VARREDURA:
+        ordenados = dados.sort_values(by=["RA", "ANO_REFERENCIA"])
+        inicio = time.perf_counter()
+        for ra in ras[:CONSULTAS_VARREDURA]:
+            consultar_por_varredura(ordenados, ra)
+        latencia_varredura = (time.perf_counter() - inicio) / CONSULTAS_VARREDURA
+
+    return {
+        "alunos": quantidade_alunos,
+        "construcao_s": tempo_construcao,
+        "indice_us": latencia_indice * 1e6,
+        "abertura_s": tempo_abertura,
+        "mmap_us": latencia_mmap * 1e6,
+        "lote_us": latencia_lote * 1e6,
+        "varredura_us": None if latencia_varredura is None else latencia_varredura * 1e6,
+    }
+
+
+def executar_benchmark():
+    """
+    Executa o benchmark para todos os tamanhos e imprime a tabela.
+
+    Retorno:
+    - None: não retorna valor
+    """
+    print(
+        f"{'alunos':>10} | {'construção (s)':>14} | {'índice (µs)':>11} | {'abertura (s)':>12} | "
+        f"{'mmap (µs)':>9} | {'lote (µs/RA)':>12} | {'varredura (µs)':>14}"
+    )
+    for quantidade in TAMANHOS:
+        resultado = medir(quantidade)
+        varredura = (
+            f"{resultado['varredura_us']:>14.1f}" if resultado["varredura_us"] is not None else f"{'-':>14}"
+        )
+        print(
+            f"{resultado['alunos']:>10} | {resultado['construcao_s']:>14.2f} | "
+            f"{resultado['indice_us']:>11.2f} | {resultado['abertura_s']:>12.3f} | "
+            f"{resultado['mmap_us']:>9.2f} | {resultado['lote_us']:>12.3f} | {varredura}"
+        )
+
+
+if __name__ == "__main__":
+    executar_benchmark()
@@ -0,0 +1,124 @@
+"""
+Benchmark das métricas por grupo do treino.
+
+Responsabilidades:
+- Gerar um conjunto de teste sintético com muitas turmas
+- Comparar o laço por grupo com sklearn com a contagem em uma passada
+- Conferir que as métricas pontuais são idênticas
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+from sklearn.metrics import f1_score, precision_score, recall_score
+
+DIRETORIO_ATUAL = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(DIRETORIO_ATUAL), "app"))
+
+from src.config.settings import Configuracoes  # noqa: E402
+from src.infrastructure.model.ml_pipeline import PipelineML  # noqa: E402
+
+CENARIOS = [(5_000, 50), (50_000, 500), (200_000, 2_000)]
+
+
+def gerar_teste(linhas: int, turmas: int, semente: int = 0) -> tuple:
+    """
+    Gera dados de teste com as colunas categóricas do modelo.
+
+    Parâmetros:
+    - linhas (int): quantidade de linhas
+    - turmas (int): valores distintos de TURMA
+    - semente (int): semente do gerador aleatório
+
+    Retorno:
+    - tuple: dados de teste, alvo e predições
+    """
+    rng = np.random.default_rng(semente)
+    dados = pd.DataFrame({
+        "GENERO": rng.choice(["Menina", "Menino"], linhas),
+        "TURMA": rng.choice([f"T{numero}" for numero in range(turmas)], linhas),
+        "INSTITUICAO_ENSINO": rng.choice(["Pública", "Privada", "Rede Decisão"], linhas),
+        "FASE": rng.choice([f"{fase}A" for fase in range(9)], linhas),
+    })
+    alvo = pd.Series(rng.integers(0, 2, linhas))
+    predicoes = np.where(rng.random(linhas) < 0.8, alvo, 1 - alvo)
+    return dados, alvo, predicoes
+
+
+def metricas_grupo_legado(dados_teste: pd.DataFrame, alvo_teste, predicoes) -> dict:
+    """
+    Reproduz o cálculo anterior: um groupby e três chamadas do sklearn por grupo.
+
+    Parâmetros:
+    - dados_teste (pd.DataFrame): colunas de grupo
+    - alvo_teste (pd.Series): valores reais
+    - predicoes (np.ndarray): predições
+
+    Retorno:
+    - dict: métricas por coluna e valor
+    """
+    metricas_grupo = {}
+    for coluna in Configuracoes.FEATURES_CATEGORICAS:
+        if coluna not in dados_teste.columns:
+            continue
+        metricas_coluna = {}
+        for valor, indices in dados_teste.groupby(coluna).groups.items():
+            y_true = alvo_teste.loc[indices]
+            y_pred = pd.Series(predicoes, index=alvo_teste.index).loc[indices]
+            metricas_coluna[str(valor)] = {
+                "recall": round(recall_score(y_true, y_pred, zero_division=0), 4),
+                "precision": round(precision_score(y_true, y_pred, zero_division=0), 4),
+                "f1_score": round(f1_score(y_true, y_pred, zero_division=0), 4),
+                "support": int(len(indices)),
+            }
+        metricas_grupo[coluna] = metricas_coluna
+    return metricas_grupo
+
+
+def sem_intervalos(metricas_grupo: dict) -> dict:
+    """
+    Remove os intervalos bootstrap para comparar só as métricas pontuais.
+
+    Parâmetros:
+    - metricas_grupo (dict): métricas por coluna e valor
+
+    Retorno:
+    - dict: métricas sem `confidence_intervals`
+    """
+    return {
+        coluna: {
+            valor: {nome: numero for nome, numero in metricas.items() if nome != "confidence_intervals"}
+            for valor, metricas in valores.items()
+        }
+        for coluna, valores in metricas_grupo.items()
+    }
+
+
+def executar_benchmark():
+    """
+    Executa o benchmark e imprime a tabela.
+
+    Retorno:
+    - None: não retorna valor
+    """
+    print(f"{'linhas':>8} | {'turmas':>6} | {'laço (s)':>8} | {'uma passada (s)':>15} | idêntico")
+    for linhas, turmas in CENARIOS:
+        dados, alvo, predicoes = gerar_teste(linhas, turmas)
+
+        inicio = time.perf_counter()
+        esperado = metricas_grupo_legado(dados, alvo, predicoes)
+        tempo_legado = time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        obtido = PipelineML._calcular_metricas_grupo(dados, alvo, predicoes)
+        tempo_novo = time.perf_counter() - inicio
+
+        identico = sem_intervalos(obtido) == esperado
+        print(f"{linhas:>8} | {turmas:>6} | {tempo_legado:>8.2f} | {tempo_novo:>15.3f} | {identico}")
+
+
+if __name__ == "__main__":
+    executar_benchmark()
@@ -0,0 +1,69 @@
+"""Testes do controlador da Feature Store."""
+
+from unittest.mock import Mock
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api.feature_store_controller import ControladorFeatureStore, obter_repositorio_historico
+
+
+def criar_cliente(repositorio):
+    aplicacao = FastAPI()
+    controlador = ControladorFeatureStore()
+    aplicacao.dependency_overrides[obter_repositorio_historico] = lambda: repositorio
+    aplicacao.include_router(controlador.roteador, prefix="/api/v1/feature-store")
+    return TestClient(aplicacao)
+
+
+def test_recarregar_inicia_recarga():
+    repositorio = Mock()
+    repositorio.recarregar.return_value = True
+
+    resposta = criar_cliente(repositorio).post("/api/v1/feature-store/reload")
+
+    assert resposta.status_code == 202
+    assert resposta.json() == {"status": "reloading"}
+    repositorio.recarregar.assert_called_once_with(forcar=True)
+
+
+def test_recarregar_em_andamento():
+    repositorio = Mock()
+    repositorio.recarregar.return_value = False
+
+    resposta = criar_cliente(repositorio).post("/api/v1/feature-store/reload")
+
+    assert resposta.json() == {"status": "already_reloading"}
+
+
+def test_status():
+    repositorio = Mock()
+    repositorio.status.return_value = {"loaded": True, "version": 2}
+
+    resposta = criar_cliente(repositorio).get("/api/v1/feature-store/status")
+
+    assert resposta.status_code == 200
+    assert resposta.json()["version"] == 2
+
+
+def test_atualizar_registros():
+    repositorio = Mock()
+    repositorio.atualizar_registros.return_value = {"inserted": 1, "students_affected": 1}
+
+    resposta = criar_cliente(repositorio).post(
+        "/api/v1/feature-store/records", json=[{"RA": "1", "ANO_REFERENCIA": 2024, "INDE": 7.0}]
+    )
+
+    assert resposta.status_code == 200
+    assert resposta.json()["inserted"] == 1
+    enviado = repositorio.atualizar_registros.call_args.args[0]
+    assert enviado.to_dict("records") == [{"RA": "1", "ANO_REFERENCIA": 2024, "INDE": 7.0}]
+
+
+def test_atualizar_registros_invalidos():
+    repositorio = Mock()
+    repositorio.atualizar_registros.side_effect = ValueError("Colunas obrigatórias ausentes")
+
+    resposta = criar_cliente(repositorio).post("/api/v1/feature-store/records", json=[{"RA": "1"}])
+
+    assert resposta.status_code == 400
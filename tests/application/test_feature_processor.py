@@ -1,6 +1,9 @@
 """Testes do processador de features."""
 
+from datetime import datetime
+
 import pandas as pd
+import pytest
 
 from src.application.feature_processor import ProcessadorFeatures
 from src.config.settings import Configuracoes
@@ -69,3 +72,50 @@ def test_processar_sem_ano_ingresso():
     assert processado.loc[0, "TEMPO_NA_ONG"] == 0
     assert processado.loc[0, "GENERO"] == "Feminino"
     assert processado.loc[0, "FASE"] == "FASE2B"
+
+
+def test_processar_em_lotes_independe_do_tamanho_do_lote():
+    df = pd.DataFrame({
+        "ANO_REFERENCIA": [2023, 2023, 2024, 2024, 2024],
+        "ANO_INGRESSO": [2020, None, 2018, None, 2022],
+        "IDADE": [10, 11, 12, 13, 14],
+        "GENERO": ["Masculino", "Feminino", None, "menina", "garoto"],
+        "TURMA": ["A", "B", "C", None, "E"],
+        "FASE": ["1A", "2B", "3C", "4D", "5E"],
+    })
+    estatisticas = {"mediana_ano_ingresso": 2019}
+
+    completo = ProcessadorFeatures.processar(df, estatisticas=estatisticas)
+    lotes = [df.iloc[:2], df.iloc[2:3], df.iloc[3:]]
+    em_lotes = pd.concat(ProcessadorFeatures.processar_em_lotes(lotes, estatisticas=estatisticas))
+
+    pd.testing.assert_frame_equal(em_lotes, completo)
+
+
+def test_processar_em_lotes_congela_ano_ingresso_sem_estatisticas():
+    df = pd.DataFrame({"ANO_REFERENCIA": [2024, 2024], "ANO_INGRESSO": [2010, None]})
+    snapshot = datetime(2022, 6, 1)
+
+    lotes = list(ProcessadorFeatures.processar_em_lotes([df.iloc[:1], df.iloc[1:]], data_snapshot=snapshot))
+
+    assert lotes[1].loc[1, "TEMPO_NA_ONG"] == 2
+
+
+def test_ler_lotes_csv_e_ndjson(tmp_path):
+    df = pd.DataFrame({"IDADE": [10, 11, 12], "ANO_INGRESSO": [2020, 2021, 2022]})
+    caminho_csv = tmp_path / "dados.csv"
+    caminho_ndjson = tmp_path / "dados.ndjson"
+    df.to_csv(caminho_csv, index=False)
+    df.to_json(caminho_ndjson, orient="records", lines=True)
+
+    lotes_csv = list(ProcessadorFeatures.ler_lotes(str(caminho_csv), tamanho_lote=2))
+    lotes_ndjson = list(ProcessadorFeatures.ler_lotes(str(caminho_ndjson), tamanho_lote=2))
+
+    assert [len(lote) for lote in lotes_csv] == [2, 1]
+    assert [len(lote) for lote in lotes_ndjson] == [2, 1]
+    assert pd.concat(lotes_csv)["IDADE"].tolist() == [10, 11, 12]
+
+
+def test_ler_lotes_formato_invalido():
+    with pytest.raises(ValueError):
+        list(ProcessadorFeatures.ler_lotes("dados.xlsx"))
@@ -0,0 +1,72 @@
+"""Testes da matriz de confusão por grupo."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.metrics import f1_score, precision_score, recall_score
+
+from src.application.group_metrics import MatrizConfusaoGrupos
+
+
+def _dados(linhas=300, semente=0):
+    rng = np.random.default_rng(semente)
+    grupos = pd.DataFrame({
+        "GENERO": rng.choice(["F", "M", None], linhas),
+        "TURMA": rng.choice([f"T{numero}" for numero in range(25)], linhas),
+    })
+    alvo = rng.integers(0, 2, linhas)
+    predicoes = rng.integers(0, 2, linhas)
+    return grupos, alvo, predicoes
+
+
+def test_contagens_iguais_ao_groupby_com_sklearn():
+    grupos, alvo, predicoes = _dados()
+    contagens = MatrizConfusaoGrupos.contar(grupos, alvo, predicoes)
+    taxas = MatrizConfusaoGrupos.taxas(contagens)
+
+    esperado = []
+    for coluna in grupos.columns:
+        for valor, indices in grupos.groupby(coluna).groups.items():
+            posicoes = grupos.index.get_indexer(indices)
+            y_true, y_pred = alvo[posicoes], predicoes[posicoes]
+            esperado.append((
+                coluna,
+                valor,
+                recall_score(y_true, y_pred, zero_division=0),
+                precision_score(y_true, y_pred, zero_division=0),
+                f1_score(y_true, y_pred, zero_division=0),
+                len(indices),
+            ))
+
+    obtido = list(zip(
+        contagens["coluna"],
+        contagens["valor"],
+        taxas["recall"],
+        taxas["precision"],
+        taxas["f1_score"],
+        contagens["support"],
+    ))
+    assert [linha[:2] for linha in obtido] == [linha[:2] for linha in esperado]
+    for linha_obtida, linha_esperada in zip(obtido, esperado):
+        assert linha_obtida[2:5] == pytest.approx(linha_esperada[2:5])
+        assert linha_obtida[5] == linha_esperada[5]
+
+
+def test_linhas_fora_de_zero_um_contam_so_no_suporte():
+    grupos = pd.DataFrame({"GENERO": ["F", "F", "F", "M"]})
+    contagens = MatrizConfusaoGrupos.contar(grupos, [1, np.nan, 0, 0], [1, 1, 0, 1])
+
+    assert contagens[["tp", "fp", "fn", "tn", "support"]].to_numpy().tolist() == [
+        [1, 0, 0, 1, 3],
+        [0, 1, 0, 0, 1],
+    ]
+
+
+def test_taxas_sem_denominador_retornam_zero():
+    taxas = MatrizConfusaoGrupos.taxas(np.array([[0, 0, 0, 0]]))
+    assert all(valores.tolist() == [0.0] for valores in taxas.values())
+
+
+def test_contar_sem_grupos():
+    contagens = MatrizConfusaoGrupos.contar(pd.DataFrame({"GENERO": [None, None]}), [1, 0], [1, 0])
+    assert contagens.empty
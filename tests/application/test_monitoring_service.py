@@ -204,3 +204,32 @@ def test_gerar_fairness_html_inclui_estilos_e_barras():
     assert "fairness-wrapper" in html
     assert "fairness-table" in html
     assert "fairness-bars" in html
+
+
+def test_calcular_metricas_fairness_por_grupo():
+    dados = pd.DataFrame({
+        Configuracoes.FAIRNESS_GROUP_COL: ["F", "F", "F", "F", "M", "M", None],
+        Configuracoes.TARGET_COL: [1, 1, 0, None, 0, 0, 1],
+        "prediction": [1, 0, 1, 1, 0, 1, 1],
+    })
+
+    metricas = ServicoMonitoramento._calcular_metricas_fairness(dados)
+
+    assert metricas.to_dict("records") == [
+        {
+            Configuracoes.FAIRNESS_GROUP_COL: "F",
+            "false_positive_rate_pct": 100.0,
+            "false_negative_rate_pct": 50.0,
+            "support": 4,
+        },
+        {
+            Configuracoes.FAIRNESS_GROUP_COL: "M",
+            "false_positive_rate_pct": 50.0,
+            "false_negative_rate_pct": 0.0,
+            "support": 2,
+        },
+    ]
+
+
+def test_calcular_metricas_fairness_sem_colunas():
+    assert isinstance(ServicoMonitoramento._calcular_metricas_fairness(pd.DataFrame({"x": [1]})), str)
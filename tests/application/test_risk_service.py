@@ -91,3 +91,18 @@ def test_prever_risco_inteligente_sem_historico(entrada_estudante_exemplo):
 
     assert resultado["prediction"] == 0
     assert resultado["requires_human_review"] is True
+
+
+def test_prever_risco_inteligente_repassa_ano_referencia(entrada_estudante_exemplo):
+    modelo = Mock()
+    modelo.predict_proba.return_value = np.array([[0.7, 0.2]])
+
+    servico = ServicoRisco(modelo=modelo)
+    servico.logger = Mock()
+    servico.repositorio = Mock()
+    servico.repositorio.obter_historico_estudante.return_value = None
+
+    entrada = EntradaEstudante(**entrada_estudante_exemplo, ANO_REFERENCIA=2023)
+    servico.prever_risco_inteligente(entrada)
+
+    servico.repositorio.obter_historico_estudante.assert_called_once_with("123", 2023)
@@ -4,6 +4,7 @@ import sys
 import types
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -62,6 +63,26 @@ def _registrar_stub_evidently():
 _registrar_stub_evidently()
 
 
+@pytest.fixture(autouse=True)
+def isolar_diretorio_cache(tmp_path, monkeypatch):
+    """Direciona caches, artefatos do modelo promovido e relatórios de monitoramento para um diretório temporário."""
+    from src.config.settings import Configuracoes
+
+    monkeypatch.setattr(Configuracoes, "CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(Configuracoes, "TRAINING_CACHE_DIR", str(tmp_path / "cache" / "training"))
+    monkeypatch.setattr(Configuracoes, "DATA_CACHE_DIR", str(tmp_path / "cache" / "data"))
+    monkeypatch.setattr(Configuracoes, "FEATURE_STORE_SNAPSHOT_DIR", str(tmp_path / "cache" / "feature_store"))
+    monkeypatch.setattr(Configuracoes, "FEATURE_STORE_SQLITE_PATH", str(tmp_path / "cache" / "feature_store.sqlite"))
+    monkeypatch.setattr(Configuracoes, "MODEL_PATH", str(tmp_path / "models" / "model_passos_magicos.joblib"))
+    monkeypatch.setattr(Configuracoes, "METRICS_FILE", str(tmp_path / "monitoring" / "train_metrics.json"))
+    monkeypatch.setattr(Configuracoes, "MONITORING_DIR", str(tmp_path / "monitoring"))
+    monkeypatch.setattr(Configuracoes, "PROFILE_PATH", str(tmp_path / "monitoring" / "train_profile.json"))
+    monkeypatch.setattr(Configuracoes, "REFERENCE_PATH", str(tmp_path / "monitoring" / "reference_data.csv"))
+    monkeypatch.setattr(Configuracoes, "FEATURE_STATS_PATH", str(tmp_path / "monitoring" / "feature_stats.json"))
+    monkeypatch.setattr(Configuracoes, "BACKTEST_PATH", str(tmp_path / "monitoring" / "backtest_metrics.json"))
+    monkeypatch.setattr(Configuracoes, "HYPERPARAM_SEARCH_PATH", str(tmp_path / "monitoring" / "hyperparam_search.json"))
+
+
 @pytest.fixture()
 def estudante_exemplo():
     """Retorna um dicionário com dados completos de aluno."""
@@ -125,3 +146,28 @@ def dataframe_base():
             }
         ]
     )
+
+
+@pytest.fixture()
+def dados_sinteticos():
+    """Retorna uma fábrica de alunos acompanhados em vários anos com as duas classes do alvo."""
+
+    def gerar(anos, linhas_por_ano=40, semente=0):
+        rng = np.random.default_rng(semente)
+        registros = []
+        for ano in anos:
+            for indice in range(linhas_por_ano):
+                registros.append({
+                    "RA": str(indice),
+                    "ANO_REFERENCIA": ano,
+                    "ANO_INGRESSO": 2018,
+                    "IDADE": int(rng.integers(8, 18)),
+                    "DEFASAGEM": int(rng.integers(-2, 2)),
+                    "INDE": float(rng.uniform(3, 9)),
+                    "IAA": float(rng.uniform(0, 10)),
+                    "GENERO": str(rng.choice(["Masculino", "Feminino"])),
+                    "FASE": str(rng.choice(["1A", "2B"])),
+                })
+        return pd.DataFrame(registros)
+
+    return gerar
@@ -0,0 +1,53 @@
+"""Testes do armazenamento colunar."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.infrastructure.data.columnar_store import ArmazenamentoColunar
+
+
+def test_salvar_e_carregar_preserva_dados(tmp_path):
+    dados = pd.DataFrame(
+        {
+            "RA": ["1", "2", None],
+            "INDE": [5.5, np.nan, 7.0],
+            "ANO_REFERENCIA": [2022, 2023, 2024],
+            "MISTO": [1, "a", np.nan],
+            "ATIVO": [True, False, True],
+        },
+        index=[10, 5, 7],
+    )
+    destino = tmp_path / "tabela"
+
+    ArmazenamentoColunar.salvar(dados, str(destino))
+    carregado = ArmazenamentoColunar.carregar(str(destino))
+
+    pd.testing.assert_frame_equal(carregado, dados)
+
+
+def test_carregar_com_mmap_retorna_memmap(tmp_path):
+    dados = pd.DataFrame({"INDE": np.arange(5, dtype=np.float64)})
+    destino = tmp_path / "tabela"
+
+    ArmazenamentoColunar.salvar(dados, str(destino))
+    carregado = ArmazenamentoColunar.carregar(str(destino), mmap=True)
+
+    assert isinstance(np.load(destino / "c0.npy", mmap_mode="r"), np.memmap)
+    assert carregado["INDE"].tolist() == [0.0, 1.0, 2.0, 3.0, 4.0]
+
+
+def test_salvar_substitui_diretorio_existente(tmp_path):
+    destino = tmp_path / "tabela"
+    ArmazenamentoColunar.salvar(pd.DataFrame({"A": [1]}), str(destino))
+    ArmazenamentoColunar.salvar(pd.DataFrame({"B": [2, 3]}), str(destino))
+
+    carregado = ArmazenamentoColunar.carregar(str(destino))
+
+    assert list(carregado.columns) == ["B"]
+    assert len(carregado) == 2
+
+
+def test_carregar_diretorio_inexistente(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        ArmazenamentoColunar.carregar(str(tmp_path / "nada"))
@@ -0,0 +1,68 @@
+"""Testes do cache binário de dados."""
+
+import os
+
+import pandas as pd
+
+from src.infrastructure.data.data_cache import CacheDadosBrutos
+
+
+def componente():
+    return 1
+
+
+def test_salvar_e_carregar_partes(tmp_path):
+    origem = tmp_path / "dados.csv"
+    origem.write_text("RA;INDE\n1;5\n")
+    cache = CacheDadosBrutos(str(tmp_path / "cache"), habilitado=True)
+    partes = [
+        pd.DataFrame({"RA": ["1", "2"], "INDE": [5.0, None], "ANO_REFERENCIA": [2023, 2023]}),
+        pd.DataFrame({"RA": ["3"], "NOME": ["Ana"]}),
+    ]
+
+    chave = cache.calcular_chave(str(origem), [componente])
+    assert cache.carregar(chave, str(origem)) is None
+    cache.salvar(chave, partes)
+    carregadas = cache.carregar(chave, str(origem))
+
+    assert len(carregadas) == 2
+    for esperada, carregada in zip(partes, carregadas):
+        pd.testing.assert_frame_equal(carregada, esperada)
+
+
+def test_chave_muda_com_conteudo_e_reaproveita_hash(tmp_path):
+    origem = tmp_path / "dados.csv"
+    origem.write_text("RA;INDE\n1;5\n")
+    cache = CacheDadosBrutos(str(tmp_path / "cache"), habilitado=True)
+
+    primeira = cache.calcular_chave(str(origem), [componente])
+    impressoes = cache._ler_json(cache.ARQUIVO_IMPRESSOES)
+    assert impressoes[os.path.abspath(origem)]["tamanho"] == origem.stat().st_size
+    assert cache.calcular_chave(str(origem), [componente]) == primeira
+
+    origem.write_text("RA;INDE\n1;6\n")
+    os.utime(origem, ns=(0, origem.stat().st_mtime_ns + 1))
+
+    assert cache.calcular_chave(str(origem), [componente]) != primeira
+
+
+def test_cache_desabilitado_ou_arquivo_inexistente(tmp_path):
+    origem = tmp_path / "dados.csv"
+    origem.write_text("RA\n1\n")
+
+    assert CacheDadosBrutos(str(tmp_path), habilitado=False).calcular_chave(str(origem), []) is None
+    assert CacheDadosBrutos(str(tmp_path), habilitado=True).calcular_chave(str(tmp_path / "x.csv"), []) is None
+
+
+def test_poda_preserva_entradas_do_manifesto(monkeypatch, tmp_path):
+    monkeypatch.setattr("src.infrastructure.data.data_cache.Configuracoes.DATA_CACHE_MAX_ENTRIES", 0)
+    cache = CacheDadosBrutos(str(tmp_path / "cache"), habilitado=True)
+    parte = pd.DataFrame({"RA": ["1"]})
+
+    cache.gravar_manifesto(str(tmp_path), {str(tmp_path / "a.csv"): {"chave": "referenciada"}})
+    cache.salvar("referenciada", [parte])
+    cache.salvar("avulsa", [parte])
+
+    assert cache.carregar("referenciada") is not None
+    assert cache.carregar("avulsa") is None
+    assert list(cache.ler_manifesto(str(tmp_path))) == [str(tmp_path / "a.csv")]
@@ -1,5 +1,7 @@
 """Testes do carregador de dados."""
 
+import os
+
 import pandas as pd
 import pytest
 
@@ -88,3 +90,216 @@ def test_processar_dataframe_normaliza_colunas():
     assert "DEFASAGEM" in processado.columns
     assert "ANO_INGRESSO" in processado.columns
     assert "INSTITUICAO_ENSINO" in processado.columns
+
+
+def test_carregar_dados_reaproveita_cache_binario(monkeypatch, tmp_path):
+    (tmp_path / "dados.csv").write_text("RA;INDE;ANO_REFERENCIA\n1;5,5;2023\n2;6;2023\n")
+    monkeypatch.setattr("src.infrastructure.data.data_loader.Configuracoes.DATA_DIR", str(tmp_path))
+
+    primeiro = CarregadorDados().carregar_dados()
+
+    def falhar(*args, **kwargs):
+        raise AssertionError("o arquivo não deveria ser relido")
+
+    monkeypatch.setattr("src.infrastructure.data.data_loader.pd.read_csv", falhar)
+    segundo = CarregadorDados().carregar_dados()
+
+    pd.testing.assert_frame_equal(primeiro, segundo)
+
+
+def test_carregar_dados_em_paralelo_mantem_ordem(monkeypatch, tmp_path):
+    with pd.ExcelWriter(tmp_path / "dados.xlsx") as escritor:
+        pd.DataFrame({"RA": ["1", "2"], "Matem 22": [5.0, 6.0]}).to_excel(escritor, sheet_name="PEDE2022", index=False)
+        pd.DataFrame({"Total": [2]}).to_excel(escritor, sheet_name="Resumo", index=False)
+        pd.DataFrame({"RA": ["3"], "Matem 23": [7.0]}).to_excel(escritor, sheet_name="PEDE2023", index=False)
+    (tmp_path / "dados.csv").write_text("RA;MAT;ANO_REFERENCIA\n4;8;2024\n")
+    monkeypatch.setattr("src.infrastructure.data.data_loader.Configuracoes.DATA_DIR", str(tmp_path))
+    monkeypatch.setattr("src.infrastructure.data.data_loader.Configuracoes.DATA_CACHE_ENABLED", False)
+
+    monkeypatch.setattr("src.infrastructure.data.data_loader.Configuracoes.DATA_LOADER_WORKERS", 1)
+    serial = CarregadorDados().carregar_dados()
+    monkeypatch.setattr("src.infrastructure.data.data_loader.Configuracoes.DATA_LOADER_WORKERS", 2)
+    paralelo = CarregadorDados().carregar_dados()
+
+    pd.testing.assert_frame_equal(paralelo, serial)
+    assert paralelo["RA"].tolist() == ["1", "2", "3", "4"]
+    assert paralelo["ANO_REFERENCIA"].tolist() == [2022, 2022, 2023, 2024]
+
+
+def test_ler_excel_em_blocos_projeta_colunas_e_limita_bloco(tmp_path):
+    caminho = tmp_path / "dados.xlsx"
+    with pd.ExcelWriter(caminho) as escritor:
+        pd.DataFrame(
+            {"RA": [" 1", "2", "3"], "INDE 2022": [5.5, None, 7.0], "Observação": ["a", "b", "c"]}
+        ).to_excel(escritor, sheet_name="PEDE2022", index=False)
+        pd.DataFrame({"Total": [3]}).to_excel(escritor, sheet_name="Resumo", index=False)
+
+    blocos = list(CarregadorDados()._ler_excel_em_blocos(str(caminho), tamanho_bloco=2))
+
+    assert [nome for nome, _ in blocos] == ["PEDE2022", "PEDE2022"]
+    assert [len(bloco) for _, bloco in blocos] == [2, 1]
+    assert list(blocos[0][1].columns) == ["RA", "INDE", "ANO_REFERENCIA"]
+    assert blocos[0][1]["RA"].tolist() == ["1", "2"]
+
+
+def test_carregar_dados_streaming_equivale_read_excel(monkeypatch, tmp_path):
+    with pd.ExcelWriter(tmp_path / "dados.xlsx") as escritor:
+        pd.DataFrame(
+            {
+                "RA": ["1", "2", "3"],
+                "Ano ingresso": [2019, 2020, None],
+                "Pedra 22": ["Ametista", None, "Quartzo"],
+                "INDE 22": [5.5, 6.0, 7.25],
+                "Matem": [5, 6, 7],
+                "Nome": ["A", "B", "C"],
+            }
+        ).to_excel(escritor, sheet_name="PEDE2022", index=False)
+    monkeypatch.setattr("src.infrastructure.data.data_loader.Configuracoes.DATA_DIR", str(tmp_path))
+    monkeypatch.setattr("src.infrastructure.data.data_loader.Configuracoes.DATA_CACHE_ENABLED", False)
+    monkeypatch.setattr("src.infrastructure.data.data_loader.Configuracoes.STREAM_CHUNK_SIZE", 2)
+
+    completo = CarregadorDados().carregar_dados()
+    monkeypatch.setattr("src.infrastructure.data.data_loader.Configuracoes.EXCEL_STREAMING_MIN_BYTES", 0)
+    partes = CarregadorDados()._ler_arquivo(str(tmp_path / "dados.xlsx"))
+    streaming = CarregadorDados().carregar_dados()
+
+    assert [len(parte) for parte in partes] == [2, 1]
+    assert "NOME" not in completo.columns
+    pd.testing.assert_frame_equal(streaming, completo)
+
+
+def test_cache_invalida_ao_mudar_limite_de_streaming(monkeypatch, tmp_path):
+    with pd.ExcelWriter(tmp_path / "dados.xlsx") as escritor:
+        pd.DataFrame({"RA": ["1", "2"], "INDE 22": [5.5, 6.0], "Nome": ["A", "B"]}).to_excel(
+            escritor, sheet_name="PEDE2022", index=False
+        )
+    monkeypatch.setattr("src.infrastructure.data.data_loader.Configuracoes.DATA_DIR", str(tmp_path))
+    monkeypatch.setattr("src.infrastructure.data.data_loader.Configuracoes.EXCEL_STREAMING_MIN_BYTES", 0)
+    CarregadorDados().carregar_dados()
+
+    lidos = []
+    ler_excel = pd.read_excel
+
+    def registrar_leitura(caminho, *args, **kwargs):
+        lidos.append(caminho)
+        return ler_excel(caminho, *args, **kwargs)
+
+    monkeypatch.setattr("src.infrastructure.data.data_loader.pd.read_excel", registrar_leitura)
+    monkeypatch.setattr("src.infrastructure.data.data_loader.Configuracoes.EXCEL_STREAMING_MIN_BYTES", 10**12)
+    CarregadorDados().carregar_dados()
+
+    assert lidos == [str(tmp_path / "dados.xlsx")]
+
+
+def test_cache_invalida_ao_mudar_apelidos(monkeypatch, tmp_path):
+    from src.infrastructure.data.header_resolver import ResolvedorCabecalhos
+
+    (tmp_path / "dados.csv").write_text("ID_ALUNO;INDE;ANO_REFERENCIA\n1;5,5;2023\n")
+    monkeypatch.setattr("src.infrastructure.data.data_loader.Configuracoes.DATA_DIR", str(tmp_path))
+
+    assert "RA" in CarregadorDados().carregar_dados().columns
+    monkeypatch.setattr(
+        CarregadorDados,
+        "RESOLVEDOR_CABECALHOS",
+        ResolvedorCabecalhos(apelidos={**ResolvedorCabecalhos.APELIDOS, "RA": ("RA",)}),
+    )
+
+    assert "RA" not in CarregadorDados().carregar_dados().columns
+
+
+def test_cache_invalida_ao_mudar_esquema_csv(monkeypatch, tmp_path):
+    from src.config.settings import Configuracoes
+
+    (tmp_path / "dados.csv").write_text("RA;INDE;ANO_REFERENCIA\n1;5,5;2023\n")
+    monkeypatch.setattr("src.infrastructure.data.data_loader.Configuracoes.DATA_DIR", str(tmp_path))
+
+    assert CarregadorDados().carregar_dados()["INDE"].dtype == "float64"
+    monkeypatch.setattr(Configuracoes, "ESQUEMA_CSV", {**Configuracoes.ESQUEMA_CSV, "INDE": "str"})
+
+    assert CarregadorDados().carregar_dados()["INDE"].dtype != "float64"
+
+
+def test_carregar_dados_registra_mapeamento_por_arquivo(monkeypatch, tmp_path):
+    (tmp_path / "dados.csv").write_text("Matrícula;Matem 2023;INDE 23;ANO_REFERENCIA\n1;5;6;2023\n")
+    monkeypatch.setattr("src.infrastructure.data.data_loader.Configuracoes.DATA_DIR", str(tmp_path))
+    esperado = {"Matrícula": "RA", "Matem 2023": "NOTA_MAT", "INDE 23": "INDE", "ANO_REFERENCIA": "ANO_REFERENCIA"}
+
+    for _ in range(2):
+        carregador = CarregadorDados()
+        carregador.carregar_dados()
+        assert carregador.mapeamentos_colunas == {str(tmp_path / "dados.csv"): esperado}
+
+
+def test_amostrar_csv_detecta_formato(tmp_path):
+    brasileiro = tmp_path / "brasileiro.csv"
+    brasileiro.write_text("RA;INDE 2023;ANO_REFERENCIA\n1;5,5;2023\n")
+    americano = tmp_path / "americano.csv"
+    americano.write_text("RA,INDE\n1,5.5\n")
+
+    assert CarregadorDados._amostrar_csv(str(brasileiro)) == (";", ",", ["RA", "INDE 2023", "ANO_REFERENCIA"], 2023)
+    separador, decimal, cabecalho, _ = CarregadorDados._amostrar_csv(str(americano))
+    assert (separador, decimal, cabecalho) == (",", ".", ["RA", "INDE"])
+
+
+def test_ler_csv_em_blocos_aplica_esquema(tmp_path):
+    caminho = tmp_path / "dados.csv"
+    caminho.write_text(
+        "RA;Fase;INDE 2023;Matem;ANO_REFERENCIA\n"
+        "001;1;5,5;7;2023\n"
+        "002;2;#DIV/0!;8;2023\n"
+        "003;ALFA;6;9;2023\n"
+    )
+    carregador = CarregadorDados()
+
+    blocos = list(carregador._ler_csv(str(caminho), tamanho_bloco=2))
+    completo = carregador._ler_arquivo(str(caminho))[0]
+
+    assert [len(bloco) for bloco in blocos] == [2, 1]
+    assert completo["RA"].tolist() == ["001", "002", "003"]
+    assert completo["FASE"].tolist() == ["1", "2", "ALFA"]
+    assert completo["INDE"].dtype == "float64"
+    assert completo["INDE"].isna().tolist() == [False, True, False]
+    assert completo["NOTA_MAT"].tolist() == [7.0, 8.0, 9.0]
+    pd.testing.assert_frame_equal(pd.concat(blocos, ignore_index=True), completo)
+
+
+def test_carregar_dados_rele_apenas_arquivos_novos_ou_alterados(monkeypatch, tmp_path):
+    dados = tmp_path / "dados"
+    dados.mkdir()
+    (dados / "a.csv").write_text("RA;ANO_REFERENCIA\n1;2022\n")
+    (dados / "b.csv").write_text("RA;ANO_REFERENCIA\n2;2023\n")
+    monkeypatch.setattr("src.infrastructure.data.data_loader.Configuracoes.DATA_DIR", str(dados))
+
+    CarregadorDados().carregar_dados()
+    chave_b = CarregadorDados().cache.ler_manifesto(str(dados))[str(dados / "b.csv")]["chave"]
+
+    (dados / "b.csv").write_text("RA;ANO_REFERENCIA\n2;2023\n3;2023\n")
+    (dados / "c.csv").write_text("RA;ANO_REFERENCIA\n4;2024\n")
+    lidos = []
+    ler_csv = pd.read_csv
+
+    def registrar_leitura(caminho, *args, **kwargs):
+        lidos.append(os.path.basename(caminho))
+        return ler_csv(caminho, *args, **kwargs)
+
+    monkeypatch.setattr("src.infrastructure.data.data_loader.pd.read_csv", registrar_leitura)
+    carregador = CarregadorDados()
+    df = carregador.carregar_dados()
+
+    assert lidos == ["b.csv", "c.csv"]
+    assert df["RA"].tolist() == ["1", "2", "3", "4"]
+    relatorio = carregador.relatorio_ingestao
+    assert [os.path.basename(c) for c in relatorio["inalterados"]] == ["a.csv"]
+    assert [os.path.basename(c) for c in relatorio["alterados"]] == ["b.csv"]
+    assert [os.path.basename(c) for c in relatorio["novos"]] == ["c.csv"]
+    assert not os.path.isdir(os.path.join(carregador.cache.diretorio, chave_b))
+
+    (dados / "a.csv").unlink()
+    carregador = CarregadorDados()
+    carregador.carregar_dados()
+
+    assert carregador.relatorio_ingestao["removidos"] == [str(dados / "a.csv")]
+    assert carregador.relatorio_ingestao["relidos"] == []
+    manifesto = carregador.cache.ler_manifesto(str(dados))
+    assert sorted(os.path.basename(c) for c in manifesto) == ["b.csv", "c.csv"]
+    assert manifesto[str(dados / "b.csv")]["linhas"] == 2
@@ -0,0 +1,77 @@
+"""Testes do resolvedor de cabeçalhos."""
+
+import re
+import unicodedata
+
+import pytest
+
+from src.infrastructure.data.header_resolver import ResolvedorCabecalhos
+
+
+def normalizar_legado(coluna, ano_completo):
+    ano_curto = int(str(ano_completo)[-2:])
+    coluna_limpa = str(coluna).upper().strip()
+    coluna_limpa = unicodedata.normalize("NFKD", coluna_limpa).encode("ASCII", "ignore").decode("utf-8")
+    coluna_limpa = re.sub(f"[ _]{ano_completo}", "", coluna_limpa)
+    coluna_limpa = re.sub(f"[ _]{ano_curto}$", "", coluna_limpa)
+
+    if coluna_limpa in ["RA", "ID_ALUNO", "CODIGO_ALUNO", "MATRICULA"]:
+        coluna_limpa = "RA"
+    elif coluna_limpa in ["MAT", "MATEM", "MATEMATICA"]:
+        coluna_limpa = "NOTA_MAT"
+    elif coluna_limpa in ["POR", "PORT", "PORTUG", "PORTUGUES"]:
+        coluna_limpa = "NOTA_PORT"
+    elif coluna_limpa in ["ING", "INGL", "INGLES"]:
+        coluna_limpa = "NOTA_ING"
+    elif coluna_limpa in ["DEFAS", "DEFASAGEM"]:
+        coluna_limpa = "DEFASAGEM"
+    elif "ANO" in coluna_limpa and "INGRESSO" in coluna_limpa:
+        coluna_limpa = "ANO_INGRESSO"
+
+    if "INST" in coluna_limpa and "ENSINO" in coluna_limpa:
+        coluna_limpa = "INSTITUICAO_ENSINO"
+    if "PONTO" in coluna_limpa and "VIRADA" in coluna_limpa:
+        coluna_limpa = "PONTO_VIRADA"
+    if "PSICOLOGIA" in coluna_limpa and "REC" in coluna_limpa:
+        coluna_limpa = "REC_PSICOLOGIA"
+    return coluna_limpa
+
+
+CABECALHOS = [
+    "RA", " id_aluno ", "Matem", "Matemática 22", "Portug 2022", "Inglês", "Defas", "Defasagem 2022",
+    "Ano ingresso", "Ano_Ingresso_2022", "Instituição de ensino", "Ponto de Virada 2022",
+    "Rec Psicologia", "INDE 2022", "INDE 22", "INDE_22", "IAA 2021", "Nome", "Fase ideal", 2022, "Gênero",
+    "Ano ingresso instituição ensino", "Unnamed: 3", "Cg", "INDE 2022 22",
+]
+
+
+@pytest.mark.parametrize("ano", [2020, 2022, 2024])
+def test_resolver_equivale_normalizacao_legada(ano):
+    resolvedor = ResolvedorCabecalhos()
+
+    for cabecalho in CABECALHOS:
+        assert resolvedor.resolver(cabecalho, ano) == normalizar_legado(cabecalho, ano)
+
+
+def test_resolver_memoriza_cabecalhos():
+    resolvedor = ResolvedorCabecalhos()
+
+    resolvedor.mapear(CABECALHOS, 2022)
+    resolvedor.mapear(CABECALHOS, 2022)
+
+    informacoes = resolvedor._resolver.cache_info()
+    assert informacoes.misses == len(CABECALHOS)
+    assert informacoes.hits == len(CABECALHOS)
+
+
+def test_resolver_com_tabela_personalizada():
+    resolvedor = ResolvedorCabecalhos(
+        apelidos={"RA": ("RA", "COD_ESTUDANTE")},
+        regras_termos=((("NOTA", "CIENCIAS"), "NOTA_CIENCIAS"),),
+    )
+
+    assert resolvedor.mapear(["Cod_Estudante", "Nota Ciências 2023", "Matem"], 2023) == {
+        "Cod_Estudante": "RA",
+        "Nota Ciências 2023": "NOTA_CIENCIAS",
+        "Matem": "MATEM",
+    }
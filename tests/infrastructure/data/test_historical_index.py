@@ -0,0 +1,208 @@
+"""Testes do índice de histórico."""
+
+import numpy as np
+import pandas as pd
+
+from src.infrastructure.data.historical_index import IndiceHistorico
+
+
+def test_construir_usa_penultimo_registro_por_ra():
+    dados = pd.DataFrame({
+        "RA": ["1", "1", "1", "2", "3", "3"],
+        "ANO_REFERENCIA": [2024, 2022, 2023, 2023, 2022, 2023],
+        "INDE": [9.0, 5.0, 6.0, 7.0, 3.0, 4.0],
+        "IAN": [1.0, 2.0, 3.0, 4.0, None, 6.0],
+    })
+
+    indice = IndiceHistorico.construir(dados)
+
+    assert len(indice) == 3
+    historico = indice.obter("1")
+    assert historico["INDE_ANTERIOR"] == 6.0
+    assert historico["IAN_ANTERIOR"] == 3.0
+    assert historico["IAA_ANTERIOR"] == 0.0
+    assert historico["ALUNO_NOVO"] == 0
+    assert indice.obter("3")["IAN_ANTERIOR"] == 0.0
+
+
+def test_obter_sem_ano_anterior_ou_inexistente():
+    dados = pd.DataFrame({"RA": ["2"], "ANO_REFERENCIA": [2023], "INDE": [7.0]})
+
+    indice = IndiceHistorico.construir(dados)
+
+    assert indice.obter("2") is None
+    assert indice.obter("999") is None
+
+
+def test_obter_ponto_no_tempo_por_ano_referencia():
+    dados = pd.DataFrame({
+        "RA": ["1", "1", "1"],
+        "ANO_REFERENCIA": [2020, 2022, 2024],
+        "INDE": [4.0, 6.0, 8.0],
+    })
+
+    indice = IndiceHistorico.construir(dados)
+
+    assert indice.obter("1", 2025)["INDE_ANTERIOR"] == 8.0
+    assert indice.obter("1", 2024)["INDE_ANTERIOR"] == 6.0
+    assert indice.obter("1", 2023)["INDE_ANTERIOR"] == 6.0
+    assert indice.obter("1", 2021)["INDE_ANTERIOR"] == 4.0
+    assert indice.obter("1", 2020) is None
+    assert indice.obter("1")["INDE_ANTERIOR"] == 6.0
+
+
+def test_obter_lote_equivale_a_consultas_individuais():
+    dados = pd.DataFrame({
+        "RA": ["1", "1", "1", "2", "5", "5"],
+        "ANO_REFERENCIA": [2020, 2022, 2024, 2023, 2021, 2023],
+        "INDE": [4.0, 6.0, 8.0, 7.0, 1.0, 2.0],
+        "IAN": [1.0, 2.0, 3.0, 4.0, 5.0, 6.0],
+    })
+    indice = IndiceHistorico.construir(dados)
+    ras = ["1", "1", "1", "2", "999", "5", "5", "1"]
+    anos = [2025, 2023, 2020, 2024, 2024, 2023, None, None]
+
+    lote = indice.obter_lote(ras, anos)
+
+    assert list(lote.columns) == IndiceHistorico.COLUNAS_LAG + ["ALUNO_NOVO"]
+    assert len(lote) == len(ras)
+    for posicao, (ra, ano) in enumerate(zip(ras, anos)):
+        esperado = indice.obter(ra, ano)
+        linha = lote.iloc[posicao]
+        if esperado is None:
+            assert linha["ALUNO_NOVO"] == 1
+            assert (linha[IndiceHistorico.COLUNAS_LAG] == 0.0).all()
+        else:
+            assert linha.to_dict() == esperado
+
+
+def test_obter_lote_sem_ano_e_indice_vazio():
+    dados = pd.DataFrame({"RA": ["1", "1"], "ANO_REFERENCIA": [2022, 2023], "INDE": [5.0, 6.0]})
+
+    lote = IndiceHistorico.construir(dados).obter_lote(np.array(["1", "2"]))
+    vazio = IndiceHistorico.construir(dados.iloc[:0]).obter_lote(["1"])
+
+    assert lote["INDE_ANTERIOR"].tolist() == [5.0, 0.0]
+    assert lote["ALUNO_NOVO"].tolist() == [0, 1]
+    assert vazio["ALUNO_NOVO"].tolist() == [1]
+
+
+def test_snapshot_abre_com_memmap_e_responde_igual(tmp_path):
+    dados = pd.DataFrame({
+        "RA": ["10", "2", "2", "10", "7"],
+        "ANO_REFERENCIA": [2023, 2022, 2023, 2022, 2023],
+        "INDE": [6.0, 3.0, 4.0, 5.0, 1.0],
+    })
+    indice = IndiceHistorico.construir(dados)
+
+    indice.salvar_snapshot(str(tmp_path), origem=[["dados.xlsx", 1, 2]])
+    mapeado = IndiceHistorico.abrir_snapshot(str(tmp_path))
+
+    assert isinstance(mapeado._valores, np.memmap)
+    assert mapeado._posicoes == {"10": 0, "2": 1, "7": 2}
+    assert len(mapeado) == 3
+    assert mapeado.obter("10") == indice.obter("10")
+    assert mapeado.obter("2", 2023)["INDE_ANTERIOR"] == 3.0
+    assert mapeado.obter("7") is None
+    assert mapeado.obter("999") is None
+    assert IndiceHistorico.ler_manifesto(str(tmp_path))["origem"] == [["dados.xlsx", 1, 2]]
+
+
+def test_republicar_snapshot_preserva_versao_aberta(tmp_path):
+    antigo = IndiceHistorico.construir(
+        pd.DataFrame({"RA": ["1", "1"], "ANO_REFERENCIA": [2022, 2023], "INDE": [5.0, 6.0]})
+    )
+    novo = IndiceHistorico.construir(
+        pd.DataFrame({"RA": ["1", "1"], "ANO_REFERENCIA": [2022, 2023], "INDE": [8.0, 9.0]})
+    )
+
+    antigo.salvar_snapshot(str(tmp_path))
+    aberto = IndiceHistorico.abrir_snapshot(str(tmp_path))
+    novo.salvar_snapshot(str(tmp_path))
+
+    assert aberto.obter("1")["INDE_ANTERIOR"] == 5.0
+    assert IndiceHistorico.abrir_snapshot(str(tmp_path)).obter("1")["INDE_ANTERIOR"] == 8.0
+
+
+def test_atualizar_reconstroi_apenas_ras_afetados_e_equivale_a_reconstrucao():
+    base = pd.DataFrame({
+        "RA": ["1", "1", "2", "3"],
+        "ANO_REFERENCIA": [2022, 2023, 2023, 2023],
+        "INDE": [5.0, 6.0, 7.0, 1.0],
+    })
+    novos = pd.DataFrame({
+        "RA": ["1", "2", "4", "4", "3"],
+        "ANO_REFERENCIA": [2024, 2023, 2023, 2024, 2023],
+        "INDE": [8.0, 9.0, 2.0, 3.0, 1.0],
+    })
+    indice = IndiceHistorico.construir(base)
+
+    atualizado, relatorio = indice.atualizar(novos)
+
+    assert relatorio == {
+        "received": 5, "inserted": 3, "updated": 1, "unchanged": 1, "students_affected": 3,
+    }
+    assert atualizado.revisao == 1
+    assert atualizado.tamanho_delta() == 3
+    assert indice.obter("4") is None
+
+    completo = pd.concat([base, novos]).drop_duplicates(subset=["RA", "ANO_REFERENCIA"], keep="last")
+    reconstruido = IndiceHistorico.construir(completo)
+    ras = ["1", "2", "3", "4", "9"]
+    for ano in [None, 2024, 2025]:
+        anos = None if ano is None else [ano] * len(ras)
+        pd.testing.assert_frame_equal(atualizado.obter_lote(ras, anos), reconstruido.obter_lote(ras, anos))
+        pd.testing.assert_frame_equal(
+            atualizado.compactar().obter_lote(ras, anos), reconstruido.obter_lote(ras, anos)
+        )
+    assert len(atualizado) == len(reconstruido) == 4
+
+
+def test_atualizar_sem_alteracoes_retorna_mesmo_indice():
+    dados = pd.DataFrame({"RA": ["1"], "ANO_REFERENCIA": [2023], "INDE": [5.0]})
+    indice = IndiceHistorico.construir(dados)
+
+    atualizado, relatorio = indice.atualizar(dados)
+
+    assert atualizado is indice
+    assert relatorio["unchanged"] == 1
+    assert relatorio["students_affected"] == 0
+
+
+def test_salvar_delta_persiste_no_snapshot_publicado(tmp_path):
+    base = pd.DataFrame({"RA": ["1", "1"], "ANO_REFERENCIA": [2022, 2023], "INDE": [5.0, 6.0]})
+    IndiceHistorico.construir(base).salvar_snapshot(str(tmp_path), origem=["a"])
+    aberto = IndiceHistorico.abrir_snapshot(str(tmp_path))
+
+    atualizado, _ = aberto.atualizar(
+        pd.DataFrame({"RA": ["1", "2", "2"], "ANO_REFERENCIA": [2024, 2023, 2024], "INDE": [7.0, 1.0, 2.0]})
+    )
+    atualizado.salvar_delta(str(tmp_path))
+    reaberto = IndiceHistorico.abrir_snapshot(str(tmp_path))
+
+    assert IndiceHistorico.ler_manifesto(str(tmp_path))["origem"] == ["a"]
+    assert reaberto.revisao == 1
+    assert reaberto.obter("1")["INDE_ANTERIOR"] == 6.0
+    assert reaberto.obter("1", 2025)["INDE_ANTERIOR"] == 7.0
+    assert reaberto.obter("2")["INDE_ANTERIOR"] == 1.0
+    assert len(reaberto) == 2
+
+
+def test_construir_projeta_reduz_tipos_e_remove_duplicados():
+    dados = pd.DataFrame({
+        "RA": ["1", "1", "1", "2"],
+        "ANO_REFERENCIA": [2022, 2023, 2023, 2023],
+        "INDE": [5.1, 6.0, 6.3, 7.0],
+        "NOME": ["a", "b", "c", "d"],
+    })
+
+    indice = IndiceHistorico.construir(dados)
+
+    assert indice._anos.dtype == np.int16
+    assert indice._valores.dtype == np.float32
+    assert len(indice._anos) == 3
+    assert indice.obter("1", 2024)["INDE_ANTERIOR"] == 6.3
+    assert indice.obter("1")["INDE_ANTERIOR"] == 5.1
+    assert indice.memoria_bytes() == sum(
+        getattr(indice, f"_{nome}").nbytes for nome in IndiceHistorico.ARRAYS_SNAPSHOT
+    )
@@ -1,8 +1,10 @@
 """Testes do repositório histórico."""
 
+import threading
 from unittest.mock import Mock
 
 import pandas as pd
+import pytest
 
 from src.infrastructure.data.historical_repository import RepositorioHistorico
 
@@ -22,7 +24,7 @@ def test_repositorio_carrega_referencia_com_ra(monkeypatch):
     monkeypatch.setattr("src.infrastructure.data.historical_repository.os.path.exists", lambda path: True)
     monkeypatch.setattr(
         "src.infrastructure.data.historical_repository.pd.read_csv",
-        lambda path: pd.DataFrame(
+        lambda path, **kwargs: pd.DataFrame(
             {
                 "RA": ["1", "1"],
                 "ANO_REFERENCIA": [2022, 2023],
@@ -47,7 +49,7 @@ def test_repositorio_recarrega_quando_referencia_sem_ra(monkeypatch):
     monkeypatch.setattr("src.infrastructure.data.historical_repository.os.path.exists", lambda path: True)
     monkeypatch.setattr(
         "src.infrastructure.data.historical_repository.pd.read_csv",
-        lambda path: pd.DataFrame({"ANO_REFERENCIA": [2023]}),
+        lambda path, **kwargs: pd.DataFrame({"ANO_REFERENCIA": [2023]}),
     )
 
     carregador_mock = Mock()
@@ -90,7 +92,7 @@ def test_repositorio_retorna_none_quando_estudante_nao_existe(monkeypatch):
     monkeypatch.setattr("src.infrastructure.data.historical_repository.os.path.exists", lambda path: True)
     monkeypatch.setattr(
         "src.infrastructure.data.historical_repository.pd.read_csv",
-        lambda path: pd.DataFrame(
+        lambda path, **kwargs: pd.DataFrame(
             {
                 "RA": ["1", "1"],
                 "ANO_REFERENCIA": [2022, 2023],
@@ -114,7 +116,7 @@ def test_repositorio_trata_valores_invalidos(monkeypatch):
     monkeypatch.setattr("src.infrastructure.data.historical_repository.os.path.exists", lambda path: True)
     monkeypatch.setattr(
         "src.infrastructure.data.historical_repository.pd.read_csv",
-        lambda path: pd.DataFrame(
+        lambda path, **kwargs: pd.DataFrame(
             {
                 "RA": ["1", "1"],
                 "ANO_REFERENCIA": [2022, 2023],
@@ -129,3 +131,344 @@ def test_repositorio_trata_valores_invalidos(monkeypatch):
 
     assert historico["INDE_ANTERIOR"] == 0.0
     assert historico["IAA_ANTERIOR"] == 0.0
+
+
+def test_repositorio_reutiliza_snapshot_compilado(monkeypatch, tmp_path):
+    resetar_repositorio()
+    arquivo_dados = tmp_path / "historico.xlsx"
+    arquivo_dados.write_bytes(b"conteudo")
+
+    monkeypatch.setattr(
+        "src.infrastructure.data.historical_repository.Configuracoes.HISTORICAL_PATH", None
+    )
+    monkeypatch.setattr(
+        "src.infrastructure.data.historical_repository.Configuracoes.DATA_DIR", str(tmp_path)
+    )
+
+    carregador_mock = Mock()
+    carregador_mock.carregar_dados.return_value = pd.DataFrame(
+        {"RA": ["5", "5"], "ANO_REFERENCIA": [2022, 2023], "INDE": [4.0, 8.0]}
+    )
+    monkeypatch.setattr("src.infrastructure.data.data_loader.CarregadorDados", lambda: carregador_mock)
+
+    primeiro = RepositorioHistorico()
+    resetar_repositorio()
+    segundo = RepositorioHistorico()
+
+    assert carregador_mock.carregar_dados.call_count == 1
+    assert primeiro.obter_historico_estudante("5") == segundo.obter_historico_estudante("5")
+    assert segundo.obter_historico_estudante("5")["INDE_ANTERIOR"] == 4.0
+
+    arquivo_dados.write_bytes(b"conteudo alterado")
+    resetar_repositorio()
+    RepositorioHistorico()
+
+    assert carregador_mock.carregar_dados.call_count == 2
+
+
+def test_recarregar_troca_indice_sem_afetar_leitura_em_andamento(monkeypatch):
+    resetar_repositorio()
+    monkeypatch.setattr(
+        "src.infrastructure.data.historical_repository.Configuracoes.FEATURE_STORE_SNAPSHOT_ENABLED", False
+    )
+    monkeypatch.setattr(
+        "src.infrastructure.data.historical_repository.Configuracoes.HISTORICAL_PATH", None
+    )
+
+    carregador_mock = Mock()
+    carregador_mock.carregar_dados.side_effect = [
+        pd.DataFrame({"RA": ["1", "1"], "ANO_REFERENCIA": [2022, 2023], "INDE": [5.0, 6.0]}),
+        pd.DataFrame({"RA": ["1", "1"], "ANO_REFERENCIA": [2022, 2023], "INDE": [7.0, 8.0]}),
+    ]
+    monkeypatch.setattr("src.infrastructure.data.data_loader.CarregadorDados", lambda: carregador_mock)
+
+    repo = RepositorioHistorico()
+    indice_em_uso = repo._indice
+    versao_inicial = repo.status()["version"]
+
+    assert repo.recarregar(aguardar=True) is True
+
+    assert indice_em_uso.obter("1")["INDE_ANTERIOR"] == 5.0
+    assert repo.obter_historico_estudante("1")["INDE_ANTERIOR"] == 7.0
+    assert repo.status()["version"] == versao_inicial + 1
+    assert repo.status()["reloading"] is False
+
+
+def test_recarregar_com_falha_mantem_versao_atual(monkeypatch):
+    resetar_repositorio()
+    monkeypatch.setattr(
+        "src.infrastructure.data.historical_repository.Configuracoes.FEATURE_STORE_SNAPSHOT_ENABLED", False
+    )
+    monkeypatch.setattr(
+        "src.infrastructure.data.historical_repository.Configuracoes.HISTORICAL_PATH", None
+    )
+
+    carregador_mock = Mock()
+    carregador_mock.carregar_dados.side_effect = [
+        pd.DataFrame({"RA": ["1", "1"], "ANO_REFERENCIA": [2022, 2023], "INDE": [5.0, 6.0]}),
+        RuntimeError("boom"),
+    ]
+    monkeypatch.setattr("src.infrastructure.data.data_loader.CarregadorDados", lambda: carregador_mock)
+
+    repo = RepositorioHistorico()
+    repo.recarregar(aguardar=True)
+
+    assert repo.obter_historico_estudante("1")["INDE_ANTERIOR"] == 5.0
+
+
+def test_recarregar_ignora_pedido_concorrente(monkeypatch):
+    resetar_repositorio()
+    monkeypatch.setattr(
+        "src.infrastructure.data.historical_repository.os.path.exists", lambda path: False
+    )
+    carregador_mock = Mock()
+    carregador_mock.carregar_dados.side_effect = RuntimeError("boom")
+    monkeypatch.setattr("src.infrastructure.data.data_loader.CarregadorDados", lambda: carregador_mock)
+
+    repo = RepositorioHistorico()
+    RepositorioHistorico._lock_recarga.acquire()
+    try:
+        assert repo.recarregar() is False
+    finally:
+        RepositorioHistorico._lock_recarga.release()
+
+
+def test_obter_historicos_em_lote_normaliza_ras(monkeypatch):
+    resetar_repositorio()
+    monkeypatch.setattr(
+        "src.infrastructure.data.historical_repository.Configuracoes.HISTORICAL_PATH", None
+    )
+    carregador_mock = Mock()
+    carregador_mock.carregar_dados.return_value = pd.DataFrame(
+        {"RA": ["1", "1", "2"], "ANO_REFERENCIA": [2022, 2023, 2023], "INDE": [5.0, 6.0, 7.0]}
+    )
+    monkeypatch.setattr("src.infrastructure.data.data_loader.CarregadorDados", lambda: carregador_mock)
+
+    historicos = RepositorioHistorico().obter_historicos([" 1 ", 2, "1"], [2024, 2024, 2023])
+
+    assert historicos["INDE_ANTERIOR"].tolist() == [6.0, 7.0, 5.0]
+    assert historicos["ALUNO_NOVO"].tolist() == [0, 0, 0]
+
+
+def test_obter_historicos_sem_dados_marca_todos_como_novos(monkeypatch):
+    resetar_repositorio()
+    monkeypatch.setattr("src.infrastructure.data.historical_repository.os.path.exists", lambda path: False)
+    carregador_mock = Mock()
+    carregador_mock.carregar_dados.side_effect = RuntimeError("boom")
+    monkeypatch.setattr("src.infrastructure.data.data_loader.CarregadorDados", lambda: carregador_mock)
+
+    historicos = RepositorioHistorico().obter_historicos(["1", "2"])
+
+    assert historicos["ALUNO_NOVO"].tolist() == [1, 1]
+
+
+def test_instanciacao_concorrente_carrega_uma_unica_vez(monkeypatch):
+    resetar_repositorio()
+    chamadas = []
+    liberar = threading.Event()
+
+    def carregar_lento(self):
+        chamadas.append(self)
+        liberar.wait(1)
+
+    monkeypatch.setattr(RepositorioHistorico, "_carregar_dados", carregar_lento)
+
+    instancias = []
+    threads = [threading.Thread(target=lambda: instancias.append(RepositorioHistorico())) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    liberar.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(chamadas) == 1
+    assert all(instancia is instancias[0] for instancia in instancias)
+    assert RepositorioHistorico.inicializado() is True
+
+
+def test_repositorio_com_backend_sqlite_le_csv_em_lotes(monkeypatch, tmp_path):
+    resetar_repositorio()
+    caminho_csv = tmp_path / "historico.csv"
+    pd.DataFrame(
+        {"RA": ["1.0", "1", "2", "2"], "ANO_REFERENCIA": [2022, 2023, 2022, 2023], "INDE": [5.0, 6.0, 7.0, 8.0]}
+    ).to_csv(caminho_csv, index=False)
+    monkeypatch.setattr("src.infrastructure.data.historical_repository.Configuracoes.FEATURE_STORE_BACKEND", "sqlite")
+    monkeypatch.setattr(
+        "src.infrastructure.data.historical_repository.Configuracoes.HISTORICAL_PATH", str(caminho_csv)
+    )
+    monkeypatch.setattr("src.infrastructure.data.historical_repository.Configuracoes.DATA_DIR", str(tmp_path / "vazio"))
+    monkeypatch.setattr("src.infrastructure.data.historical_repository.Configuracoes.STREAM_CHUNK_SIZE", 1)
+
+    repo = RepositorioHistorico()
+
+    assert repo.obter_historico_estudante("1")["INDE_ANTERIOR"] == 5.0
+    assert repo.obter_historico_estudante("2", 2023)["INDE_ANTERIOR"] == 7.0
+    assert repo.obter_historico_estudante("3") is None
+    assert repo.status()["students"] == 2
+
+    leituras = []
+    original = pd.read_csv
+    monkeypatch.setattr(
+        "src.infrastructure.data.historical_repository.pd.read_csv",
+        lambda *args, **kwargs: leituras.append(args) or original(*args, **kwargs),
+    )
+    resetar_repositorio()
+    RepositorioHistorico()
+
+    assert leituras == []
+
+
+def test_atualizar_registros_persiste_delta_no_snapshot(monkeypatch, tmp_path):
+    resetar_repositorio()
+    caminho_csv = tmp_path / "historico.csv"
+    pd.DataFrame(
+        {"RA": ["1", "1", "2", "3", "4", "5"], "ANO_REFERENCIA": [2022, 2023, 2023, 2023, 2023, 2023],
+         "INDE": [5.0, 6.0, 7.0, 1.0, 1.0, 1.0]}
+    ).to_csv(caminho_csv, index=False)
+    monkeypatch.setattr(
+        "src.infrastructure.data.historical_repository.Configuracoes.HISTORICAL_PATH", str(caminho_csv)
+    )
+    monkeypatch.setattr("src.infrastructure.data.historical_repository.Configuracoes.DATA_DIR", str(tmp_path / "vazio"))
+    monkeypatch.setattr(
+        "src.infrastructure.data.historical_repository.Configuracoes.FEATURE_STORE_DELTA_MAX_FRACTION", 0.5
+    )
+
+    repo = RepositorioHistorico()
+    versao = repo.status()["version"]
+    relatorio = repo.atualizar_registros(
+        pd.DataFrame({"RA": [" 2 ", "2"], "ANO_REFERENCIA": [2023, 2024], "INDE": [7.0, 8.0]})
+    )
+
+    assert relatorio["inserted"] == 1
+    assert relatorio["unchanged"] == 1
+    assert relatorio["students_affected"] == 1
+    assert relatorio["compacted"] is False
+    assert relatorio["version"] == versao + 1
+    assert repo.obter_historico_estudante("2", 2025)["INDE_ANTERIOR"] == 8.0
+
+    resetar_repositorio()
+    reaberto = RepositorioHistorico()
+    assert reaberto.obter_historico_estudante("2", 2025)["INDE_ANTERIOR"] == 8.0
+    assert RepositorioHistorico._revisao_publicada(reaberto._origem) == reaberto._revisao == 1
+
+
+def test_atualizar_registros_compacta_delta_grande(monkeypatch):
+    resetar_repositorio()
+    monkeypatch.setattr(
+        "src.infrastructure.data.historical_repository.Configuracoes.FEATURE_STORE_SNAPSHOT_ENABLED", False
+    )
+    monkeypatch.setattr("src.infrastructure.data.historical_repository.Configuracoes.HISTORICAL_PATH", None)
+    carregador_mock = Mock()
+    carregador_mock.carregar_dados.return_value = pd.DataFrame(
+        {"RA": ["1", "1"], "ANO_REFERENCIA": [2022, 2023], "INDE": [5.0, 6.0]}
+    )
+    monkeypatch.setattr("src.infrastructure.data.data_loader.CarregadorDados", lambda: carregador_mock)
+
+    repo = RepositorioHistorico()
+    relatorio = repo.atualizar_registros(
+        pd.DataFrame({"RA": ["1", "2"], "ANO_REFERENCIA": [2024, 2024], "INDE": [7.0, 1.0]})
+    )
+
+    assert relatorio["compacted"] is True
+    assert repo._indice.tamanho_delta() == 0
+    assert repo.obter_historico_estudante("1", 2025)["INDE_ANTERIOR"] == 7.0
+
+
+def test_atualizar_registros_exige_colunas_chave():
+    resetar_repositorio()
+    repo = object.__new__(RepositorioHistorico)
+
+    try:
+        repo.atualizar_registros(pd.DataFrame({"RA": ["1"]}))
+    except ValueError as erro:
+        assert "ANO_REFERENCIA" in str(erro)
+    else:
+        raise AssertionError("ValueError esperado")
+
+
+def test_repositorio_le_apenas_colunas_necessarias(monkeypatch, tmp_path):
+    resetar_repositorio()
+    caminho_csv = tmp_path / "historico.csv"
+    pd.DataFrame(
+        {"RA": ["1", "1"], "ANO_REFERENCIA": [2022, 2023], "INDE": [5.0, 6.0], "NOME": ["Ana", "Ana"]}
+    ).to_csv(caminho_csv, index=False)
+    monkeypatch.setattr(
+        "src.infrastructure.data.historical_repository.Configuracoes.HISTORICAL_PATH", str(caminho_csv)
+    )
+    monkeypatch.setattr(
+        "src.infrastructure.data.historical_repository.Configuracoes.FEATURE_STORE_SNAPSHOT_ENABLED", False
+    )
+    colunas_lidas = []
+    original = pd.read_csv
+
+    def ler_csv(*args, **kwargs):
+        dados = original(*args, **kwargs)
+        colunas_lidas.extend(dados.columns)
+        return dados
+
+    monkeypatch.setattr("src.infrastructure.data.historical_repository.pd.read_csv", ler_csv)
+
+    repo = RepositorioHistorico()
+
+    assert sorted(colunas_lidas) == ["ANO_REFERENCIA", "INDE", "RA"]
+    assert repo.obter_historico_estudante("1")["INDE_ANTERIOR"] == 5.0
+    assert repo.status()["memory_bytes"] > 0
+
+
+def test_atualizar_registros_concorrente_preserva_delta_de_outro_worker(monkeypatch, tmp_path):
+    resetar_repositorio()
+    caminho_csv = tmp_path / "historico.csv"
+    pd.DataFrame(
+        {"RA": ["1", "2", "3", "4", "5", "6"], "ANO_REFERENCIA": [2023] * 6, "INDE": [1.0, 2.0, 3.0, 4.0, 5.0, 6.0]}
+    ).to_csv(caminho_csv, index=False)
+    monkeypatch.setattr(
+        "src.infrastructure.data.historical_repository.Configuracoes.HISTORICAL_PATH", str(caminho_csv)
+    )
+    monkeypatch.setattr("src.infrastructure.data.historical_repository.Configuracoes.DATA_DIR", str(tmp_path / "vazio"))
+    monkeypatch.setattr(
+        "src.infrastructure.data.historical_repository.Configuracoes.FEATURE_STORE_DELTA_MAX_FRACTION", 0.5
+    )
+
+    worker_a = RepositorioHistorico()
+    resetar_repositorio()
+    worker_b = RepositorioHistorico()
+    assert worker_a is not worker_b
+
+    worker_a.atualizar_registros(pd.DataFrame({"RA": ["2"], "ANO_REFERENCIA": [2024], "INDE": [8.0]}))
+    worker_b.atualizar_registros(pd.DataFrame({"RA": ["3"], "ANO_REFERENCIA": [2024], "INDE": [9.0]}))
+
+    assert worker_b.obter_historico_estudante("2", 2025)["INDE_ANTERIOR"] == 8.0
+    assert RepositorioHistorico._revisao_publicada(worker_b._origem) == worker_b._revisao == 2
+    assert RepositorioHistorico._revisao_publicada(worker_a._origem) != worker_a._revisao
+
+    resetar_repositorio()
+    reaberto = RepositorioHistorico()
+    assert reaberto.obter_historico_estudante("2", 2025)["INDE_ANTERIOR"] == 8.0
+    assert reaberto.obter_historico_estudante("3", 2025)["INDE_ANTERIOR"] == 9.0
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_atualizar_registros_rele_arquivos_brutos_alterados(monkeypatch, tmp_path, backend):
+    resetar_repositorio()
+    caminho_csv = tmp_path / "historico.csv"
+    historico = pd.DataFrame({"RA": ["1", "2"], "ANO_REFERENCIA": [2023, 2023], "INDE": [5.0, 6.0]})
+    historico.to_csv(caminho_csv, index=False)
+    monkeypatch.setattr("src.infrastructure.data.historical_repository.Configuracoes.FEATURE_STORE_BACKEND", backend)
+    monkeypatch.setattr(
+        "src.infrastructure.data.historical_repository.Configuracoes.HISTORICAL_PATH", str(caminho_csv)
+    )
+    monkeypatch.setattr("src.infrastructure.data.historical_repository.Configuracoes.DATA_DIR", str(tmp_path / "vazio"))
+
+    repo = RepositorioHistorico()
+    pd.concat(
+        [historico, pd.DataFrame({"RA": ["1"], "ANO_REFERENCIA": [2024], "INDE": [7.0]})]
+    ).to_csv(caminho_csv, index=False)
+    repo.atualizar_registros(pd.DataFrame({"RA": ["2"], "ANO_REFERENCIA": [2024], "INDE": [8.0]}))
+
+    assert repo.obter_historico_estudante("1", 2025)["INDE_ANTERIOR"] == 7.0
+    assert repo.obter_historico_estudante("2", 2025)["INDE_ANTERIOR"] == 8.0
+
+    resetar_repositorio()
+    reaberto = RepositorioHistorico()
+    assert reaberto.obter_historico_estudante("1", 2025)["INDE_ANTERIOR"] == 7.0
+    assert reaberto.obter_historico_estudante("2", 2025)["INDE_ANTERIOR"] == 8.0
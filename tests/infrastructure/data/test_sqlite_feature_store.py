@@ -0,0 +1,97 @@
+"""Testes da Feature Store em SQLite."""
+
+import threading
+
+import pandas as pd
+
+from src.infrastructure.data.historical_index import IndiceHistorico
+from src.infrastructure.data.sqlite_feature_store import IndiceHistoricoSQLite
+
+
+def criar_historico():
+    return pd.DataFrame({
+        "RA": ["1", "1", "1", "2", "5", "5"],
+        "ANO_REFERENCIA": [2020, 2022, 2024, 2023, 2021, "x"],
+        "INDE": [4.0, 6.0, 8.0, 7.0, 1.0, 2.0],
+        "IAN": [1.0, None, 3.0, 4.0, 5.0, 6.0],
+    })
+
+
+def test_construir_responde_igual_ao_indice_em_memoria(tmp_path):
+    dados = criar_historico()
+    lotes = [dados.iloc[:3], dados.iloc[3:]]
+
+    sqlite = IndiceHistoricoSQLite.construir(lotes, str(tmp_path / "fs.sqlite"), origem=["a"])
+    memoria = IndiceHistorico.construir(dados)
+
+    assert len(sqlite) == len(memoria) == 3
+    for ra in ["1", "2", "5", "999"]:
+        for ano in [None, 2020, 2021, 2023, 2024, 2025]:
+            assert sqlite.obter(ra, ano) == memoria.obter(ra, ano)
+
+    ras = ["1", "2", "999", "1"]
+    anos = [2025, 2024, 2024, None]
+    pd.testing.assert_frame_equal(sqlite.obter_lote(ras, anos), memoria.obter_lote(ras, anos))
+
+
+def test_abrir_exige_mesma_origem(tmp_path):
+    caminho = str(tmp_path / "fs.sqlite")
+    IndiceHistoricoSQLite.construir([criar_historico()], caminho, origem=["a"])
+
+    assert IndiceHistoricoSQLite.abrir(caminho, ["a"]) is not None
+    assert IndiceHistoricoSQLite.abrir(caminho, ["b"]) is None
+    assert IndiceHistoricoSQLite.abrir(str(tmp_path / "ausente.sqlite"), ["a"]) is None
+
+
+def test_construir_sem_registros_retorna_none(tmp_path):
+    caminho = tmp_path / "fs.sqlite"
+
+    indice = IndiceHistoricoSQLite.construir([criar_historico().iloc[:0]], str(caminho))
+
+    assert indice is None
+    assert not caminho.exists()
+
+
+def test_conexao_por_thread_e_cache_lru(tmp_path):
+    indice = IndiceHistoricoSQLite.construir(
+        [criar_historico()], str(tmp_path / "fs.sqlite"), origem=None
+    )
+    conexoes = [indice._conexao()]
+    indice.obter("1", 2024)
+
+    def consultar():
+        assert indice.obter("1", 2024)["INDE_ANTERIOR"] == 6.0
+        conexoes.append(indice._conexao())
+
+    threads = [threading.Thread(target=consultar) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len({id(conexao) for conexao in conexoes}) == 4
+    assert indice._consultar.cache_info().hits == 3
+    assert indice._consultar.cache_info().misses == 1
+
+
+def test_atualizar_grava_apenas_alterados_e_invalida_cache_de_outras_conexoes(tmp_path):
+    caminho = str(tmp_path / "fs.sqlite")
+    escritor = IndiceHistoricoSQLite.construir([criar_historico()], caminho, origem=["a"])
+    leitor = IndiceHistoricoSQLite(caminho)
+    assert leitor.obter("1", 2025)["INDE_ANTERIOR"] == 8.0
+
+    _, relatorio = escritor.atualizar(
+        pd.DataFrame({
+            "RA": ["1", "1", "9"],
+            "ANO_REFERENCIA": [2024, 2025, 2024],
+            "INDE": [8.0, 9.0, 3.0],
+            "IAN": [3.0, 1.0, 1.0],
+        }),
+    )
+
+    assert relatorio == {
+        "received": 3, "inserted": 2, "updated": 0, "unchanged": 1, "students_affected": 2,
+    }
+    assert leitor.obter("1", 2026)["INDE_ANTERIOR"] == 9.0
+    assert len(leitor) == 4
+    assert leitor.metadados["origem"] == ["a"]
@@ -16,6 +16,23 @@ def test_logger_predicao_singleton():
     assert primeiro is segundo
 
 
+def test_preparar_cria_diretorio_e_marca_pronto(monkeypatch, tmp_path):
+    resetar_logger()
+    LoggerPredicao._preparado = False
+    caminho = tmp_path / "logs" / "predicoes.jsonl"
+    monkeypatch.setattr(
+        "src.infrastructure.logging.prediction_logger.Configuracoes.LOG_PATH", str(caminho)
+    )
+
+    logger_predicao = LoggerPredicao()
+    assert logger_predicao.esta_pronto() is False
+
+    logger_predicao.preparar()
+
+    assert caminho.parent.is_dir()
+    assert logger_predicao.esta_pronto() is True
+
+
 def test_registrar_predicao_sucesso(monkeypatch):
     resetar_logger()
 
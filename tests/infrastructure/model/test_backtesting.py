@@ -0,0 +1,71 @@
+"""Testes do backtesting temporal."""
+
+import json
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from src.config.settings import Configuracoes
+from src.infrastructure.model.backtesting import BacktestTemporal, processar_dobra
+
+
+@pytest.fixture()
+def caminho_relatorio():
+    return Path(Configuracoes.BACKTEST_PATH)
+
+
+def test_backtest_gera_uma_dobra_por_ano(monkeypatch, caminho_relatorio, dados_sinteticos):
+    monkeypatch.setattr(Configuracoes, "BACKTEST_WORKERS", 1)
+    relatorio = BacktestTemporal().executar(dados_sinteticos([2021, 2022, 2023]))
+
+    assert [dobra["ano_teste"] for dobra in relatorio["dobras"]] == [2022, 2023]
+    assert relatorio["dobras"][1]["anos_treino"] == [2021, 2022]
+    assert relatorio["agregado"]["dobras_avaliadas"] == 2
+    assert set(relatorio["agregado"]["recall"]) == {"media", "desvio", "minimo"}
+    assert json.loads(caminho_relatorio.read_text())["dobras"] == relatorio["dobras"]
+
+
+def test_backtest_paralelo_igual_ao_serial(monkeypatch, caminho_relatorio, dados_sinteticos):
+    dados = dados_sinteticos([2021, 2022, 2023])
+    monkeypatch.setattr(Configuracoes, "BACKTEST_WORKERS", 1)
+    serial = BacktestTemporal().executar(dados)
+    monkeypatch.setattr(Configuracoes, "BACKTEST_WORKERS", 2)
+    paralelo = BacktestTemporal().executar(dados)
+
+    def sem_tempo(dobras):
+        return [{chave: valor for chave, valor in dobra.items() if chave != "tempo_s"} for dobra in dobras]
+
+    assert paralelo["workers"] == 2
+    assert sem_tempo(paralelo["dobras"]) == sem_tempo(serial["dobras"])
+
+
+def test_backtest_exige_dois_anos(caminho_relatorio, dados_sinteticos):
+    with pytest.raises(ValueError):
+        BacktestTemporal().executar(dados_sinteticos([2023]))
+
+
+def test_backtest_ignora_dobra_com_classe_unica(monkeypatch, caminho_relatorio, dados_sinteticos):
+    monkeypatch.setattr(Configuracoes, "BACKTEST_WORKERS", 1)
+    dados = dados_sinteticos([2021, 2022, 2023])
+    dados.loc[dados["ANO_REFERENCIA"] == 2021, "DEFASAGEM"] = 1
+
+    relatorio = BacktestTemporal().executar(dados)
+
+    assert relatorio["dobras"][0]["status"] == "ignorada"
+    assert relatorio["dobras"][1]["status"] == "ok"
+    assert relatorio["agregado"]["dobras_ignoradas"] == 1
+
+
+def test_processar_dobra_imputa_so_com_anos_de_treino():
+    matriz = pd.DataFrame({
+        "ANO_INGRESSO": [2018, 2020, None, 2000, 2000],
+        Configuracoes.TARGET_COL: [0, 1, 0, 1, 0],
+        "ANO_REFERENCIA": [2021, 2021, 2022, 2023, 2023],
+    })
+    dobra = processar_dobra(matriz, 2022)
+    futuro_alterado = processar_dobra(matriz.assign(ANO_INGRESSO=[2018, 2020, None, 2022, 2022]), 2022)
+
+    assert list(dobra["ANO_REFERENCIA"]) == [2021, 2021, 2022]
+    assert dobra["TEMPO_NA_ONG"].iloc[2] == 2022 - 2019
+    assert dobra["TEMPO_NA_ONG"].equals(futuro_alterado["TEMPO_NA_ONG"])
@@ -0,0 +1,60 @@
+"""Testes dos intervalos de confiança bootstrap."""
+
+import numpy as np
+import pytest
+from sklearn.metrics import f1_score, precision_score, recall_score
+
+from src.infrastructure.model.bootstrap import IntervalosBootstrap
+
+
+def _predicoes(tamanho=400, semente=0):
+    rng = np.random.default_rng(semente)
+    alvo = rng.integers(0, 2, tamanho)
+    predicoes = np.where(rng.random(tamanho) < 0.8, alvo, 1 - alvo)
+    return alvo, predicoes
+
+
+def test_contagens_e_metricas_iguais_ao_sklearn():
+    alvo, predicoes = _predicoes()
+    contagens = IntervalosBootstrap.contar(alvo, predicoes)
+    metricas = IntervalosBootstrap.metricas(contagens)
+
+    assert contagens.sum() == len(alvo)
+    assert metricas["recall"] == pytest.approx(recall_score(alvo, predicoes))
+    assert metricas["precision"] == pytest.approx(precision_score(alvo, predicoes))
+    assert metricas["f1_score"] == pytest.approx(f1_score(alvo, predicoes))
+
+
+def test_metricas_sem_positivos_retornam_zero():
+    metricas = IntervalosBootstrap.metricas(np.array([0, 0, 0, 10]))
+    assert {nome: float(valor) for nome, valor in metricas.items()} == {
+        "recall": 0.0,
+        "precision": 0.0,
+        "f1_score": 0.0,
+    }
+
+
+def test_intervalo_equivale_a_reamostrar_linhas():
+    alvo, predicoes = _predicoes()
+    intervalos = IntervalosBootstrap.calcular(IntervalosBootstrap.contar(alvo, predicoes), reamostragens=4000)
+
+    rng = np.random.default_rng(1)
+    indices = rng.integers(0, len(alvo), (4000, len(alvo)))
+    alvos, preditos = alvo[indices], predicoes[indices]
+    recalls = ((alvos == 1) & (preditos == 1)).sum(axis=1) / (alvos == 1).sum(axis=1)
+    esperado = np.quantile(recalls, [0.025, 0.975])
+
+    assert intervalos["recall"]["lower"][0] == pytest.approx(esperado[0], abs=0.01)
+    assert intervalos["recall"]["upper"][0] == pytest.approx(esperado[1], abs=0.01)
+
+
+def test_calcula_varios_grupos_de_uma_vez():
+    contagens = np.array([[40, 10, 5, 45], [2, 1, 1, 2], [0, 0, 0, 0]])
+    intervalos = IntervalosBootstrap.calcular(contagens, reamostragens=500)
+
+    assert intervalos["f1_score"]["lower"].shape == (3,)
+    assert np.all(intervalos["f1_score"]["lower"] <= intervalos["f1_score"]["upper"])
+    assert IntervalosBootstrap.resumir(intervalos, 2)["recall"] == {"lower": 0.0, "upper": 0.0}
+    assert IntervalosBootstrap.resumir(intervalos, 0) == IntervalosBootstrap.resumir(
+        IntervalosBootstrap.calcular(contagens, reamostragens=500), 0
+    )
@@ -0,0 +1,137 @@
+"""Testes da busca de hiperparâmetros."""
+
+import json
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.config.settings import Configuracoes
+from src.infrastructure.model import hyperparameter_search
+from src.infrastructure.model.hyperparameter_search import BuscaHiperparametros
+from src.infrastructure.model.inference_benchmark import MedidorInferencia
+from src.infrastructure.model.ml_pipeline import PipelineML
+
+GRADE_PEQUENA = {
+    "random_forest": {"n_estimators": (5, 10), "max_depth": (3,)},
+    "logistic_regression": {"C": (1.0,)},
+}
+
+
+@pytest.fixture(autouse=True)
+def configurar_busca(monkeypatch):
+    monkeypatch.setattr(BuscaHiperparametros, "GRADE", GRADE_PEQUENA)
+    monkeypatch.setattr(Configuracoes, "HYPERPARAM_SEARCH_BUDGET_S", 600.0)
+    monkeypatch.setattr(Configuracoes, "HYPERPARAM_SEARCH_WORKERS", 1)
+    monkeypatch.setattr(Configuracoes, "LATENCY_BENCHMARK_REPEATS", 2)
+
+
+def test_gerar_candidatos_expande_grade():
+    candidatos = BuscaHiperparametros.gerar_candidatos()
+    assert len(candidatos) == 3
+    assert {"modelo": "logistic_regression", "parametros": {"C": 1.0}} in candidatos
+
+
+def test_fracoes_terminam_no_treino_completo():
+    assert BuscaHiperparametros._fracoes(3) == pytest.approx([1 / 9, 1 / 3, 1.0])
+
+
+def test_busca_reduz_candidatos_e_registra_latencia(dados_sinteticos):
+    dados = dados_sinteticos([2021, 2022, 2023, 2024], linhas_por_ano=60)
+    relatorio = BuscaHiperparametros().executar(dados)
+
+    assert relatorio["anos_validacao"] == [2022, 2023]
+    assert [len(rodada["candidatos"]) for rodada in relatorio["rodadas"]] == [3, 1, 1]
+    assert relatorio["interrompida_por_orcamento"] is False
+    assert relatorio["melhor"] == relatorio["rodadas"][-1]["candidatos"][0]["configuracao"]
+    candidato = relatorio["rodadas"][0]["candidatos"][0]
+    assert set(candidato["latencia"]) == {"unitaria_ms", "lote_256_ms"}
+    with open(Configuracoes.HYPERPARAM_SEARCH_PATH) as arquivo:
+        assert json.load(arquivo)["melhor"] == relatorio["melhor"]
+
+
+def test_busca_paralela_igual_a_serial(monkeypatch, dados_sinteticos):
+    dados = dados_sinteticos([2021, 2022, 2023], linhas_por_ano=60)
+    serial = BuscaHiperparametros().executar(dados)
+    monkeypatch.setattr(Configuracoes, "HYPERPARAM_SEARCH_WORKERS", 2)
+    paralela = BuscaHiperparametros().executar(dados)
+
+    def metricas(relatorio):
+        return [
+            [(c["configuracao"], c.get("f1_score"), c.get("recall")) for c in rodada["candidatos"]]
+            for rodada in relatorio["rodadas"]
+        ]
+
+    assert metricas(paralela) == metricas(serial)
+    assert paralela["melhor"] == serial["melhor"]
+
+
+def test_busca_sem_orcamento_usa_configuracao_padrao(monkeypatch, dados_sinteticos):
+    monkeypatch.setattr(Configuracoes, "HYPERPARAM_SEARCH_BUDGET_S", 0.0)
+    dados = dados_sinteticos([2021, 2022, 2023], linhas_por_ano=60)
+    relatorio = BuscaHiperparametros().executar(dados)
+
+    assert relatorio["interrompida_por_orcamento"] is True
+    assert relatorio["melhor"] == PipelineML.CONFIGURACAO_PADRAO
+
+
+def test_busca_exige_tres_anos(dados_sinteticos):
+    with pytest.raises(ValueError):
+        BuscaHiperparametros().executar(dados_sinteticos([2022, 2023]))
+
+
+def test_criar_classificador_rejeita_modelo_desconhecido():
+    with pytest.raises(ValueError):
+        PipelineML._criar_classificador({"modelo": "svm", "parametros": {}})
+
+
+def test_medir_latencia_em_lote():
+    class ModeloFalso:
+        def __init__(self):
+            self.tamanhos = []
+
+        def predict_proba(self, dados):
+            self.tamanhos.append(len(dados))
+            return np.zeros((len(dados), 2))
+
+    modelo = ModeloFalso()
+    latencia = MedidorInferencia.medir_latencia(modelo, pd.DataFrame({"x": range(10)}), repeticoes=2)
+
+    assert set(latencia) == {"unitaria_ms", "lote_256_ms"}
+    assert set(modelo.tamanhos) == {1, 256}
+
+
+def test_escolher_melhor_ignora_rodada_cortada_pelo_orcamento():
+    lento = {"modelo": "random_forest", "parametros": {"n_estimators": 10, "max_depth": 3}}
+    rapido = {"modelo": "logistic_regression", "parametros": {"C": 1.0}}
+    rodadas = [
+        {"rodada": 0, "completa": True, "candidatos": [
+            {"configuracao": lento, "recall": 0.8, "f1_score": 0.7},
+            {"configuracao": rapido, "recall": 0.8, "f1_score": 0.5},
+        ]},
+        {"rodada": 1, "completa": False, "candidatos": [
+            {"configuracao": rapido, "recall": 0.9, "f1_score": 0.9},
+        ]},
+    ]
+
+    assert BuscaHiperparametros._escolher_melhor(rodadas) == lento
+    assert BuscaHiperparametros._escolher_melhor(rodadas[1:]) == PipelineML.CONFIGURACAO_PADRAO
+
+
+def test_busca_paralela_nao_espera_tarefas_em_execucao(monkeypatch, dados_sinteticos):
+    def avaliar_devagar(matriz, features, configuracao, fracao, anos):
+        time.sleep(3)
+        return {"configuracao": configuracao}
+
+    monkeypatch.setattr(hyperparameter_search, "_avaliar_candidato", avaliar_devagar)
+    monkeypatch.setattr(Configuracoes, "HYPERPARAM_SEARCH_WORKERS", 2)
+    monkeypatch.setattr(Configuracoes, "HYPERPARAM_SEARCH_BUDGET_S", 1.0)
+    dados = dados_sinteticos([2021, 2022, 2023])
+
+    inicio = time.perf_counter()
+    relatorio = BuscaHiperparametros().executar(dados)
+
+    assert time.perf_counter() - inicio < 2.5
+    assert relatorio["interrompida_por_orcamento"] is True
+    assert relatorio["melhor"] == PipelineML.CONFIGURACAO_PADRAO
@@ -0,0 +1,98 @@
+"""Testes do retreino incremental."""
+
+import json
+
+import numpy as np
+import pytest
+from joblib import load
+
+from src.config.settings import Configuracoes
+from src.infrastructure.model.incremental_training import TreinoIncremental
+from src.infrastructure.model.ml_pipeline import PipelineML
+
+
+@pytest.fixture()
+def artefatos(tmp_path, monkeypatch):
+    monkeypatch.setattr(Configuracoes, "INCREMENTAL_NEW_TREES", 10)
+    monkeypatch.setattr(Configuracoes, "INCREMENTAL_MAX_TREES", 0)
+    monkeypatch.setattr(PipelineML, "_deve_promover_modelo", staticmethod(lambda metricas: True))
+    monkeypatch.setattr(
+        PipelineML,
+        "CONFIGURACAO_PADRAO",
+        {"modelo": "random_forest", "parametros": {"n_estimators": 20, "max_depth": 4}},
+    )
+    return tmp_path
+
+
+def _metricas_promovidas():
+    with open(Configuracoes.METRICS_FILE) as arquivo:
+        return json.load(arquivo)
+
+
+def test_incremental_acrescenta_arvores_dos_anos_novos(artefatos, dados_sinteticos):
+    PipelineML().treinar(dados_sinteticos([2021, 2022, 2023]))
+    assert _metricas_promovidas()["training_mode"] == "full"
+    assert _metricas_promovidas()["trained_years"] == [2021, 2022]
+    arvores_base = load(Configuracoes.MODEL_PATH).named_steps["classifier"].estimators_
+
+    PipelineML().treinar(dados_sinteticos([2021, 2022, 2023, 2024]), incremental=True)
+
+    metricas = _metricas_promovidas()
+    assert metricas["training_mode"] == "incremental"
+    assert metricas["trained_years"] == [2021, 2022, 2023]
+    assert metricas["incremental"]["new_years"] == [2023]
+    assert metricas["incremental"]["new_rows"] == 40
+    assert metricas["incremental"]["trees_added"] == 10
+    assert metricas["model_config"]["parametros"]["n_estimators"] == 30
+    assert set(metricas["inference"]["baseline"]) == {"unitaria_ms", "lote_256_ms", "tamanho_mb"}
+    assert metricas["inference"]["tamanho_mb"] > metricas["inference"]["baseline"]["tamanho_mb"]
+
+    classificador = load(Configuracoes.MODEL_PATH).named_steps["classifier"]
+    assert len(classificador.estimators_) == 30
+    assert classificador.warm_start is False
+    assert all(
+        np.array_equal(nova.tree_.threshold, base.tree_.threshold)
+        for nova, base in zip(classificador.estimators_[:20], arvores_base)
+    )
+
+
+def test_incremental_aposenta_arvores_mais_antigas(artefatos, monkeypatch, dados_sinteticos):
+    PipelineML().treinar(dados_sinteticos([2021, 2022, 2023]))
+    arvores_base = load(Configuracoes.MODEL_PATH).named_steps["classifier"].estimators_
+    monkeypatch.setattr(Configuracoes, "INCREMENTAL_MAX_TREES", 20)
+
+    PipelineML().treinar(dados_sinteticos([2021, 2022, 2023, 2024]), incremental=True)
+
+    metricas = _metricas_promovidas()
+    assert metricas["incremental"]["trees_retired"] == 10
+    assert metricas["incremental"]["n_estimators"] == 20
+    classificador = load(Configuracoes.MODEL_PATH).named_steps["classifier"]
+    assert all(
+        np.array_equal(nova.tree_.threshold, base.tree_.threshold)
+        for nova, base in zip(classificador.estimators_[:10], arvores_base[10:])
+    )
+
+
+def test_incremental_sem_modelo_promovido_treina_do_zero(artefatos, dados_sinteticos):
+    PipelineML().treinar(dados_sinteticos([2021, 2022, 2023]), incremental=True)
+
+    metricas = _metricas_promovidas()
+    assert metricas["training_mode"] == "full"
+    assert "incremental" not in metricas
+
+
+def test_incremental_exige_anos_novos_e_trained_years(artefatos, dados_sinteticos):
+    dados = dados_sinteticos([2021, 2022, 2023])
+    PipelineML().treinar(dados)
+    _, dados_processados, _, mascara_treino, _ = PipelineML().obter_matrizes(dados)
+    matriz = dados_processados.loc[mascara_treino, PipelineML.selecionar_features(dados_processados)]
+    alvo = dados_processados.loc[mascara_treino, Configuracoes.TARGET_COL]
+    anos = dados_processados.loc[mascara_treino, "ANO_REFERENCIA"]
+
+    assert TreinoIncremental.ajustar(matriz, alvo, anos) is None
+
+    metricas = _metricas_promovidas()
+    metricas.pop("trained_years")
+    with open(Configuracoes.METRICS_FILE, "w") as arquivo:
+        json.dump(metricas, arquivo)
+    assert TreinoIncremental._carregar_base(list(matriz.columns)) is None
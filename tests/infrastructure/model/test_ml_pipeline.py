@@ -1,5 +1,7 @@
 """Testes do pipeline de treinamento."""
 
+import json
+import os
 from unittest.mock import Mock, mock_open
 
 import numpy as np
@@ -181,3 +183,197 @@ def test_treinar_com_varios_anos_promove(monkeypatch, dataframe_base):
     pipeline.treinar(dados)
 
     promovido.assert_called_once()
+
+
+def test_treinar_reutiliza_matrizes_em_cache(monkeypatch, dataframe_base):
+    dados = pd.concat([
+        dataframe_base,
+        dataframe_base.assign(RA="2", ANO_REFERENCIA=2024),
+    ], ignore_index=True)
+
+    monkeypatch.setattr("src.infrastructure.model.ml_pipeline.Pipeline", PipelineFalso)
+    monkeypatch.setattr("src.infrastructure.model.ml_pipeline.ColumnTransformer", lambda *args, **kwargs: object())
+    monkeypatch.setattr("src.infrastructure.model.ml_pipeline.RandomForestClassifier", lambda *args, **kwargs: object())
+    monkeypatch.setattr("src.infrastructure.model.ml_pipeline.SimpleImputer", lambda *args, **kwargs: object())
+    monkeypatch.setattr("src.infrastructure.model.ml_pipeline.StandardScaler", lambda *args, **kwargs: object())
+    monkeypatch.setattr("src.infrastructure.model.ml_pipeline.OneHotEncoder", lambda *args, **kwargs: object())
+    monkeypatch.setattr("src.infrastructure.model.ml_pipeline.PipelineML._deve_promover_modelo", lambda *args, **kwargs: False)
+    monkeypatch.setattr("src.infrastructure.model.ml_pipeline.PipelineML._salvar_estatisticas", Mock())
+
+    pipeline = PipelineML()
+    pipeline.treinar(dados.copy())
+
+    preparar = Mock(side_effect=AssertionError("matrizes deveriam vir do cache"))
+    monkeypatch.setattr(pipeline, "_preparar_matrizes", preparar)
+    pipeline.treinar(dados.copy())
+
+    preparar.assert_not_called()
+
+
+def _criar_features_lag_legado(dados):
+    """Implementação anterior: um groupby/shift por métrica."""
+    dados = dados.sort_values(by=["RA", "ANO_REFERENCIA"])
+    for coluna in Configuracoes.METRICAS_HISTORICAS:
+        if coluna in dados.columns:
+            dados[f"{coluna}_ANTERIOR"] = dados.groupby("RA")[coluna].shift(1).fillna(0)
+    if "INDE_ANTERIOR" in dados.columns:
+        dados["ALUNO_NOVO"] = (dados["INDE_ANTERIOR"] == 0).astype(int)
+    else:
+        dados["ALUNO_NOVO"] = 1
+    return dados
+
+
+def test_criar_features_lag_igual_a_implementacao_por_metrica():
+    rng = np.random.default_rng(0)
+    linhas = 500
+    dados = pd.DataFrame({
+        "RA": rng.choice(["1", "2", "3", "4", None], linhas),
+        "ANO_REFERENCIA": rng.integers(2020, 2025, linhas),
+        "INDE": rng.uniform(0, 10, linhas),
+        "IAA": rng.integers(0, 10, linhas),
+        "IEG": np.where(rng.random(linhas) < 0.2, np.nan, rng.uniform(0, 10, linhas)),
+    })
+    dados.index = rng.integers(0, 50, linhas)
+
+    esperado = _criar_features_lag_legado(dados.copy())
+    resultado = PipelineML.criar_features_lag(dados.copy())
+
+    pd.testing.assert_frame_equal(resultado, esperado)
+
+
+def test_criar_features_lag_multiplos_passos():
+    dados = pd.DataFrame({
+        "RA": ["1", "1", "1", "2"],
+        "ANO_REFERENCIA": [2022, 2023, 2024, 2024],
+        "INDE": [5.0, 6.0, 7.0, 8.0],
+    })
+    resultado = PipelineML.criar_features_lag(dados, passos=2)
+    assert resultado["INDE_ANTERIOR"].tolist() == [0.0, 5.0, 6.0, 0.0]
+    assert resultado["INDE_ANTERIOR_2"].tolist() == [0.0, 0.0, 5.0, 0.0]
+
+
+def test_criar_target_defasagem_ignora_texto():
+    dados = pd.DataFrame({"DEFASAGEM": [-1, "-2", None, -0.5, 3]}, dtype=object)
+    resultado = PipelineML.criar_target(dados)
+    assert resultado[Configuracoes.TARGET_COL].tolist() == [1, 0, 0, 1, 0]
+
+
+def test_criar_target_defasagem_float_com_nulos():
+    dados = pd.DataFrame({"DEFASAGEM": [-1.0, np.nan, 0.0]})
+    resultado = PipelineML.criar_target(dados)
+    assert resultado[Configuracoes.TARGET_COL].tolist() == [1, 0, 0]
+
+
+def test_criar_target_pedra_com_nulos():
+    dados = pd.DataFrame({"PEDRA": ["quartzo", np.nan, "Ágata"]})
+    resultado = PipelineML.criar_target(dados)
+    assert resultado[Configuracoes.TARGET_COL].tolist() == [1, 0, 0]
+
+
+def test_deve_promover_modelo_com_limite_inferior(monkeypatch):
+    monkeypatch.setattr("src.infrastructure.model.ml_pipeline.os.path.exists", lambda path: False)
+    metricas = {
+        "recall": 0.7,
+        "f1_score": 0.6,
+        "confidence_intervals": {"recall": {"lower": 0.5, "upper": 0.85}},
+    }
+    assert PipelineML._deve_promover_modelo(metricas) is True
+
+    monkeypatch.setattr(Configuracoes, "QUALITY_GATE_LOWER_BOUND", True)
+    assert PipelineML._deve_promover_modelo(metricas) is False
+
+
+def test_calcular_metricas_inclui_intervalos_por_grupo():
+    alvo = pd.Series([1, 0, 1, 1, 0, 0])
+    predicoes = np.array([1, 0, 0, 1, 1, 0])
+    dados_teste = pd.DataFrame({"GENERO": ["M", "M", "F", "F", "F", "M"]})
+
+    metricas = PipelineML._calcular_metricas(alvo, predicoes, 0.5, dados_teste, dados_teste, dados_teste)
+
+    assert set(metricas["confidence_intervals"]) == {"level", "resamples", "recall", "precision", "f1_score"}
+    intervalo = metricas["confidence_intervals"]["recall"]
+    assert intervalo["lower"] <= metricas["recall"] <= intervalo["upper"]
+    assert set(metricas["group_metrics"]["GENERO"]["F"]["confidence_intervals"]) == {"recall", "precision", "f1_score"}
+
+
+def test_treinar_registra_perfil_ate_a_promocao(monkeypatch, dataframe_base):
+    from src.util.profiler import perfil_treino
+
+    dados = pd.concat([
+        dataframe_base,
+        dataframe_base.assign(RA="2", ANO_REFERENCIA=2024),
+    ], ignore_index=True)
+
+    monkeypatch.setattr("src.infrastructure.model.ml_pipeline.Pipeline", PipelineFalso)
+    monkeypatch.setattr("src.infrastructure.model.ml_pipeline.ColumnTransformer", lambda *args, **kwargs: object())
+    monkeypatch.setattr("src.infrastructure.model.ml_pipeline.RandomForestClassifier", lambda *args, **kwargs: object())
+    monkeypatch.setattr("src.infrastructure.model.ml_pipeline.SimpleImputer", lambda *args, **kwargs: object())
+    monkeypatch.setattr("src.infrastructure.model.ml_pipeline.StandardScaler", lambda *args, **kwargs: object())
+    monkeypatch.setattr("src.infrastructure.model.ml_pipeline.OneHotEncoder", lambda *args, **kwargs: object())
+    monkeypatch.setattr("src.infrastructure.model.ml_pipeline.PipelineML._deve_promover_modelo", lambda *args, **kwargs: True)
+
+    def gravar_metricas(modelo, metricas, *args):
+        os.makedirs(os.path.dirname(Configuracoes.METRICS_FILE), exist_ok=True)
+        with open(Configuracoes.METRICS_FILE, "w") as arquivo:
+            json.dump(metricas, arquivo, default=str)
+
+    monkeypatch.setattr(
+        "src.infrastructure.model.ml_pipeline.PipelineML._promover_modelo", Mock(side_effect=gravar_metricas)
+    )
+
+    perfil_treino.iniciar(rastrear_memoria=False)
+    try:
+        PipelineML().treinar(dados)
+    finally:
+        relatorio = perfil_treino.finalizar()
+
+    etapas = [etapa["stage"] for etapa in relatorio["stages"]]
+    assert etapas[:2] == ["treino.matrizes", "treino.alvo"]
+    assert {"treino.ajuste", "treino.gate", "treino.promocao"} <= set(etapas)
+    with open(Configuracoes.METRICS_FILE) as arquivo:
+        metricas = json.load(arquivo)
+    assert metricas["profile"] == relatorio
+    assert "recall" in metricas
+    with open(Configuracoes.PROFILE_PATH) as arquivo:
+        assert json.load(arquivo)["stages"] == relatorio["stages"]
+
+
+def test_deve_promover_modelo_respeita_orcamento_de_inferencia(monkeypatch):
+    monkeypatch.setattr("src.infrastructure.model.ml_pipeline.os.path.exists", lambda path: False)
+    inferencia = {"unitaria_ms": 4.0, "lote_256_ms": 30.0, "tamanho_mb": 3.0}
+    metricas = {"recall": 0.7, "f1_score": 0.7, "inference": dict(inferencia)}
+    assert PipelineML._deve_promover_modelo(metricas) is True
+
+    monkeypatch.setattr(Configuracoes, "QUALITY_GATE_MAX_MODEL_MB", 2.0)
+    assert PipelineML._deve_promover_modelo(metricas) is False
+    monkeypatch.setattr(Configuracoes, "QUALITY_GATE_MAX_MODEL_MB", 0.0)
+
+    metricas["inference"]["baseline"] = {"unitaria_ms": 2.0, "lote_256_ms": 29.0, "tamanho_mb": 2.9}
+    assert PipelineML._deve_promover_modelo(metricas) is True
+    monkeypatch.setattr(Configuracoes, "QUALITY_GATE_MAX_LATENCY_RATIO", 1.5)
+    assert PipelineML._deve_promover_modelo(metricas) is False
+    monkeypatch.setattr(Configuracoes, "QUALITY_GATE_MAX_LATENCY_RATIO", 2.5)
+    assert PipelineML._deve_promover_modelo(metricas) is True
+
+
+def test_deve_promover_modelo_usa_custo_das_metricas_promovidas(monkeypatch):
+    monkeypatch.setattr("src.infrastructure.model.ml_pipeline.os.path.exists", lambda path: True)
+    arquivo_mock = mock_open(read_data='{"f1_score": 0.7, "inference": {"tamanho_mb": 1.0}}')
+    monkeypatch.setattr("builtins.open", arquivo_mock)
+    monkeypatch.setattr(Configuracoes, "QUALITY_GATE_MAX_SIZE_RATIO", 1.5)
+
+    assert PipelineML._deve_promover_modelo({"recall": 0.7, "f1_score": 0.7, "inference": {"tamanho_mb": 1.4}}) is True
+    assert PipelineML._deve_promover_modelo({"recall": 0.7, "f1_score": 0.7, "inference": {"tamanho_mb": 2.0}}) is False
+
+
+def test_custo_inferencia_mede_latencia_e_tamanho(monkeypatch):
+    from sklearn.linear_model import LogisticRegression
+
+    monkeypatch.setattr(Configuracoes, "LATENCY_BENCHMARK_REPEATS", 2)
+    matriz = pd.DataFrame({"x": np.arange(20.0)})
+    modelo = LogisticRegression().fit(matriz, np.arange(20) % 2)
+
+    custo = PipelineML._custo_inferencia(modelo, matriz)
+
+    assert set(custo) == {"unitaria_ms", "lote_256_ms", "tamanho_mb"}
+    assert custo["tamanho_mb"] > 0
@@ -0,0 +1,61 @@
+"""Testes do cache de matrizes de treino."""
+
+import pandas as pd
+
+from src.config.settings import Configuracoes
+from src.infrastructure.model.training_cache import CacheMatrizesTreino
+
+
+def funcao_codigo():
+    """Função usada como componente de código da chave."""
+    return 1
+
+
+def test_chave_muda_com_dados(tmp_path, dataframe_base):
+    cache = CacheMatrizesTreino(diretorio=str(tmp_path), habilitado=True)
+
+    chave = cache.calcular_chave(dataframe_base, [funcao_codigo])
+    mesma_chave = cache.calcular_chave(dataframe_base.copy(), [funcao_codigo])
+    outra_chave = cache.calcular_chave(dataframe_base.assign(IDADE=11), [funcao_codigo])
+
+    assert chave == mesma_chave
+    assert chave != outra_chave
+
+
+def test_chave_muda_com_metricas_historicas(tmp_path, monkeypatch, dataframe_base):
+    cache = CacheMatrizesTreino(diretorio=str(tmp_path), habilitado=True)
+    chave = cache.calcular_chave(dataframe_base, [funcao_codigo])
+
+    monkeypatch.setattr(Configuracoes, "METRICAS_HISTORICAS", ["INDE", "IAA"])
+
+    assert cache.calcular_chave(dataframe_base, [funcao_codigo]) != chave
+
+
+def test_cache_desabilitado_nao_gera_chave(tmp_path, dataframe_base):
+    cache = CacheMatrizesTreino(diretorio=str(tmp_path), habilitado=False)
+
+    assert cache.calcular_chave(dataframe_base, [funcao_codigo]) is None
+    assert cache.carregar(None) is None
+
+
+def test_salvar_e_carregar_entrada(tmp_path, dataframe_base):
+    cache = CacheMatrizesTreino(diretorio=str(tmp_path), habilitado=True)
+    chave = cache.calcular_chave(dataframe_base, [funcao_codigo])
+    processados = pd.DataFrame({"IDADE": [10], "TURMA": ["A"]})
+
+    assert cache.carregar(chave) is None
+    cache.salvar(chave, dataframe_base, processados, {"mediana_ano_ingresso": 2021.0})
+    dados, dados_processados, estatisticas = cache.carregar(chave)
+
+    pd.testing.assert_frame_equal(dados, dataframe_base)
+    pd.testing.assert_frame_equal(dados_processados, processados)
+    assert estatisticas == {"mediana_ano_ingresso": 2021.0}
+
+
+def test_entrada_corrompida_e_descartada(tmp_path, dataframe_base):
+    cache = CacheMatrizesTreino(diretorio=str(tmp_path), habilitado=True)
+    chave = cache.calcular_chave(dataframe_base, [funcao_codigo])
+    (tmp_path / chave).mkdir()
+
+    assert cache.carregar(chave) is None
+    assert not (tmp_path / chave).exists()
@@ -17,10 +17,45 @@ def test_checar_saude():
 
 def test_evento_inicializacao_carrega_modelo(monkeypatch):
     gerenciador = Mock()
+    repositorio = Mock()
+    logger_predicao = Mock()
     monkeypatch.setattr(main, "GerenciadorModelo", lambda: gerenciador)
+    monkeypatch.setattr(main, "RepositorioHistorico", repositorio)
+    monkeypatch.setattr(main, "LoggerPredicao", lambda: logger_predicao)
 
     cliente = TestClient(main.app)
     with cliente:
         pass
 
     gerenciador.carregar_modelo.assert_called_once()
+    repositorio.assert_called_once_with()
+    logger_predicao.preparar.assert_called_once()
+    repositorio.parar_monitoramento.assert_called_once()
+
+
+def test_checar_prontidao_reporta_componentes(monkeypatch):
+    gerenciador = Mock()
+    gerenciador.modelo_carregado.return_value = True
+    repositorio = Mock()
+    repositorio.inicializado.return_value = False
+    logger_predicao = Mock()
+    logger_predicao.esta_pronto.return_value = True
+    monkeypatch.setattr(main, "GerenciadorModelo", lambda: gerenciador)
+    monkeypatch.setattr(main, "RepositorioHistorico", repositorio)
+    monkeypatch.setattr(main, "LoggerPredicao", lambda: logger_predicao)
+    cliente = TestClient(main.app)
+
+    resposta = cliente.get("/ready")
+
+    assert resposta.status_code == 503
+    assert resposta.json()["detail"]["components"] == {
+        "model": True,
+        "feature_store": False,
+        "prediction_logger": True,
+    }
+
+    repositorio.inicializado.return_value = True
+    resposta = cliente.get("/ready")
+
+    assert resposta.status_code == 200
+    assert resposta.json()["status"] == "ready"
@@ -17,7 +17,7 @@ def test_treinamento_sucesso(monkeypatch):
     runpy.run_module("train", run_name="__main__")
 
     carregador_mock.carregar_dados.assert_called_once()
-    treinador_mock.treinar.assert_called_once_with(carregador_mock.carregar_dados.return_value)
+    treinador_mock.treinar.assert_called_once_with(carregador_mock.carregar_dados.return_value, incremental=False)
 
 
 def test_treinamento_falha(monkeypatch):
@@ -35,3 +35,31 @@ def test_treinamento_falha(monkeypatch):
     runpy.run_module("train", run_name="__main__")
 
     exit_mock.assert_called_once_with(1)
+
+
+def test_treinamento_sem_cache(monkeypatch):
+    from src.config.settings import Configuracoes
+
+    monkeypatch.setattr(Configuracoes, "DATA_CACHE_ENABLED", True)
+    monkeypatch.setattr(Configuracoes, "TRAINING_CACHE_ENABLED", True)
+    monkeypatch.setattr("sys.argv", ["train.py", "--no-cache"])
+    monkeypatch.setattr("src.infrastructure.data.data_loader.CarregadorDados", lambda: Mock())
+    monkeypatch.setattr("src.infrastructure.model.ml_pipeline.treinador", Mock())
+
+    runpy.run_module("train", run_name="__main__")
+
+    assert Configuracoes.DATA_CACHE_ENABLED is False
+    assert Configuracoes.TRAINING_CACHE_ENABLED is False
+
+
+def test_treinamento_incremental(monkeypatch):
+    carregador_mock = Mock()
+    treinador_mock = Mock()
+
+    monkeypatch.setattr("sys.argv", ["train.py", "--incremental"])
+    monkeypatch.setattr("src.infrastructure.data.data_loader.CarregadorDados", lambda: carregador_mock)
+    monkeypatch.setattr("src.infrastructure.model.ml_pipeline.treinador", treinador_mock)
+
+    runpy.run_module("train", run_name="__main__")
+
+    treinador_mock.treinar.assert_called_once_with(carregador_mock.carregar_dados.return_value, incremental=True)
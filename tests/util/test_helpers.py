@@ -0,0 +1,26 @@
+"""Testes das funções auxiliares compartilhadas."""
+
+import json
+import os
+
+from src.util.helpers import resolver_workers, salvar_relatorio
+
+
+def test_resolver_workers_usa_todas_as_cpus_quando_nao_positivo(monkeypatch):
+    monkeypatch.setattr(os, "cpu_count", lambda: 4)
+    assert resolver_workers(0) == 4
+    assert resolver_workers(-1) == 4
+    assert resolver_workers(2) == 2
+
+
+def test_salvar_relatorio_cria_diretorio(tmp_path):
+    caminho = tmp_path / "monitoring" / "relatorio.json"
+    salvar_relatorio(str(caminho), {"valor": 1}, "teste")
+    assert json.loads(caminho.read_text()) == {"valor": 1}
+
+
+def test_salvar_relatorio_falha_sem_interromper(tmp_path):
+    bloqueio = tmp_path / "arquivo"
+    bloqueio.write_text("")
+    salvar_relatorio(str(bloqueio / "relatorio.json"), {"valor": 1}, "teste")
+    assert bloqueio.read_text() == ""
@@ -0,0 +1,77 @@
+"""Testes do perfil de execução."""
+
+import json
+import os
+import pstats
+
+from src.config.settings import Configuracoes
+from src.util.profiler import PerfilExecucao
+
+
+def test_etapa_inativa_nao_registra():
+    perfil = PerfilExecucao()
+    with perfil.etapa("carga"):
+        pass
+    assert perfil.relatorio()["stages"] == []
+
+
+def test_etapas_aninhadas_registram_tempo_cpu_e_memoria():
+    perfil = PerfilExecucao()
+    perfil.iniciar(rastrear_memoria=True)
+    with perfil.etapa("treino"):
+        with perfil.etapa("treino.ajuste"):
+            bloco = bytearray(8 * 1024 * 1024)
+            del bloco
+        with perfil.etapa("treino.ajuste"):
+            pass
+    relatorio = perfil.finalizar()
+
+    etapas = {etapa["stage"]: etapa for etapa in relatorio["stages"]}
+    assert list(etapas) == ["treino", "treino.ajuste"]
+    assert etapas["treino.ajuste"]["calls"] == 2
+    assert etapas["treino.ajuste"]["peak_traced_mb"] >= 8
+    assert etapas["treino"]["peak_traced_mb"] >= etapas["treino.ajuste"]["peak_traced_mb"]
+    assert etapas["treino"]["wall_s"] >= etapas["treino.ajuste"]["wall_s"]
+    assert {"wall_s", "cpu_s"} <= set(etapas["treino"])
+    with open(Configuracoes.PROFILE_PATH) as arquivo:
+        assert json.load(arquivo)["stages"] == relatorio["stages"]
+
+
+def test_etapa_sem_rastreamento_omite_memoria():
+    perfil = PerfilExecucao()
+    perfil.iniciar(rastrear_memoria=False)
+    with perfil.etapa("carga"):
+        pass
+    etapa = perfil.finalizar()["stages"][0]
+    assert "peak_traced_mb" not in etapa
+
+
+def test_cprofile_da_etapa_configurada(tmp_path, monkeypatch):
+    monkeypatch.setattr(Configuracoes, "MONITORING_DIR", str(tmp_path))
+    monkeypatch.setattr(Configuracoes, "PROFILE_STAGE", "treino.ajuste")
+    perfil = PerfilExecucao()
+    perfil.iniciar(rastrear_memoria=False)
+    with perfil.etapa("treino.ajuste"):
+        sorted(range(1000))
+    perfil.finalizar()
+
+    caminho = os.path.join(tmp_path, "profile_treino.ajuste.prof")
+    assert pstats.Stats(caminho).total_calls > 0
+
+
+def test_anexar_relatorio_grava_perfil_final_no_arquivo(tmp_path):
+    caminho = tmp_path / "metricas.json"
+    caminho.write_text(json.dumps({"recall": 0.7}))
+    perfil = PerfilExecucao()
+    perfil.anexar_relatorio(str(caminho))
+    perfil.iniciar(rastrear_memoria=False)
+    with perfil.etapa("treino"):
+        perfil.anexar_relatorio(str(caminho))
+    with perfil.etapa("treino.promocao"):
+        pass
+    relatorio = perfil.finalizar()
+
+    conteudo = json.loads(caminho.read_text())
+    assert conteudo["recall"] == 0.7
+    assert conteudo["profile"] == relatorio
+    assert [etapa["stage"] for etapa in conteudo["profile"]["stages"]] == ["treino", "treino.promocao"]